@@ -4,7 +4,7 @@ import pytest
 
 pytest_plugins = [
     # Plugins
-    'pytest_plugins.auto_vault',
+    'pytest_plugins.collection_pipeline',
     'pytest_plugins.disable_rp_params',
     'pytest_plugins.external_logging',
     'pytest_plugins.fixture_markers',
@@ -24,6 +24,9 @@ pytest_plugins = [
     'pytest_plugins.video_cleanup',
     'pytest_plugins.jira_comments',
     'pytest_plugins.capsule_n-minus',
+    'pytest_plugins.duration_db',
+    'pytest_plugins.fixture_profiler',
+    'pytest_plugins.entity_ledger',
     # Fixtures
     'pytest_fixtures.core.broker',
     'pytest_fixtures.core.sat_cap_factory',
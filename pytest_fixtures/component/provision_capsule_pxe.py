@@ -180,9 +180,6 @@ def capsule_provisioning_rhel_content(
     else:
         repo_names.append(f'rhel{rhel_ver}_bos')
         repo_names.append(f'rhel{rhel_ver}_aps')
-    rh_repos = []
-    tasks = []
-    rh_repo_id = ""
     content_view = sat.api.ContentView(organization=module_sca_manifest_org).create()
 
     # Custom Content for Client repo
@@ -195,46 +192,36 @@ def capsule_provisioning_rhel_content(
         content_type='yum',
         url=settings.repos.SATCLIENT_REPO[f'rhel{rhel_ver}'],
     ).create()
-    task = client_repo.sync(synchronous=False)
-    tasks.append(task)
-    content_view.repository = [client_repo]
+    client_task = client_repo.sync(synchronous=False)
 
+    rh_repos_to_enable = []
     for name in repo_names:
-        rh_kickstart_repo_id = sat.api_factory.enable_rhrepo_and_fetchid(
-            basearch=constants.DEFAULT_ARCHITECTURE,
-            org_id=module_sca_manifest_org.id,
-            product=constants.REPOS['kickstart'][name]['product'],
-            repo=constants.REPOS['kickstart'][name]['name'],
-            reposet=constants.REPOS['kickstart'][name]['reposet'],
-            releasever=constants.REPOS['kickstart'][name]['version'],
+        ks_repo = constants.REPOS['kickstart'][name]
+        rh_repos_to_enable.append(
+            {
+                'product': ks_repo['product'],
+                'reposet': ks_repo['reposet'],
+                'name': ks_repo['name'],
+                'releasever': ks_repo['version'],
+            }
         )
         # do not sync content repos for discovery based provisioning.
         if capsule_provisioning_sat.provisioning_type != 'discovery':
-            rh_repo_id = sat.api_factory.enable_rhrepo_and_fetchid(
-                basearch=constants.DEFAULT_ARCHITECTURE,
-                org_id=module_sca_manifest_org.id,
-                product=constants.REPOS[name]['product'],
-                repo=constants.REPOS[name]['name'],
-                reposet=constants.REPOS[name]['reposet'],
-                releasever=constants.REPOS[name]['releasever'],
+            rh_repos_to_enable.append(
+                {
+                    'product': constants.REPOS[name]['product'],
+                    'reposet': constants.REPOS[name]['reposet'],
+                    'name': constants.REPOS[name]['name'],
+                    'releasever': constants.REPOS[name]['releasever'],
+                }
             )
-
-        # Sync step because repo is not synced by default
-        for repo_id in [rh_kickstart_repo_id, rh_repo_id]:
-            if repo_id:
-                rh_repo = sat.api.Repository(id=repo_id).read()
-                task = rh_repo.sync(synchronous=False)
-                tasks.append(task)
-                rh_repos.append(rh_repo)
-                content_view.repository.append(rh_repo)
-                content_view.update(['repository'])
-    for task in tasks:
-        sat.wait_for_tasks(
-            search_query=(f'id = {task["id"]}'),
-            poll_timeout=2500,
-        )
-        task_status = sat.api.ForemanTask(id=task['id']).poll()
-        assert task_status['result'] == 'success'
+    # Enable the repos and sync them, repos are not synced by default
+    rh_repos = sat.api_factory.enable_rhrepos(
+        org_id=module_sca_manifest_org.id, repos=rh_repos_to_enable
+    ).wait(timeout=2500)
+    sat.api.ForemanTask(id=client_task['id']).poll(timeout=2500)
+    content_view.repository = [client_repo, *rh_repos]
+    content_view.update(['repository'])
     rhel_xy = Version(
         constants.REPOS['kickstart'][f'rhel{rhel_ver}']['version']
         if rhel_ver == 7
@@ -1,10 +1,13 @@
 # Provisioning Template Fixtures
 from box import Box
+from manifester import Manifester
 from packaging.version import Version
 import pytest
 
 from robottelo import constants
+from robottelo.config import settings
 from robottelo.constants import DEFAULT_PTABLE, DEFAULT_PXE_TEMPLATE, DEFAULT_TEMPLATE
+from robottelo.utils.decorators.func_shared import shared_fixture
 
 
 @pytest.fixture(scope='module')
@@ -55,39 +58,41 @@ def default_pxetemplate(session_target_sat):
 
 
 @pytest.fixture(scope="module")
-def module_sync_kickstart_content(
-    request, module_target_sat, module_sca_manifest_org, module_location
-):
+@shared_fixture
+def module_sync_kickstart_content(request, module_target_sat):
     """
     This fixture sets up kickstart repositories for a specific RHEL version
     that is specified in `request.param`.
+
+    The repositories are synced in an organization and location of the fixture, given
+    with its Library and default content view, shared by the xdist workers testing
+    the same Satellite and RHEL version.
     """
     repo_names = []
-    tasks = []
     rhel_ver = request.param['rhel_version']
     if int(rhel_ver) <= 7:
         repo_names.append(f'rhel{rhel_ver}')
     else:
         repo_names.append(f'rhel{rhel_ver}_bos')
-    for name in repo_names:
-        rh_kickstart_repo_id = module_target_sat.api_factory.enable_rhrepo_and_fetchid(
-            basearch=constants.DEFAULT_ARCHITECTURE,
-            org_id=module_sca_manifest_org.id,
-            product=constants.REPOS['kickstart'][name]['product'],
-            repo=constants.REPOS['kickstart'][name]['name'],
-            reposet=constants.REPOS['kickstart'][name]['reposet'],
-            releasever=constants.REPOS['kickstart'][name]['version'],
-        )
-        rh_repo = module_target_sat.api.Repository(id=rh_kickstart_repo_id).read()
-        task = rh_repo.sync(synchronous=False)
-        tasks.append(task)
-    for task in tasks:
-        module_target_sat.wait_for_tasks(
-            search_query=(f'id = {task["id"]}'),
-            poll_timeout=2500,
-        )
-        task_status = module_target_sat.api.ForemanTask(id=task['id']).poll()
-        assert task_status['result'] == 'success'
+    org = module_target_sat.api.Organization().create()
+    location = module_target_sat.api.Location(organization=[org]).create()
+    capsule = module_target_sat.nailgun_smart_proxy.read()
+    capsule.location.append(location)
+    capsule.update(['location'])
+    with Manifester(manifest_category=settings.manifest.golden_ticket) as manifest:
+        module_target_sat.upload_manifest(org.id, manifest.content)
+        module_target_sat.api_factory.enable_rhrepos(
+            org_id=org.id,
+            repos=[
+                {
+                    'product': constants.REPOS['kickstart'][name]['product'],
+                    'reposet': constants.REPOS['kickstart'][name]['reposet'],
+                    'name': constants.REPOS['kickstart'][name]['name'],
+                    'releasever': constants.REPOS['kickstart'][name]['version'],
+                }
+                for name in repo_names
+            ],
+        ).wait(timeout=2500)
     rhel_xy = Version(
         constants.REPOS['kickstart'][f'rhel{rhel_ver}']['version']
         if rhel_ver == 7
@@ -98,7 +103,19 @@ def module_sync_kickstart_content(
     )
     assert o_systems, f'Operating system RHEL {rhel_xy} was not found'
     os = o_systems[0].read()
-    domain = module_target_sat.api.Domain(
-        location=[module_location], organization=[module_sca_manifest_org]
-    ).create()
-    return Box(rhel_ver=rhel_ver, os=os, domain=domain)
+    domain = module_target_sat.api.Domain(location=[location], organization=[org]).create()
+    default_org_view = module_target_sat.api.ContentView(
+        organization=org, name=constants.DEFAULT_CV
+    ).search()[0]
+    lce_library = module_target_sat.api.LifecycleEnvironment().search(
+        query={'search': f'name={constants.ENVIRONMENT} and organization_id={org.id}'}
+    )[0]
+    return Box(
+        rhel_ver=rhel_ver,
+        os=os,
+        domain=domain,
+        org=org,
+        location=location,
+        default_org_view=default_org_view,
+        lce_library=lce_library,
+    )
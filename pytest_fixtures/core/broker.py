@@ -6,6 +6,7 @@ import pytest
 
 from robottelo.config import settings
 from robottelo.hosts import ContentHostError, Satellite, lru_sat_ready_rhel
+from robottelo.utils.host_prefetch import calls_factory
 
 
 @pytest.fixture(scope='session')
@@ -19,10 +20,15 @@ def _default_sat(align_to_satellite):
     return None
 
 
+def _checks_out_target_sat(node):
+    """Whether the target_sat fixtures check out a Satellite for the node"""
+    return node.get_closest_marker(name='destructive') is not None
+
+
 @contextmanager
 def _target_sat_imp(request, _default_sat, satellite_factory):
     """This is the actual working part of the following target_sat fixtures"""
-    if request.node.get_closest_marker(name='destructive'):
+    if _checks_out_target_sat(request.node):
         new_sat = satellite_factory()
         new_sat.enable_ipv6_http_proxy()
         yield new_sat
@@ -39,24 +45,28 @@ def _target_sat_imp(request, _default_sat, satellite_factory):
 
 
 @pytest.fixture
+@calls_factory('satellite_factory', when=_checks_out_target_sat)
 def target_sat(request, _default_sat, satellite_factory):
     with _target_sat_imp(request, _default_sat, satellite_factory) as sat:
         yield sat
 
 
 @pytest.fixture(scope='module')
+@calls_factory('satellite_factory', when=_checks_out_target_sat)
 def module_target_sat(request, _default_sat, satellite_factory):
     with _target_sat_imp(request, _default_sat, satellite_factory) as sat:
         yield sat
 
 
 @pytest.fixture(scope='session')
+@calls_factory('satellite_factory', when=_checks_out_target_sat)
 def session_target_sat(request, _default_sat, satellite_factory):
     with _target_sat_imp(request, _default_sat, satellite_factory) as sat:
         yield sat
 
 
 @pytest.fixture(scope='class')
+@calls_factory('satellite_factory', when=_checks_out_target_sat)
 def class_target_sat(request, _default_sat, satellite_factory):
     with _target_sat_imp(request, _default_sat, satellite_factory) as sat:
         yield sat
@@ -5,12 +5,15 @@ The functions in this module are read in the pytest_plugins/fixture_markers.py m
 All functions in this module will be treated as fixtures that apply the contenthost mark
 """
 
+from contextlib import contextmanager
+
 from broker import Broker
 import pytest
 
 from robottelo import constants
 from robottelo.config import settings
 from robottelo.hosts import ContentHost, Satellite
+from robottelo.utils.host_pool import ContentHostPool
 
 
 def host_conf(request):
@@ -37,12 +40,33 @@ def host_conf(request):
     return conf
 
 
+@contextmanager
+def leased_contenthost(request):
+    """Lease a content host from the session pool when content_host.reuse_hosts is
+    enabled, check out a fresh one otherwise"""
+    if settings.content_host.reuse_hosts:
+        pool = request.getfixturevalue('content_host_pool')
+        with pool.lease(host_conf(request), ContentHost) as host:
+            yield host
+    else:
+        with Broker(**host_conf(request), host_class=ContentHost) as host:
+            yield host
+
+
+@pytest.fixture(scope='session')
+def content_host_pool():
+    """Session wide pool of content hosts reused across the function-level fixtures"""
+    pool = ContentHostPool()
+    yield pool
+    pool.close()
+
+
 @pytest.fixture
 def rhel_contenthost(request):
     """A function-level fixture that provides a content host object parametrized"""
     # Request should be parametrized through pytest_fixtures.fixture_markers
     # unpack params dict
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with leased_contenthost(request) as host:
         yield host
 
 
@@ -58,7 +82,7 @@ def module_rhel_contenthost(request):
 @pytest.fixture(params=[{'rhel_version': '7'}])
 def rhel7_contenthost(request):
     """A function-level fixture that provides a rhel7 content host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with leased_contenthost(request) as host:
         yield host
 
 
@@ -79,7 +103,7 @@ def rhel7_contenthost_module(request):
 @pytest.fixture(params=[{'rhel_version': '8'}])
 def rhel8_contenthost(request):
     """A fixture that provides a rhel8 content host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with leased_contenthost(request) as host:
         yield host
 
 
@@ -93,14 +117,14 @@ def rhel8_contenthost_module(request):
 @pytest.fixture(params=[{'rhel_version': 6}])
 def rhel6_contenthost(request):
     """A function-level fixture that provides a rhel6 content host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with leased_contenthost(request) as host:
         yield host
 
 
 @pytest.fixture(params=[{'rhel_version': '9'}])
 def rhel9_contenthost(request):
     """A fixture that provides a rhel9 content host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with leased_contenthost(request) as host:
         yield host
 
 
@@ -15,6 +15,7 @@ from robottelo.hosts import (
     lru_sat_ready_rhel,
 )
 from robottelo.logging import logger
+from robottelo.utils.host_prefetch import HostPrefetcher, calls_factory
 from robottelo.utils.installer import InstallerCommand
 
 
@@ -27,9 +28,38 @@ def resolve_deploy_args(args_dict):
     return args_dict
 
 
+@contextmanager
+def _prefetched(name, checkout):
+    """Provide a factory handing out the hosts prefetched for the expected demand of the
+    factory fixture, when broker.prefetch_quota is set. Hosts are prefetched for the
+    default checkout arguments only, other calls always check out a new host.
+    """
+    quota = settings.broker.prefetch_quota
+    demand = getattr(pytest, 'factory_demand', {}).get(name, 0)
+    prefetcher = HostPrefetcher(name, checkout, demand, quota) if quota and demand else None
+
+    def factory(retry_limit=3, delay=300, workflow=None, **broker_args):
+        if prefetcher and workflow is None and not broker_args:
+            host = prefetcher.get()
+            if host:
+                return host
+        return checkout(retry_limit=retry_limit, delay=delay, workflow=workflow, **broker_args)
+
+    try:
+        yield factory
+    finally:
+        if prefetcher:
+            prefetcher.close()
+
+
+def _checks_out_satellite_host(node):
+    """Whether the Satellite host fixtures check out a Satellite for the node"""
+    return 'sanity' not in node.config.option.markexpr
+
+
 @contextmanager
 def _target_satellite_host(request, satellite_factory):
-    if 'sanity' not in request.config.option.markexpr:
+    if _checks_out_satellite_host(request.node):
         new_sat = satellite_factory()
         new_sat.enable_ipv6_http_proxy()
         yield new_sat
@@ -45,9 +75,14 @@ def cached_capsule_cdn_register(hostname=None):
     cap.enable_capsule_downstream_repos()
 
 
+def _checks_out_capsule_host(node):
+    """Whether the Capsule host fixtures check out a Capsule for the node"""
+    return 'sanity' not in node.config.option.markexpr and not node.config.option.n_minus
+
+
 @contextmanager
 def _target_capsule_host(request, capsule_factory):
-    if 'sanity' not in request.config.option.markexpr and not request.config.option.n_minus:
+    if _checks_out_capsule_host(request.node):
         new_cap = capsule_factory()
         new_cap.enable_ipv6_http_proxy()
         yield new_cap
@@ -75,7 +110,7 @@ def satellite_factory():
         settings.set('server.deploy_arguments', resolved)
         logger.debug(f'Resolved deploy arguments for sat: {settings.server.deploy_arguments}')
 
-    def factory(retry_limit=3, delay=300, workflow=None, **broker_args):
+    def checkout(retry_limit=3, delay=300, workflow=None, **broker_args):
         if settings.server.deploy_arguments:
             broker_args.update(settings.server.deploy_arguments)
             logger.debug(f'Updated broker args for sat: {broker_args}')
@@ -89,7 +124,8 @@ def satellite_factory():
         sat = wait_for(vmb.checkout, timeout=timeout, delay=delay, fail_condition=[])
         return sat.out
 
-    return factory
+    with _prefetched('satellite_factory', checkout) as factory:
+        yield factory
 
 
 @pytest.fixture
@@ -110,7 +146,7 @@ def capsule_factory():
         settings.set('capsule.deploy_arguments', resolved)
         logger.debug(f'Resolved deploy arguments for cap: {settings.capsule.deploy_arguments}')
 
-    def factory(retry_limit=3, delay=300, workflow=None, **broker_args):
+    def checkout(retry_limit=3, delay=300, workflow=None, **broker_args):
         if settings.capsule.deploy_arguments:
             broker_args.update(settings.capsule.deploy_arguments)
         vmb = Broker(
@@ -122,10 +158,12 @@ def capsule_factory():
         cap = wait_for(vmb.checkout, timeout=timeout, delay=delay, fail_condition=[])
         return cap.out
 
-    return factory
+    with _prefetched('capsule_factory', checkout) as factory:
+        yield factory
 
 
 @pytest.fixture
+@calls_factory('satellite_factory', when=_checks_out_satellite_host)
 def satellite_host(request, satellite_factory):
     """A fixture that provides a Satellite based on config settings"""
     with _target_satellite_host(request, satellite_factory) as sat:
@@ -133,6 +171,7 @@ def satellite_host(request, satellite_factory):
 
 
 @pytest.fixture(scope='module')
+@calls_factory('satellite_factory', when=_checks_out_satellite_host)
 def module_satellite_host(request, satellite_factory):
     """A fixture that provides a Satellite based on config settings"""
     with _target_satellite_host(request, satellite_factory) as sat:
@@ -140,6 +179,7 @@ def module_satellite_host(request, satellite_factory):
 
 
 @pytest.fixture(scope='session')
+@calls_factory('satellite_factory', when=_checks_out_satellite_host)
 def session_satellite_host(request, satellite_factory):
     """A fixture that provides a Satellite based on config settings"""
     with _target_satellite_host(request, satellite_factory) as sat:
@@ -161,6 +201,7 @@ def module_satellite_mqtt(module_target_sat):
 
 
 @pytest.fixture
+@calls_factory('capsule_factory', when=_checks_out_capsule_host)
 def capsule_host(request, capsule_factory):
     """A fixture that provides a Capsule based on config settings"""
     with _target_capsule_host(request, capsule_factory) as cap:
@@ -168,6 +209,7 @@ def capsule_host(request, capsule_factory):
 
 
 @pytest.fixture(scope='module')
+@calls_factory('capsule_factory', when=_checks_out_capsule_host)
 def module_capsule_host(request, capsule_factory):
     """A fixture that provides a Capsule based on config settings"""
     with _target_capsule_host(request, capsule_factory) as cap:
@@ -175,6 +217,7 @@ def module_capsule_host(request, capsule_factory):
 
 
 @pytest.fixture(scope='session')
+@calls_factory('capsule_factory', when=_checks_out_capsule_host)
 def session_capsule_host(request, capsule_factory):
     """A fixture that provides a Capsule based on config settings"""
     with _target_capsule_host(request, capsule_factory) as cap:
@@ -275,6 +318,7 @@ def module_capsule_configured_async_ssh(module_capsule_configured):
 
 
 @pytest.fixture(scope='module', params=['IDM', 'AD'])
+@calls_factory('satellite_factory')
 def parametrized_enrolled_sat(
     request,
     satellite_factory,
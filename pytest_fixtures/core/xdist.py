@@ -1,5 +1,6 @@
 """Fixtures specific to or relating to pytest's xdist plugin"""
 
+import os
 import random
 
 from broker import Broker
@@ -8,10 +9,24 @@ import pytest
 from robottelo.config import configure_airgun, configure_nailgun, settings
 from robottelo.hosts import Satellite
 from robottelo.logging import logger
+from robottelo.utils.host_prefetch import calls_factory
+from robottelo.utils.satellite_load import load_aware_assignment
+
+
+def _checks_out_on_demand(node):
+    """Whether the worker Satellite is checked out on demand, no hostname being assigned
+    to the worker"""
+    return (
+        settings.server.xdist_behavior == 'on-demand'
+        and not settings.server.hostnames
+        and not settings.server.inventory_filter
+        and 'build_sanity' not in node.config.option.markexpr
+    )
 
 
 @pytest.fixture(scope="session", autouse=True)
-def align_to_satellite(request, worker_id, satellite_factory):
+@calls_factory('satellite_factory', when=_checks_out_on_demand)
+def align_to_satellite(request, worker_id, testrun_uid, satellite_factory):
     """Attempt to align a Satellite to the current xdist worker"""
     if 'build_sanity' in request.config.option.markexpr:
         settings.set("server.hostname", None)
@@ -45,6 +60,14 @@ def align_to_satellite(request, worker_id, satellite_factory):
         # attempt to align a worker to a satellite
         if settings.server.xdist_behavior == 'run-on-one' and settings.server.hostnames:
             settings.set("server.hostname", settings.server.hostnames[0])
+        elif settings.server.xdist_behavior == 'load-aware' and settings.server.hostnames:
+            decision = load_aware_assignment(
+                run_id=testrun_uid,
+                hostnames=settings.server.hostnames,
+                worker_count=int(os.environ.get('PYTEST_XDIST_WORKER_COUNT', 1)),
+            )
+            logger.info(f'{worker_id=}: Satellite capacity scores: {decision.scores}')
+            settings.set("server.hostname", decision.assignment[worker_pos])
         elif settings.server.hostnames and worker_pos < len(settings.server.hostnames):
             settings.set("server.hostname", settings.server.hostnames[worker_pos])
         elif settings.server.xdist_behavior == 'balance' and settings.server.hostnames:
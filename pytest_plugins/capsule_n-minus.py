@@ -18,33 +18,25 @@ def pytest_addoption(parser):
     parser.addoption("--n-minus", action='store_true', default=False, help=help_text)
 
 
-def pytest_collection_modifyitems(items, config):
+def pytest_collection_stages(pipeline, config):
     if not config.getoption('n_minus', False):
         return
 
-    selected = []
-    deselected = []
-
-    for item in items:
-        is_destructive = item.get_closest_marker('destructive')
+    def select(item, index):
         # Deselect Destructive tests and tests without capsule_factory fixture
-        if 'capsule_factory' not in item.fixturenames or is_destructive:
-            deselected.append(item)
-            continue
+        if 'capsule_factory' not in index.fixtures or index.closest('destructive'):
+            return False
         # Ignoring all puppet tests as they are destructive in nature
         # and needs its own satellite for verification
-        if 'session_puppet_enabled_sat' in item.fixturenames:
-            deselected.append(item)
-            continue
+        if 'session_puppet_enabled_sat' in index.fixtures:
+            return False
         # Ignoring all satellite maintain tests as they are destructive in nature
         # Also dont need them in nminus testing as its not integration testing
-        if 'sat_maintain' in item.fixturenames and 'satellite' in item.callspec.params.values():
-            deselected.append(item)
-            continue
-        selected.append(item)
+        return not (
+            'sat_maintain' in index.fixtures and 'satellite' in item.callspec.params.values()
+        )
 
-    config.hook.pytest_deselected(items=deselected)
-    items[:] = selected
+    pipeline.add('capsule_n-minus', select)
 
 
 def pytest_sessionfinish(session, exitstatus):
@@ -0,0 +1,37 @@
+"""Run the stages the plugins add to the collection pipeline in a single pass.
+
+Plugins implement ``pytest_collection_stages`` to add their filtering and annotating
+stages, see ``robottelo.utils.collection_pipeline``. The hook implementations are
+called in the order pytest calls ``pytest_collection_modifyitems``, ``tryfirst``
+ones first, so the stages run in the order the plugins filtered the items in their
+own ``pytest_collection_modifyitems``.
+"""
+
+import pytest
+
+from robottelo.utils.collection_pipeline import CollectionPipeline
+
+
+class CollectionPipelineSpec:
+    @pytest.hookspec
+    def pytest_collection_stages(self, pipeline, config):
+        """Add stages to the collection pipeline with ``pipeline.add``
+
+        :param pipeline: The ``CollectionPipeline``.
+        :param config: The pytest config object.
+        """
+
+
+def pytest_addhooks(pluginmanager):
+    pluginmanager.add_hookspecs(CollectionPipelineSpec)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(session, items, config):
+    """Run the pipeline ``tryfirst``, as the first stages used to filter the items,
+    before the plain ``pytest_collection_modifyitems`` of the other plugins"""
+    pipeline = CollectionPipeline()
+    config.hook.pytest_collection_stages(pipeline=pipeline, config=config)
+    selected, deselected = pipeline.run(items)
+    config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
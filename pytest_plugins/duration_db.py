@@ -0,0 +1,174 @@
+"""Record test and fixture durations and schedule the tests by their historical cost.
+
+With ``--duration-db``, the setup, call and teardown durations of the tests and
+the setup durations of the fixtures are recorded, see
+``robottelo.utils.duration_db``. With ``--duration-schedule`` as well, the modules
+are ordered longest first, their tests kept together so that their module and class
+scoped fixtures are set up once, the tests sharing an expensive module or class
+scoped fixture get an ``xdist_group`` so that ``--dist loadgroup`` keeps them on the
+same worker, and the predicted and actual makespans are reported.
+"""
+
+import os
+import statistics
+import time
+
+import pytest
+
+from robottelo.config import settings
+from robottelo.logging import logger
+from robottelo.utils.duration_db import DurationDB, makespan, schedule
+
+_recorder = {}
+
+
+def pytest_addoption(parser):
+    """Add options to record the durations and schedule the tests by their cost"""
+    parser.addoption(
+        '--duration-db',
+        default=None,
+        help='Record the tests and fixtures durations in this SQLite database.',
+    )
+    parser.addoption(
+        '--duration-schedule',
+        action='store_true',
+        default=False,
+        help='Order the tests longest first and group the tests sharing expensive module '
+        'or class scoped fixtures, according to the durations recorded in --duration-db.',
+    )
+    parser.addoption(
+        '--duration-group-threshold',
+        type=float,
+        default=60,
+        help='Setup duration, in seconds, above which a module or class scoped fixture '
+        'keeps the tests using it on the same xdist worker.',
+    )
+
+
+def pytest_configure(config):
+    if config.getoption('duration_db'):
+        _recorder.update(
+            db=DurationDB(config.getoption('duration_db')),
+            sat_version=str(settings.server.version.release),
+            started=time.time(),
+            tests=[],
+            fixtures=[],
+        )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    start = time.monotonic()
+    yield
+    if _recorder:
+        _recorder['fixtures'].append(
+            (
+                fixturedef.argname,
+                fixturedef.scope,
+                _recorder['sat_version'],
+                time.monotonic() - start,
+            )
+        )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # made by the process running the test, an xdist worker or the only one
+    outcome = yield
+    if _recorder:
+        report = outcome.get_result()
+        _recorder['tests'].append(
+            (_nodeid(item), _recorder['sat_version'], report.when, report.duration, report.outcome)
+        )
+
+
+def _scope_id(item, scope):
+    if scope == 'class' and item.cls:
+        return f'{item.module.__name__}::{item.cls.__name__}'
+    return item.module.__name__
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(session, items, config):
+    """Group the tests sharing an expensive fixture and order the tests longest first.
+    Runs before xdist reads the xdist_group markers."""
+    if not (_recorder and config.getoption('duration_schedule')):
+        return
+    fixture_costs = _recorder['db'].fixture_costs(_recorder['sat_version'])
+    threshold = config.getoption('duration_group_threshold')
+    for item in items:
+        if item.get_closest_marker('xdist_group'):
+            continue
+        expensive = [
+            (fixture_costs[name], name, fixturedefs[-1].scope)
+            for name, fixturedefs in item._fixtureinfo.name2fixturedefs.items()
+            if fixturedefs[-1].scope in ('module', 'class')
+            and fixture_costs.get(name, 0) >= threshold
+        ]
+        if expensive:
+            _, name, scope = max(expensive)
+            item.add_marker(pytest.mark.xdist_group(f'{_scope_id(item, scope)}::{name}'))
+    jobs = _jobs(items, _recorder['db'].test_costs(_recorder['sat_version']))
+    order, _ = schedule(list(jobs), {job: cost for job, (_, cost) in jobs.items()})
+    items[:] = [item for job in order for item in jobs[job][0]]
+
+
+def _group(item):
+    mark = item.get_closest_marker('xdist_group')
+    if mark:
+        return mark.args[0] if mark.args else mark.kwargs.get('name', 'default')
+    return None
+
+
+def _nodeid(item):
+    """Return the nodeid of the item, without the xdist group suffix added by the
+    workers with ``--dist loadgroup``"""
+    group = _group(item)
+    if group and item.nodeid.endswith(f'@{group}'):
+        return item.nodeid[: -len(group) - 1]
+    return item.nodeid
+
+
+def _jobs(items, costs):
+    """Return the scheduling units, an xdist group or the other tests of a module, with
+    their items in collection order and predicted cost"""
+    default_cost = statistics.median(costs.values()) if costs else 0.0
+    jobs = {}
+    for item in items:
+        job = _group(item) or _scope_id(item, 'module')
+        job_items, cost = jobs.get(job, ([], 0.0))
+        jobs[job] = ([*job_items, item], cost + costs.get(_nodeid(item), default_cost))
+    return jobs
+
+
+def pytest_collection_finish(session):
+    """Record the predicted makespan of the selected tests, by the first xdist worker"""
+    if not (_recorder and session.items and session.config.getoption('duration_schedule')):
+        return
+    if os.environ.get('PYTEST_XDIST_WORKER', 'gw0') != 'gw0':
+        return
+    workers = int(os.environ.get('PYTEST_XDIST_WORKER_COUNT', 1))
+    jobs = _jobs(session.items, _recorder['db'].test_costs(_recorder['sat_version']))
+    predicted = makespan(sorted((cost for _, cost in jobs.values()), reverse=True), workers)
+    _recorder['db'].record_prediction(_recorder['started'], workers, predicted)
+
+
+def pytest_sessionfinish(session):
+    if _recorder:
+        _recorder['db'].record(_recorder['tests'], _recorder['fixtures'])
+        logger.info(
+            f'Recorded {len(_recorder["tests"])} test phases and '
+            f'{len(_recorder["fixtures"])} fixture setups in {_recorder["db"].path}'
+        )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not (_recorder and config.getoption('duration_schedule')):
+        return
+    predicted = _recorder['db'].prediction(since=_recorder['started'])
+    actual = time.time() - _recorder['started']
+    if predicted is not None:
+        terminalreporter.write_line(
+            f'Predicted makespan {predicted:.0f}s, actual {actual:.0f}s '
+            f'({actual - predicted:+.0f}s)'
+        )
@@ -0,0 +1,99 @@
+"""Purge the entities created during the session at its end.
+
+With ``--purge-entities``, the entities created through ``satellite.api`` and
+``satellite.cli_factory`` are recorded in a ledger per process, see
+``robottelo.utils.entity_ledger``, and purged by the xdist controller once the
+workers are done, those of the Satellites provisioned during the session being
+dropped, as already checked in. With ``--purge-dry-run``, they are only reported.
+The entities failing to be purged are kept in ``entity_ledger/leftovers.jsonl`` of
+the robottelo tmp dir, to purge on demand with ``scripts/purge_entities.py``.
+"""
+
+import shutil
+import uuid
+
+import pytest
+
+from robottelo.config import settings
+from robottelo.logging import logger
+from robottelo.utils.entity_ledger import (
+    LEDGER_DIR,
+    LEFTOVERS,
+    EntityLedger,
+    ledger_files,
+    start_ledger,
+    stop_ledger,
+)
+
+_purge = {}
+
+
+def pytest_addoption(parser):
+    """Add options to purge the entities created during the session"""
+    parser.addoption(
+        '--purge-entities',
+        action='store_true',
+        default=False,
+        help='Record the entities created during the session and purge them at its end.',
+    )
+    parser.addoption(
+        '--purge-dry-run',
+        action='store_true',
+        default=False,
+        help='Only report the entities --purge-entities would purge.',
+    )
+    parser.addoption(
+        '--purge-workers',
+        type=int,
+        default=8,
+        help='Number of concurrent delete requests of --purge-entities.',
+    )
+
+
+def pytest_configure(config):
+    if not config.getoption('purge_entities'):
+        return
+    if hasattr(config, 'workerinput'):
+        run_dir = LEDGER_DIR.joinpath(config.workerinput['entity_ledger_run'])
+        worker_id = config.workerinput['workerid']
+    else:
+        run_dir, worker_id = LEDGER_DIR.joinpath(uuid.uuid4().hex), 'master'
+    _purge['run_dir'] = run_dir
+    start_ledger(run_dir.joinpath(f'{worker_id}.jsonl'))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    if _purge:
+        node.workerinput['entity_ledger_run'] = _purge['run_dir'].name
+
+
+def pytest_sessionfinish(session):
+    if not _purge:
+        return
+    stop_ledger()
+    if hasattr(session.config, 'workerinput'):
+        return
+    run_dir = _purge['run_dir']
+    ledger = EntityLedger.load(ledger_files(run_dir))
+    reporter = session.config.pluginmanager.get_plugin('terminalreporter')
+
+    def progress(line):
+        logger.info(line)
+        if reporter:
+            reporter.write_line(line)
+
+    if reporter:
+        reporter.section('entity purge')
+    hostnames = {*settings.server.hostnames, settings.server.hostname} - {None}
+    for hostname, count in ledger.drop_hosts(hostnames).items():
+        progress(f'Dropped {count} entities of {hostname}, not a configured Satellite')
+    ledger.purge(
+        dry_run=session.config.getoption('purge_dry_run'),
+        workers=session.config.getoption('purge_workers'),
+        progress=progress,
+    )
+    if ledger.entries:
+        ledger.save(LEFTOVERS, append=True)
+        progress(f'{len(ledger.entries)} entities left to purge in {LEFTOVERS}')
+    shutil.rmtree(run_dir, ignore_errors=True)
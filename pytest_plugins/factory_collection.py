@@ -1,4 +1,11 @@
+from collections import Counter
 from inspect import getmembers, isfunction
+import math
+import os
+
+import pytest
+
+FACTORIES = ('satellite_factory', 'capsule_factory')
 
 
 def pytest_configure(config):
@@ -7,14 +14,52 @@ def pytest_configure(config):
     config.addinivalue_line("markers", marker)
 
 
-def pytest_collection_modifyitems(session, items, config):
-    from pytest_fixtures.core import sat_cap_factory
+def _scope_node(item, scope):
+    """Return an id of the node a fixture of the scope is instantiated once for"""
+    return {
+        'session': '',
+        'package': os.path.dirname(item.path),
+        'module': item.path,
+        'class': (item.path, getattr(item.cls, '__name__', None)),
+    }.get(scope, item.nodeid)
 
-    factory_fixture_names = [m[0] for m in getmembers(sat_cap_factory, isfunction)]
+
+def factory_demand(items):
+    """Count the fresh instances the items are expected to need per factory: one per
+    instance of the fixtures calling the factory for the item, as they declare with
+    ``robottelo.utils.host_prefetch.calls_factory``, according to their scope.
+    """
+    instances = {factory: set() for factory in FACTORIES}
     for item in items:
-        itemfixtures = [
-            itm for itm in item.fixturenames if itm not in ('satellite_factory', 'capsule_factory')
-        ]
-        has_factoryfixture = set(itemfixtures).intersection(set(factory_fixture_names))
-        if has_factoryfixture:
-            item.add_marker('factory_instance')
+        for name, fixturedefs in item._fixtureinfo.name2fixturedefs.items():
+            fixturedef = fixturedefs[-1]
+            for factory, when in getattr(fixturedef.func, 'factory_calls', {}).items():
+                if factory in instances and when(item):
+                    instances[factory].add((name, _scope_node(item, fixturedef.scope)))
+    return Counter({factory: len(nodes) for factory, nodes in instances.items()})
+
+
+def pytest_collection_stages(pipeline, config):
+    from pytest_fixtures.core import sat_cap_factory
+
+    factory_fixture_names = {m[0] for m in getmembers(sat_cap_factory, isfunction)}.difference(
+        FACTORIES
+    )
+
+    def select(item, index):
+        if index.fixtures & factory_fixture_names:
+            index.add_marker('factory_instance')
+
+    pipeline.add('factory_collection', select)
+
+
+def pytest_collection_finish(session):
+    """Record the expected factory demand of the selected items"""
+    # every xdist worker collects all the items and runs its share of them
+    workers = int(os.environ.get('PYTEST_XDIST_WORKER_COUNT', 1))
+    pytest.factory_demand = Counter(
+        {
+            factory: math.ceil(demand / workers)
+            for factory, demand in factory_demand(session.items).items()
+        }
+    )
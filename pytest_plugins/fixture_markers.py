@@ -81,7 +81,7 @@ def pytest_configure(config):
         config.addinivalue_line("markers", marker)
 
 
-def pytest_collection_modifyitems(session, items, config):
+def pytest_collection_stages(pipeline, config):
     from pytest_fixtures.core import contenthosts
 
     def chost_rhelver(params):
@@ -91,16 +91,19 @@ def pytest_collection_modifyitems(session, items, config):
                 return params[param].get('rhel_version')
         return None
 
-    content_host_fixture_names = [m[0] for m in getmembers(contenthosts, isfunction)]
-    for item in items:
-        if set(item.fixturenames).intersection(set(content_host_fixture_names)):
+    content_host_fixture_names = {m[0] for m in getmembers(contenthosts, isfunction)}
+
+    def select(item, index):
+        if index.fixtures & content_host_fixture_names:
             # TODO check param for indirect version parametrization
             if hasattr(item, 'callspec'):
                 client_property = ('ClientOS', str(chost_rhelver(item.callspec.params)))
             else:
                 client_property = ('ClientOS', str(settings.content_host.default_rhel_version))
             item.user_properties.append(client_property)
-            item.add_marker('content_host')
+            index.add_marker('content_host')
+
+    pipeline.add('fixture_markers', select)
 
 
 def pytest_addoption(parser):
@@ -0,0 +1,106 @@
+"""Profile the fixtures setup and teardown.
+
+With ``--fixture-profile=PATH``, the wall time of the setup and teardown of the
+fixtures, and the SSH commands, hammer calls and API requests they issue, are
+recorded by fixture name and scope, see ``robottelo.utils.fixture_profiler``.
+The profile is saved as JSON in PATH, its folded stacks next to it in
+``PATH.folded`` for flame graph tools, and the costliest fixtures are reported in
+the terminal summary. The profiles of the xdist workers are merged by the controller.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from xdist import get_xdist_worker_id
+
+from robottelo.utils.fixture_profiler import (
+    FixtureProfiler,
+    folded_lines,
+    merge_profiles,
+    report_lines,
+)
+
+_profiler = {}
+
+
+def pytest_addoption(parser):
+    """Add options to profile the fixtures"""
+    parser.addoption(
+        '--fixture-profile',
+        default=None,
+        help='Profile the fixtures setup and teardown and save the profile, as JSON, in this file.',
+    )
+    parser.addoption(
+        '--fixture-profile-top',
+        type=int,
+        default=20,
+        help='Number of the costliest fixtures reported in the terminal summary.',
+    )
+
+
+def pytest_configure(config):
+    if config.getoption('fixture_profile'):
+        profiler = FixtureProfiler()
+        profiler.instrument()
+        _profiler.update(profiler=profiler, path=Path(config.getoption('fixture_profile')))
+
+
+def pytest_unconfigure(config):
+    if _profiler:
+        _profiler['profiler'].uninstrument()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    if not _profiler:
+        yield
+        return
+    profiler = _profiler['profiler']
+    profiler.start(fixturedef.argname, fixturedef.scope, 'setup', key=fixturedef)
+    try:
+        yield
+    finally:
+        profiler.stop(fixturedef)
+        # the finalizers run last in first out, this one right before the fixture teardown
+        fixturedef.addfinalizer(
+            lambda: profiler.start(fixturedef.argname, fixturedef.scope, 'teardown', fixturedef)
+        )
+
+
+def pytest_fixture_post_finalizer(fixturedef, request):
+    if _profiler:
+        _profiler['profiler'].stop(fixturedef)
+
+
+def _worker_path(path, worker_id):
+    return path.with_name(f'{path.name}.{worker_id}')
+
+
+def pytest_sessionfinish(session):
+    if not _profiler:
+        return
+    path = _profiler['path']
+    worker_id = get_xdist_worker_id(session)
+    if worker_id != 'master':
+        _profiler['profiler'].save(_worker_path(path, worker_id))
+        return
+    workers = sorted(path.parent.glob(f'{path.name}.gw*'))
+    if workers:
+        profile = merge_profiles(json.loads(worker.read_text()) for worker in workers)
+        for worker in workers:
+            worker.unlink()
+    else:
+        profile = _profiler['profiler'].profile()
+    path.write_text(json.dumps(profile, indent=2, sort_keys=True))
+    path.with_name(f'{path.name}.folded').write_text('\n'.join(folded_lines(profile)) + '\n')
+    _profiler['profile'] = profile
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if 'profile' not in _profiler:
+        return
+    terminalreporter.section('fixture profile')
+    for line in report_lines(_profiler['profile'], top=config.getoption('fixture_profile_top')):
+        terminalreporter.write_line(line)
+    terminalreporter.write_line(f'Fixture profile saved in {_profiler["path"]}')
@@ -2,15 +2,18 @@
 import re
 
 
-def pytest_collection_modifyitems(session, items, config):
+def pytest_collection_stages(pipeline, config):
     endpoint_regex = re.compile(
         # To match the endpoint in the fspath
         r'^.*/(?P<endpoint>\S*)/test_.*.py$',
         re.IGNORECASE,
     )
-    for item in items:
+
+    def select(item, index):
         if item.nodeid.startswith('tests/robottelo/') or item.nodeid.startswith('tests/upgrades/'):
-            continue
+            return
 
         if endpoints := endpoint_regex.findall(item.location[0]):
             item.user_properties.append(('endpoint', endpoints[0]))
+
+    pipeline.add('fspath', select)
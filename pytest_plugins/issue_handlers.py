@@ -9,6 +9,7 @@ import pytest
 from robottelo.config import settings
 from robottelo.logging import collection_logger as logger
 from robottelo.utils import slugify_component
+from robottelo.utils.collection_pipeline import item_index
 from robottelo.utils.issue_handlers import (
     add_workaround,
     bugzilla,
@@ -72,17 +73,18 @@ def pytest_collection_modifyitems(session, items, config):
     selected = []
     deselected = []
     for item in items:
+        index = item_index(item)
         # Add a skipif marker for the issues
-        skip_if_open = item.get_closest_marker('skip_if_open')
+        skip_if_open = index.closest('skip_if_open')
         if skip_if_open:
             # marker must have `BZ:123456` as argument.
             issue = skip_if_open.kwargs.get('reason') or skip_if_open.args[0]
-            item.add_marker(pytest.mark.skipif(is_open(issue), reason=issue))
+            index.add_marker(pytest.mark.skipif(is_open(issue), reason=issue))
 
         # remove items from collection
         if bz_filters:
             # Only include items which have BZ mark that includes any of the filtered bz numbers
-            item_bz_marks = set(getattr(item.get_closest_marker('BZ', None), 'args', []))
+            item_bz_marks = set(getattr(index.closest('BZ', None), 'args', []))
             if bool(set(bz_filters) & item_bz_marks):
                 selected.append(item)
             else:
@@ -201,12 +203,12 @@ def generate_issue_collection(items, config):  # pragma: no cover
             # Allowing for issue_handler use in unit tests
             continue
 
+        index = item_index(item)
         bz_marks_to_add = []
         # register test module as processed
         test_modules.add(item.module)
         # Find matches from docstrings top-down from: module, class, function.
-        mod_cls_fun = (item.module, getattr(item, 'cls', None), item.function)
-        for docstring in [d for d in map(inspect.getdoc, mod_cls_fun) if d is not None]:
+        for docstring in reversed(index.docstrings):
             bz_matches = BZ.findall(docstring)
             if bz_matches:
                 bz_marks_to_add.extend(b.strip() for b in bz_matches[-1].split(','))
@@ -214,12 +216,12 @@ def generate_issue_collection(items, config):  # pragma: no cover
         filepath, lineno, testcase = item.location
         # Component and importance marks are determined by testimony tokens
         # Testimony.yaml as of writing has both as required, so any
-        if not (components := item.get_closest_marker('component')):
+        if not (components := index.closest('component')):
             continue
         component_mark = components.args[0]
         component_slug = slugify_component(component_mark, False)
-        importance_mark = item.get_closest_marker('importance').args[0]
-        for marker in item.iter_markers():
+        importance_mark = index.closest('importance').args[0]
+        for marker in index.iter_markers():
             if marker.name in valid_markers:
                 issue = marker.kwargs.get('reason') or marker.args[0]
                 issue_key = issue.strip()
@@ -256,7 +258,7 @@ def generate_issue_collection(items, config):  # pragma: no cover
 
         # Add BZs from tokens as a marker to enable filter e.g: "--BZ 123456"
         if bz_marks_to_add:
-            item.add_marker(pytest.mark.BZ(*bz_marks_to_add))
+            index.add_marker(pytest.mark.BZ(*bz_marks_to_add))
 
     # Take uses of `is_open` from outside of test cases e.g: SetUp methods
     for test_module in test_modules:
@@ -299,7 +301,7 @@ def generate_issue_collection(items, config):  # pragma: no cover
         issue = deselect_data.get(item.location)
         if issue and should_deselect(issue, collected_data[issue]['data']):
             collected_data[issue]['data']['is_deselected'] = True
-            item.add_marker(pytest.mark.deselect(reason=issue))
+            item_index(item).add_marker(pytest.mark.deselect(reason=issue))
 
     # --- if no cache file existed write a new cache file ---
     if cached_data is None and use_bz_cache:
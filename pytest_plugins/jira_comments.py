@@ -6,7 +6,7 @@ import pytest
 from robottelo.config import settings
 from robottelo.logging import logger
 from robottelo.utils import parse_comma_separated_list
-from robottelo.utils.issue_handlers.jira import add_comment_on_jira
+from robottelo.utils.issue_handlers.jira import add_comments_on_jira
 
 
 def pytest_addoption(parser):
@@ -25,6 +25,12 @@ def pytest_addoption(parser):
         default=False,
         help=help_comment,
     )
+    parser.addoption(
+        '--jira-comments-dry-run',
+        action='store_true',
+        default=False,
+        help='Log the test result comments instead of adding them on the Jira issues.',
+    )
 
 
 def pytest_configure(config):
@@ -86,16 +92,19 @@ def pytest_sessionfinish(session, exitstatus):
     if hasattr(session.config, 'issue_to_tests_map'):
         user = os.environ.get('USER')
         build_url = os.environ.get('BUILD_URL')
-        for issue in session.config.issue_to_tests_map:
+        comments = {}
+        for issue, items in session.config.issue_to_tests_map.items():
             comment_body = (
                 f'This is an automated comment from job/user: {build_url if build_url else user} for a Robottelo test run.\n'
                 f'Satellite/Capsule: {settings.server.version.release} Snap: {settings.server.version.snap} \n'
                 f'Result for tests linked with issue: {issue} \n'
             )
-            for item in session.config.issue_to_tests_map[issue]:
-                comment_body += f'{item["nodeid"]} : {item["outcome"]} \n'
-            try:
-                add_comment_on_jira(issue, comment_body)
-            except Exception as e:
-                # Handle any errors in adding comments to Jira
-                logger.warning(f'Failed to add comment to Jira issue {issue}: {e}')
+            comment_body += ''.join(f'{item["nodeid"]} : {item["outcome"]} \n' for item in items)
+            comments[issue] = comment_body
+        try:
+            add_comments_on_jira(
+                comments, dry_run=session.config.getoption('jira_comments_dry_run')
+            )
+        except Exception as e:
+            # Handle any errors in resolving the Jira issues
+            logger.warning(f'Failed to add comments to Jira issues: {e}')
@@ -7,9 +7,13 @@ from xdist import is_xdist_worker
 
 from robottelo.logging import (
     DEFAULT_DATE_FORMAT,
+    JsonLinesFormatter,
     broker_log_setup,
+    file_handlers_unqueued,
+    json_lines_handler,
     logger,
     logging_yaml,
+    robottelo_json_log_file,
     robottelo_log_dir,
     robottelo_log_file,
 )
@@ -36,36 +40,47 @@ def configure_logging(request, worker_id):
     if use_rp_logger:
         logging.setLoggerClass(RPLogger)
 
-    if is_xdist_worker(request) and f'{worker_id}' not in [h.get_name() for h in logger.handlers]:
-        # Track the core logger's file handler level, set it in case core logger wasn't set
-        worker_log_level = 'INFO'
-        handlers_to_remove = [
-            h
-            for h in logger.handlers
-            if isinstance(h, logging.FileHandler)
-            and getattr(h, 'baseFilename', None) == str(robottelo_log_file)
-        ]
-        for handler in handlers_to_remove:
-            logger.removeHandler(handler)
-            worker_log_level = handler.level
-        worker_handler = logging.FileHandler(
-            robottelo_log_dir.joinpath(f'robottelo_{worker_id}.log')
-        )
-        worker_handler.set_name(f'{worker_id}')
-        worker_handler.setFormatter(worker_formatter)
-        worker_handler.setLevel(worker_log_level)
-        logger.addHandler(worker_handler)
-        broker_log_setup(
-            level=logging_yaml.broker.level,
-            file_level=logging_yaml.broker.fileLevel,
-            formatter=worker_formatter,
-            path=robottelo_log_dir.joinpath(f'robottelo_{worker_id}.log'),
-        )
+    with file_handlers_unqueued():
+        if is_xdist_worker(request) and f'{worker_id}' not in [
+            h.get_name() for h in logger.handlers
+        ]:
+            # Track the core logger's file handler level, set it in case core logger wasn't set
+            worker_log_level = 'INFO'
+            handlers_to_remove = [
+                h
+                for h in logger.handlers
+                if isinstance(h, logging.FileHandler)
+                and getattr(h, 'baseFilename', None)
+                in (str(robottelo_log_file), str(robottelo_json_log_file))
+            ]
+            for handler in handlers_to_remove:
+                logger.removeHandler(handler)
+                if not isinstance(handler.formatter, JsonLinesFormatter):
+                    worker_log_level = handler.level
+            worker_handler = logging.FileHandler(
+                robottelo_log_dir.joinpath(f'robottelo_{worker_id}.log')
+            )
+            worker_handler.set_name(f'{worker_id}')
+            worker_handler.setFormatter(worker_formatter)
+            worker_handler.setLevel(worker_log_level)
+            logger.addHandler(worker_handler)
+            if logging_yaml.backend.json_lines:
+                logger.addHandler(
+                    json_lines_handler(
+                        robottelo_log_dir.joinpath(f'robottelo_{worker_id}.jsonl'), worker_id
+                    )
+                )
+            broker_log_setup(
+                level=logging_yaml.broker.level,
+                file_level=logging_yaml.broker.fileLevel,
+                formatter=worker_formatter,
+                path=robottelo_log_dir.joinpath(f'robottelo_{worker_id}.log'),
+            )
 
-        if use_rp_logger:
-            rp_handler = RPLogHandler(request.node.config.py_test_service)
-            rp_handler.setFormatter(worker_formatter)
-            # logger.addHandler(rp_handler)
+            if use_rp_logger:
+                rp_handler = RPLogHandler(request.node.config.py_test_service)
+                rp_handler.setFormatter(worker_formatter)
+                # logger.addHandler(rp_handler)
 
 
 def pytest_runtest_logstart(nodeid, location):
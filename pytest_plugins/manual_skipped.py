@@ -8,25 +8,23 @@ def pytest_configure(config):
     config.addinivalue_line('markers', 'stubbed: Tests that are not automated yet or manual only.')
 
 
-def pytest_collection_modifyitems(session, config, items):
+def pytest_collection_stages(pipeline, config):
     """Remove/Include stubbed tests from collection based on CLI option"""
     opt_passed = config.getvalue('mark_manuals_passed')
     opt_skipped = config.getvalue('mark_manuals_skipped')
     # TODO turn this into a flag or a choice option, this logic is just silly.
     mark_skipped = opt_skipped and not opt_passed
     include_stubbed = config.getvalue('include_stubbed')
-    selected = []
-    deselected = []
-    for item in items:
-        stub_marked = item.get_closest_marker(name='stubbed')
+
+    def select(item, index):
+        stub_marked = index.closest('stubbed')
         # The test case is stubbed, and --include-stubbed was passed, include in collection
         if stub_marked and include_stubbed:
-            selected.append(item)
             # enforce skip/pass behavior by marking skip
             if mark_skipped:
                 logger.debug(f'Marking collected stubbed test "{item.nodeid}" to skip')
-                item.add_marker(marker=pytest.mark.skip(reason='This is a Manual test!'))
-            continue
+                index.add_marker(pytest.mark.skip(reason='This is a Manual test!'))
+            return True
 
         # The test case is stubbed, but --include-stubbed was NOT passed, deselect the item
         if stub_marked and not include_stubbed:
@@ -34,14 +32,12 @@ def pytest_collection_modifyitems(session, config, items):
                 f'Deselecting stubbed test {item.nodeid}, '
                 'use --include-stubbed to include in collection'
             )
-            deselected.append(item)
-            continue
+            return False
 
         # Its a non-stubbed item, this hook doesn't apply
-        selected.append(item)
+        return True
 
-    config.hook.pytest_deselected(items=deselected)
-    items[:] = selected
+    pipeline.add('manual_skipped', select)
 
 
 def pytest_addoption(parser):
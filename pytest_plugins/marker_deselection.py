@@ -1,7 +1,5 @@
 import pytest
 
-from robottelo.logging import collection_logger as logger
-
 non_satCI_components = ['Virt-whoConfigurePlugin']
 
 
@@ -29,7 +27,7 @@ def pytest_addoption(parser):
 
 
 @pytest.hookimpl(tryfirst=True)
-def pytest_collection_modifyitems(items, config):
+def pytest_collection_stages(pipeline, config):
     """
     Collects and modifies tests collection based on pytest option to deselect tests for new infra
     """
@@ -39,43 +37,29 @@ def pytest_collection_modifyitems(items, config):
     include_vlan = config.getoption('include_vlan_networking', False)
     include_non_satci_tests = config.getvalue('include_non_satci_tests').split(',')
 
-    selected = []
-    deselected = []
     # Cloud Provisioning Test can be run on new pipeline
-    for item in items:
+    def select(item, index):
         # Include/Exclude tests those are not part of SatQE CI
-        item_component = item.get_closest_marker('component')
+        item_component = index.closest('component')
         if item_component and (item_component.args[0] in non_satCI_components):
-            if item_component.args[0] in include_non_satci_tests or item.nodeid.startswith(
+            return item_component.args[0] in include_non_satci_tests or item.nodeid.startswith(
                 'tests/upgrades/'
-            ):
-                selected.append(item)
-            else:
-                deselected.append(item)
-            continue
+            )
 
-        item_marks = [m.name for m in item.iter_markers()]
         # Include / Exclude On Premises Provisioning Tests
-        if 'on_premises_provisioning' in item_marks:
-            selected.append(item) if include_onprem_provision else deselected.append(item)
-            continue
+        if 'on_premises_provisioning' in index.names:
+            return include_onprem_provision
         # Include / Exclude External Libvirt based Tests
-        if 'libvirt_discovery' in item_marks:
-            selected.append(item) if include_libvirt else deselected.append(item)
-            continue
+        if 'libvirt_discovery' in index.names:
+            return include_libvirt
         # Include / Exclude External Auth based Tests
-        if 'external_auth' in item_marks:
-            selected.append(item) if include_eauth else deselected.append(item)
-            continue
+        if 'external_auth' in index.names:
+            return include_eauth
         # Include / Exclude VLAN networking based based Tests
-        if 'vlan_networking' in item_marks:
-            selected.append(item) if include_vlan else deselected.append(item)
-            continue
+        if 'vlan_networking' in index.names:
+            return include_vlan
         # This Plugin does not applies to this test
-        selected.append(item)
-    logger.debug(
-        f'Selected {len(selected)} and deselected {len(deselected)} '
-        'tests based on auto un-collectable markers and pytest options.'
-    )
-    items[:] = selected or items
-    config.hook.pytest_deselected(items=deselected)
+        return True
+
+    # no test is deselected when none would be selected
+    pipeline.add('marker_deselection', select, keep_all_if_none_selected=True)
@@ -1,5 +1,5 @@
 import datetime
-import inspect
+import functools
 import re
 
 import pytest
@@ -9,11 +9,11 @@ from robottelo.hosts import get_sat_rhel_version
 from robottelo.logging import collection_logger as logger
 from robottelo.utils import parse_comma_separated_list
 from robottelo.utils.issue_handlers.jira import are_any_jira_open
+from robottelo.utils.version_probe import version_probe
 
 FMT_XUNIT_TIME = '%Y-%m-%dT%H:%M:%S'
 IMPORTANCE_LEVELS = []
-selected = []
-deselected = []
+VERSION_PROBE_STARTED = pytest.StashKey()
 
 
 def pytest_addoption(parser):
@@ -63,6 +63,17 @@ def pytest_configure(config):
         config.addinivalue_line("markers", marker)
 
 
+def pytest_itemcollected(item):
+    """Probe the Satellite versions while the other tests are collected, once a test
+    using the Satellite is, unless only collecting"""
+    config = item.config
+    if config.option.collectonly or config.stash.get(VERSION_PROBE_STARTED, False):
+        return
+    if '_default_sat' in getattr(item, 'fixturenames', ()):
+        config.stash[VERSION_PROBE_STARTED] = True
+        version_probe().start()
+
+
 component_regex = re.compile(
     # To match :CaseComponent: FooBar
     r'\s*:CaseComponent:\s*(?P<component>\S*)',
@@ -130,11 +141,10 @@ def handle_blocked_by(item, blocked_by_marker, blocked_by):
 
 def log_and_deselect(item, option):
     logger.debug(f'Deselected test {item.nodeid} due to "{option}" pytest option.')
-    deselected.append(item)
 
 
 @pytest.hookimpl(tryfirst=True)
-def pytest_collection_modifyitems(items, config):
+def pytest_collection_stages(pipeline, config):
     """Add markers and user_properties for testimony token metadata
 
     user_properties is used by the junit plugin, and thus by many test report systems
@@ -147,8 +157,8 @@ def pytest_collection_modifyitems(items, config):
     Control test collection for custom options related to testimony metadata
 
     """
-    # get RHEL version of the satellite
-    rhel_version = get_sat_rhel_version().base_version
+    # get RHEL version of the satellite, for the first test not a unit test
+    rhel_version = functools.cache(lambda: get_sat_rhel_version().base_version)
     sat_version = settings.server.version.get('release')
     snap_version = settings.server.version.get('snap', '')
 
@@ -160,54 +170,49 @@ def pytest_collection_modifyitems(items, config):
     verifies_issues = config.getoption('verifies_issues')
     blocked_by = config.getoption('blocked_by')
     logger.info('Processing test items to add testimony token markers')
-    for item in items:
+
+    def select(item, index):
         item.user_properties.append(
             ("start_time", datetime.datetime.utcnow().strftime(FMT_XUNIT_TIME))
         )
         if item.nodeid.startswith('tests/robottelo/') and 'test_junit' not in item.nodeid:
             # Unit test, no testimony markers
-            continue
+            return True
 
         # apply the marks for importance, component, and team
         # Find matches from docstrings starting at smallest scope
-        item_docstrings = [
-            d
-            for d in map(inspect.getdoc, (item.function, getattr(item, 'cls', None), item.module))
-            if d is not None
-        ]
         blocked_by_marks_to_add = []
         verifies_marks_to_add = []
-        for docstring in item_docstrings:
-            item_mark_names = [m.name for m in item.iter_markers()]
+        for docstring in index.docstrings:
             # Add marker starting at smallest docstring scope
             # only add the mark if it hasn't already been applied at a lower scope
             doc_component = component_regex.findall(docstring)
-            if doc_component and 'component' not in item_mark_names:
-                item.add_marker(pytest.mark.component(doc_component[0].lower()))
+            if doc_component and 'component' not in index.names:
+                index.add_marker(pytest.mark.component(doc_component[0].lower()))
             doc_importance = importance_regex.findall(docstring)
-            if doc_importance and 'importance' not in item_mark_names:
-                item.add_marker(pytest.mark.importance(doc_importance[0].lower()))
+            if doc_importance and 'importance' not in index.names:
+                index.add_marker(pytest.mark.importance(doc_importance[0].lower()))
             doc_team = team_regex.findall(docstring)
-            if doc_team and 'team' not in item_mark_names:
-                item.add_marker(pytest.mark.team(doc_team[0].lower()))
+            if doc_team and 'team' not in index.names:
+                index.add_marker(pytest.mark.team(doc_team[0].lower()))
             doc_verifies = verifies_regex.findall(docstring)
-            if doc_verifies and 'verifies_issues' not in item_mark_names:
+            if doc_verifies and 'verifies_issues' not in index.names:
                 verifies_marks_to_add.extend(str(b.strip()) for b in doc_verifies[-1].split(','))
             doc_blocked_by = blocked_by_regex.findall(docstring)
-            if doc_blocked_by and 'blocked_by' not in item_mark_names:
+            if doc_blocked_by and 'blocked_by' not in index.names:
                 blocked_by_marks_to_add.extend(
                     str(b.strip()) for b in doc_blocked_by[-1].split(',')
                 )
         if blocked_by_marks_to_add:
-            item.add_marker(pytest.mark.blocked_by(blocked_by_marks_to_add))
+            index.add_marker(pytest.mark.blocked_by(blocked_by_marks_to_add))
         if verifies_marks_to_add:
-            item.add_marker(pytest.mark.verifies_issues(verifies_marks_to_add))
+            index.add_marker(pytest.mark.verifies_issues(verifies_marks_to_add))
 
         # add markers as user_properties so they are recorded in XML properties of the report
         # pytest-ibutsu will include user_properties dict in testresult metadata
         markers_prop_data = []
         exclude_markers = ['parametrize', 'skipif', 'usefixtures', 'skip_if_not_set']
-        for marker in item.iter_markers():
+        for marker in index.iter_markers():
             proprty = marker.name
             if proprty in exclude_markers:
                 continue
@@ -220,7 +225,7 @@ def pytest_collection_modifyitems(items, config):
         item.user_properties.append(("markers", ", ".join(markers_prop_data)))
 
         # Version specific user properties
-        item.user_properties.append(("BaseOS", rhel_version))
+        item.user_properties.append(("BaseOS", rhel_version()))
         item.user_properties.append(("SatelliteVersion", sat_version))
         item.user_properties.append(("SnapVersion", snap_version))
 
@@ -233,42 +238,37 @@ def pytest_collection_modifyitems(items, config):
 
             # https://github.com/pytest-dev/pytest/issues/1373  Will make this way easier
             # testimony requires both importance and component, this will blow up if its forgotten
-            importance_marker = item.get_closest_marker('importance').args[0]
+            importance_marker = index.closest('importance').args[0]
             if importance and importance_marker not in importance:
                 logger.debug(
                     f'Deselected test {item.nodeid} due to "--importance {importance}",'
                     f'test has importance mark: {importance_marker}'
                 )
-                deselected.append(item)
-                continue
-            component_marker = item.get_closest_marker('component').args[0]
+                return False
+            component_marker = index.closest('component').args[0]
             if component and component_marker not in component:
                 logger.debug(
                     f'Deselected test {item.nodeid} due to "--component {component}",'
                     f'test has component mark: {component_marker}'
                 )
-                deselected.append(item)
-                continue
-            team_marker = item.get_closest_marker('team').args[0]
+                return False
+            team_marker = index.closest('team').args[0]
             if team and team_marker not in team:
                 logger.debug(
                     f'Deselected test {item.nodeid} due to "--team {team}",'
                     f'test has team mark: {team_marker}'
                 )
-                deselected.append(item)
-                continue
+                return False
 
         if verifies_issues or blocked_by:
             # Filter tests based on --verifies-issues and --blocked-by pytest options
             # and Verifies and BlockedBy testimony tokens.
-            verifies_marker = item.get_closest_marker('verifies_issues', False)
-            blocked_by_marker = item.get_closest_marker('blocked_by', False)
+            verifies_marker = index.closest('verifies_issues', False)
+            blocked_by_marker = index.closest('blocked_by', False)
             if not handle_verification_issues(item, verifies_marker, verifies_issues):
-                continue
+                return False
             if not handle_blocked_by(item, blocked_by_marker, blocked_by):
-                continue
-        selected.append(item)
+                return False
+        return True
 
-    # selected will be empty if no filter option was passed, defaulting to full items list
-    items[:] = selected if deselected else items
-    config.hook.pytest_deselected(items=deselected)
+    pipeline.add('metadata_markers', select)
@@ -67,7 +67,7 @@ def pytest_addoption(parser):
 
 
 @pytest.hookimpl(tryfirst=True)
-def pytest_collection_modifyitems(items, config):
+def pytest_collection_stages(pipeline, config):
     """
     Collects and modifies test collection based on the pytest options to select the tests marked as
     failed/skipped and user-specific tests in Report Portal
@@ -84,71 +84,67 @@ def pytest_collection_modifyitems(items, config):
     ref_launch_uuid = config.getoption('rp_reference_launch_uuid', None) or config.getoption(
         'rp_rerun_of', None
     )
-    tests = []
     if not any([fail_args, skip_arg, user_arg]):
         return
-    rp = ReportPortal(rp_url=rp_url, rp_api_key=rp_api_key, rp_project=rp_project)
-
-    if ref_launch_uuid:
-        logger.info(f'Fetching A reference Report Portal launch {ref_launch_uuid}')
-        ref_launches = rp.get_launches(uuid=ref_launch_uuid)
-        if not ref_launches:
-            raise LaunchError(
-                f'Provided reference launch {ref_launch_uuid} was not found or is not finished'
-            )
-    else:
-        sat_release = get_sat_version().base_version
-        sat_snap = settings.server.version.get('snap', '')
-        if not all([sat_release, sat_snap, (len(sat_release.split('.')) == 3)]):
-            raise pytest.UsageError(
-                '--failed|skipped-only requires a reference launch id or'
-                ' a full satellite version (x.y.z-a.b) to be provided.'
-                f' sat_release: {sat_release}, sat_snap: {sat_snap} were provided instead'
-            )
-        sat_version = f'{sat_release}-{sat_snap}'
-        logger.info(
-            f'Fetching A reference Report Portal launch by Satellite version: {sat_version}'
-        )
+    test_names = set()
 
-        ref_launches = rp.get_launches(name=rp_launch_name, sat_version=sat_version)
-        if not ref_launches:
-            raise LaunchError(
-                f'No suitable Report portal launches for name: {rp_launch_name}'
-                f' and version: {sat_version} found'
-            )
+    def prepare(items):
+        rp = ReportPortal(rp_url=rp_url, rp_api_key=rp_api_key, rp_project=rp_project)
 
-    test_args = {}
-    test_args.setdefault('status', list())
-    if skip_arg:
-        test_args['status'].append('SKIPPED')
-    if fail_args:
-        test_args['status'].append('FAILED')
-        if fail_args != 'all':
-            defect_types = fail_args.split(',')
-            allowed_args = [*rp.defect_types.keys()]
-            if not set(defect_types).issubset(set(allowed_args)):
+        if ref_launch_uuid:
+            logger.info(f'Fetching A reference Report Portal launch {ref_launch_uuid}')
+            ref_launches = rp.get_launches(uuid=ref_launch_uuid)
+            if not ref_launches:
+                raise LaunchError(
+                    f'Provided reference launch {ref_launch_uuid} was not found or is not finished'
+                )
+        else:
+            sat_release = get_sat_version().base_version
+            sat_snap = settings.server.version.get('snap', '')
+            if not all([sat_release, sat_snap, (len(sat_release.split('.')) == 3)]):
                 raise pytest.UsageError(
-                    'Incorrect values to pytest option \'--only-failed\' are provided as '
-                    f'\'{fail_args}\'. It should be none/one/mix of {allowed_args}'
+                    '--failed|skipped-only requires a reference launch id or'
+                    ' a full satellite version (x.y.z-a.b) to be provided.'
+                    f' sat_release: {sat_release}, sat_snap: {sat_snap} were provided instead'
                 )
-            test_args['defect_types'] = defect_types
-    if user_arg:
-        test_args['user'] = user_arg
-    test_args['paths'] = config.args
-    for ref_launch in ref_launches:
-        _validate_launch(ref_launch)
-        tests.extend(rp.get_tests(launch=ref_launch, **test_args))
+            sat_version = f'{sat_release}-{sat_snap}'
+            logger.info(
+                f'Fetching A reference Report Portal launch by Satellite version: {sat_version}'
+            )
+
+            ref_launches = rp.get_launches(name=rp_launch_name, sat_version=sat_version)
+            if not ref_launches:
+                raise LaunchError(
+                    f'No suitable Report portal launches for name: {rp_launch_name}'
+                    f' and version: {sat_version} found'
+                )
+
+        test_args = {}
+        test_args.setdefault('status', list())
+        if skip_arg:
+            test_args['status'].append('SKIPPED')
+        if fail_args:
+            test_args['status'].append('FAILED')
+            if fail_args != 'all':
+                defect_types = fail_args.split(',')
+                allowed_args = [*rp.defect_types.keys()]
+                if not set(defect_types).issubset(set(allowed_args)):
+                    raise pytest.UsageError(
+                        'Incorrect values to pytest option \'--only-failed\' are provided as '
+                        f'\'{fail_args}\'. It should be none/one/mix of {allowed_args}'
+                    )
+                test_args['defect_types'] = defect_types
+        if user_arg:
+            test_args['user'] = user_arg
+        test_args['paths'] = config.args
+        for ref_launch in ref_launches:
+            _validate_launch(ref_launch)
+            test_names.update(
+                t['name'].replace('::', '.') for t in rp.get_tests(launch=ref_launch, **test_args)
+            )
+
     # remove inapplicable tests from the current test collection
-    deselected = [
-        i
-        for i in items
-        if f'{i.location[0]}.{i.location[2]}'.replace('::', '.')
-        not in [t['name'].replace('::', '.') for t in tests]
-    ]
-    selected = list(set(items) - set(deselected))
-    logger.debug(
-        f'Selected {len(selected)} and deselected {len(deselected)} tests based on latest/given-/ '
-        'launch test results.'
-    )
-    config.hook.pytest_deselected(items=deselected)
-    items[:] = selected
+    def select(item, index):
+        return f'{item.location[0]}.{item.location[2]}'.replace('::', '.') in test_names
+
+    pipeline.add('rerun_rp', select, prepare=prepare)
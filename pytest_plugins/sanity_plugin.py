@@ -18,45 +18,45 @@ def pytest_configure(config):
     )
 
 
-def pytest_collection_modifyitems(session, items, config):
+def pytest_collection_stages(pipeline, config):
     if 'sanity' not in config.option.markexpr:
         return
 
-    selected = []
-    deselected = []
-    installer_test = None
+    installer_tests = []
 
-    for item in items:
-        if item.get_closest_marker('build_sanity'):
+    def select(item, index):
+        if index.closest('build_sanity'):
             # Identify the installer sanity test to run first
-            if not installer_test and item.get_closest_marker('first_sanity'):
-                installer_test = item
-                deselected.append(item)
-                continue
+            if not installer_tests and index.closest('first_sanity'):
+                installer_tests.append(item)
+                return True
             # Test parameterization disablement for sanity
             # Remove Puppet based tests
-            if 'session_puppet_enabled_sat' in item.fixturenames and 'puppet' in item.name:
-                deselected.append(item)
-                continue
+            if 'session_puppet_enabled_sat' in index.fixtures and 'puppet' in item.name:
+                return False
             # Remove capsule tests
-            if 'sat_maintain' in item.fixturenames and 'capsule' in item.name:
-                deselected.append(item)
-                continue
+            if 'sat_maintain' in index.fixtures and 'capsule' in item.name:
+                return False
             # Remove parametrization from organization test
             if (
                 'test_positive_create_with_name_and_description' in item.name
                 and 'alphanumeric' not in item.name
             ):
-                deselected.append(item)
-                continue
+                return False
         # Else select
-        selected.append(item)
-
-    # Append the installer test first to run
-    if not installer_test:
-        raise ConfigurationException(
-            'The installer test is not configured to base the sanity testing on!'
-        )
-    selected.insert(0, installer_test)
-    config.hook.pytest_deselected(items=deselected)
-    items[:] = selected
+        return True
+
+    def finish(selected):
+        # Move the installer test first to run
+        if not installer_tests:
+            raise ConfigurationException(
+                'The installer test is not configured to base the sanity testing on!'
+            )
+        if installer_tests[0] in selected:
+            selected.remove(installer_tests[0])
+            selected.insert(0, installer_tests[0])
+            # The installer test is reported deselected, while it runs first, as it
+            # always was
+            config.hook.pytest_deselected(items=installer_tests[:1])
+
+    pipeline.add('sanity', select, finish=finish)
@@ -1,3 +1,6 @@
+import queue
+import threading
+import time
 from urllib.parse import urlparse
 
 from box import Box
@@ -16,15 +19,128 @@ test_directories = [
 ]
 
 
+VIDEOS_DIR = '/var/www/html/videos'
+
+
+class VideoCleanupWorker:
+    """Background worker removing the recorded videos of UI sessions from the grid host
+
+    Session ids are queued from the test teardown and deleted in batches, one ``rm -rf``
+    command per ``batch_size`` sessions or ``interval`` seconds, over a single persistent
+    connection to the grid host.
+    """
+
+    def __init__(self, hostname, batch_size=20, interval=30):
+        self.hostname = hostname
+        self.batch_size = batch_size
+        self.interval = interval
+        self.queue = queue.Queue()
+        self._host = None
+        self._lock = threading.Lock()
+        self._latencies = []
+        self._stats = Box(queued=0, cleaned=0, failed=0, batches=0, max_queue_depth=0)
+        self._thread = threading.Thread(target=self._run, name='video-cleanup', daemon=True)
+        self._thread.start()
+
+    @property
+    def queue_depth(self):
+        return self.queue.qsize()
+
+    @property
+    def metrics(self):
+        """Queue depth and cleanup latency, in seconds from queueing to deletion"""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            metrics = Box(self._stats, queue_depth=self.queue_depth)
+        metrics.latency_avg = sum(latencies) / len(latencies) if latencies else 0
+        metrics.latency_max = latencies[-1] if latencies else 0
+        return metrics
+
+    def put(self, session_id):
+        self.queue.put((session_id, time.monotonic()))
+        with self._lock:
+            self._stats.queued += 1
+            self._stats.max_queue_depth = max(self._stats.max_queue_depth, self.queue_depth)
+
+    def stop(self, timeout=None):
+        """Flush the queued sessions and stop the worker, waiting ``timeout`` seconds at
+        most, the sessions not cleaned by then being left on the grid host"""
+        self.queue.put(None)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning(
+                f'video cleanup not finished in {timeout}s, '
+                f'{self.queue_depth} queued sessions left'
+            )
+            return
+        if self._host:
+            self._host.close()
+
+    def _next_batch(self):
+        """Block for the first session, then collect more until the batch is full or
+        the interval elapses. Return the batch and whether the worker was stopped"""
+        batch = []
+        item = self.queue.get()
+        deadline = time.monotonic() + self.interval
+        while item is not None:
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                return batch, False
+            try:
+                item = self.queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                return batch, False
+        return batch, True
+
+    def _run(self):
+        stopped = False
+        while not stopped:
+            batch, stopped = self._next_batch()
+            if batch:
+                self._clean(batch)
+
+    def _clean(self, batch):
+        session_ids = [session_id for session_id, _ in batch]
+        paths = ' '.join(f'{VIDEOS_DIR}/{session_id}' for session_id in session_ids)
+        try:
+            if self._host is None:
+                self._host = Host(hostname=self.hostname)
+            cleaned = self._host.execute(f'rm -rf {paths}').status == 0
+        except Exception as err:
+            logger.warning(f'video cleanup for sessions {session_ids} failed: {err}')
+            # reconnect on the next batch
+            self._host = None
+            cleaned = False
+        done = time.monotonic()
+        with self._lock:
+            self._stats.batches += 1
+            self._stats['cleaned' if cleaned else 'failed'] += len(batch)
+            self._latencies.extend(done - queued for _, queued in batch)
+        if cleaned:
+            logger.info(f'video cleanup for sessions {session_ids} is complete')
+
+
+_cleanup_worker = None
+
+
+def get_cleanup_worker():
+    """Return the video cleanup worker of this process, starting it on first use"""
+    global _cleanup_worker
+    if _cleanup_worker is None:
+        _cleanup_worker = VideoCleanupWorker(
+            hostname=urlparse(url=settings.ui.grid_url).hostname,
+            batch_size=settings.ui.video_cleanup_batch_size,
+            interval=settings.ui.video_cleanup_interval,
+        )
+    return _cleanup_worker
+
+
 def _clean_video(session_id, test):
     if settings.ui.record_video:
-        logger.info(f"cleaning up video files for session: {session_id} and test: {test}")
+        logger.info(f"queueing video files cleanup for session: {session_id} and test: {test}")
 
         if settings.ui.grid_url and session_id:
-            grid = urlparse(url=settings.ui.grid_url)
-            infra_grid = Host(hostname=grid.hostname)
-            infra_grid.execute(command=f'rm -rf /var/www/html/videos/{session_id}')
-            logger.info(f"video cleanup for session {session_id} is complete")
+            get_cleanup_worker().put(session_id)
         else:
             logger.warning("missing grid_url or session_id. unable to clean video files.")
 
@@ -75,3 +191,17 @@ def pytest_runtest_makereport(item):
                 )
                 session_id = session_id_tuple[1] if session_id_tuple else None
                 _clean_video(session_id, item.nodeid)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Flush the pending video cleanups and log the cleanup metrics"""
+    global _cleanup_worker
+    if _cleanup_worker is not None:
+        _cleanup_worker.stop(timeout=settings.ui.video_cleanup_timeout)
+        metrics = _cleanup_worker.metrics
+        logger.info(
+            f'video cleanup: {metrics.cleaned} sessions cleaned and {metrics.failed} failed '
+            f'in {metrics.batches} batches, max queue depth {metrics.max_queue_depth}, '
+            f'latency avg {metrics.latency_avg:.1f}s max {metrics.latency_max:.1f}s'
+        )
+        _cleanup_worker = None
@@ -10,6 +10,7 @@ from nailgun.config import ServerConfig
 
 from robottelo.config.validators import VALIDATORS
 from robottelo.logging import logger, robottelo_root_dir
+from robottelo.utils.vault import VaultSettings, validate_settings
 
 if not os.getenv('ROBOTTELO_DIR'):
     # dynaconf robottelo file uses ROBOTELLO_DIR for screenshots
@@ -34,11 +35,14 @@ def get_settings():
             envless_mode=True,
             lowercase_read=True,
             load_dotenv=True,
+            # vault secrets are loaded on the first access of a missing key
+            _wrapper_class=VaultSettings,
         )
         settings.validators.register(**VALIDATORS)
 
         try:
-            settings.validators.validate()
+            # the settings referring to vault secrets are validated once they are loaded
+            validate_settings(settings)
         except ValidationError as err:
             if settings.robottelo.settings.get('ignore_validation_errors'):
                 logger.warning(f'Dynaconf validation failed with\n{err}')
@@ -16,8 +16,11 @@ VALIDATORS = dict(
         Validator('server.version.source', must_exist=True),
         Validator('server.version.rhel_version', must_exist=True, cast=str),
         Validator(
-            'server.xdist_behavior', must_exist=True, is_in=['run-on-one', 'balance', 'on-demand']
+            'server.xdist_behavior',
+            must_exist=True,
+            is_in=['run-on-one', 'balance', 'on-demand', 'load-aware'],
         ),
+        Validator('server.load_aware_weights', default={}, is_type_of=dict),
         Validator('server.auto_checkin', default=False, is_type_of=bool),
         (
             Validator('server.ssh_key', must_exist=True)
@@ -45,6 +48,7 @@ VALIDATORS = dict(
     ],
     content_host=[
         Validator('content_host.default_rhel_version', must_exist=True),
+        Validator('content_host.reuse_hosts', is_type_of=bool, default=False),
     ],
     subscription=[
         Validator('subscription.rhn_username', must_exist=True),
@@ -72,7 +76,10 @@ VALIDATORS = dict(
         ),
         Validator('azurerm.azure_region', is_in=AZURERM_VALID_REGIONS),
     ],
-    broker=[Validator('broker.broker_directory', default='.')],
+    broker=[
+        Validator('broker.broker_directory', default='.'),
+        Validator('broker.prefetch_quota', is_type_of=int, default=0),
+    ],
     bugzilla=[
         Validator('bugzilla.url', default='https://bugzilla.redhat.com'),
         Validator('bugzilla.api_key', must_exist=True),
@@ -184,6 +191,9 @@ VALIDATORS = dict(
         Validator('jira.comment_visibility', default="Red Hat Employee"),
         Validator('jira.enable_comment', default=False),
         Validator('jira.issue_status', default=["Review", "Release Pending"]),
+        Validator('jira.comment_workers', default=8, is_type_of=int),
+        Validator('jira.comment_rate_limit', default=5),
+        Validator('jira.comment_retries', default=3, is_type_of=int),
     ],
     ldap=[
         Validator(
@@ -316,6 +326,9 @@ VALIDATORS = dict(
     ],
     robottelo=[
         Validator('robottelo.settings.ignore_validation_errors', is_type_of=bool, default=False),
+        Validator('robottelo.version_probe.ttl', is_type_of=int, default=3600),
+        Validator('robottelo.version_probe.timeout', is_type_of=int, default=10),
+        Validator('robottelo.version_probe.offline', is_type_of=bool, default=False),
     ],
     shared_function=[
         Validator('shared_function.storage', is_in=('file', 'redis'), default='file'),
@@ -329,6 +342,11 @@ VALIDATORS = dict(
         Validator('shared_function.call_retries', default=2),
         Validator('shared_function.redis_password', default=None),
     ],
+    ui=[
+        Validator('ui.video_cleanup_batch_size', default=20, is_type_of=int),
+        Validator('ui.video_cleanup_interval', default=30),
+        Validator('ui.video_cleanup_timeout', default=300),
+    ],
     upgrade=[
         Validator('upgrade.rhev_cap_host', must_exist=False)
         | Validator('upgrade.capsule_hostname', must_exist=False),
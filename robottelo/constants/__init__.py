@@ -864,6 +864,8 @@ PULP_ARTIFACT_DIR = '/var/lib/pulp/media/artifact/'
 PULP_EXPORT_DIR = '/var/lib/pulp/exports/'
 PULP_IMPORT_DIR = '/var/lib/pulp/imports/'
 EXPORT_LIBRARY_NAME = 'Export-Library'
+# python interpreter of the hosts, for scripts run remotely
+REMOTE_PYTHON = '$(command -v python3 || echo /usr/libexec/platform-python)'
 
 PUPPET_COMMON_INSTALLER_OPTS = {
     'foreman-proxy-puppetca': 'true',
@@ -1,8 +1,15 @@
 """Miscellaneous content helper functions"""
 
+import bz2
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+import lzma
 import os
 import re
+import threading
+from xml.etree import ElementTree
 
+from box import Box
 import requests
 
 from robottelo import ssh
@@ -33,6 +40,161 @@ def get_repo_files(repo_path, extension='rpm', hostname=None):
     return sorted(repo_file for repo_file in result.stdout.splitlines() if repo_file)
 
 
+REPOMD_NS = {
+    'repo': 'http://linux.duke.edu/metadata/repo',
+    'common': 'http://linux.duke.edu/metadata/common',
+}
+METADATA_OPENERS = {
+    '.gz': gzip.open,
+    '.xz': lzma.open,
+    '.bz2': bz2.open,
+    '.xml': lambda stream: stream,
+}
+
+
+def _iter_primary_packages(stream):
+    """Parse the primary.xml stream incrementally, yielding its rpm packages"""
+    package_tag = f'{{{REPOMD_NS["common"]}}}package'
+    root = None
+    for event, element in ElementTree.iterparse(stream, events=('start', 'end')):
+        if root is None:
+            root = element
+        if event != 'end' or element.tag != package_tag:
+            continue
+        if element.get('type') == 'rpm':
+            version = element.find('common:version', REPOMD_NS)
+            checksum = element.find('common:checksum', REPOMD_NS)
+            package = Box(
+                name=element.findtext('common:name', namespaces=REPOMD_NS),
+                arch=element.findtext('common:arch', namespaces=REPOMD_NS),
+                epoch=version.get('epoch', '0'),
+                version=version.get('ver'),
+                release=version.get('rel'),
+                checksum=checksum.text,
+                checksum_type=checksum.get('type'),
+                location=element.find('common:location', REPOMD_NS).get('href'),
+            )
+            epoch = '' if package.epoch == '0' else f'{package.epoch}:'
+            package.nevra = (
+                f'{package.name}-{epoch}{package.version}-{package.release}.{package.arch}'
+            )
+            package.filename = os.path.basename(package.location)
+            yield package
+        root.clear()
+
+
+class RepoInspector:
+    """Inspects the repositories published at some URL.
+
+    Packages are listed from the repository metadata, the primary.xml being
+    streamed and parsed incrementally, and the parsed list is reused as long as
+    the repomd.xml is unchanged. Repositories without metadata are crawled
+    through their html index pages concurrently. Responses are cached and
+    revalidated with their ETag or Last-Modified headers on repeated lookups.
+    """
+
+    def __init__(self, workers=8, verify=False):
+        self.workers = workers
+        self.session = requests.Session()
+        self.session.verify = verify
+        adapter = requests.adapters.HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._responses = {}
+        self._packages = {}
+        self._lock = threading.Lock()
+
+    def fetch(self, url):
+        """Return the text of the url, revalidating its cached copy if any"""
+        with self._lock:
+            cached = self._responses.get(url)
+        headers = {}
+        if cached and cached.etag:
+            headers['If-None-Match'] = cached.etag
+        if cached and cached.last_modified:
+            headers['If-Modified-Since'] = cached.last_modified
+        result = self.session.get(url, headers=headers)
+        if result.status_code == 304 and cached:
+            return cached.text
+        if result.status_code != 200:
+            raise requests.HTTPError(f'{url} is not accessible')
+        etag, last_modified = result.headers.get('ETag'), result.headers.get('Last-Modified')
+        if etag or last_modified:
+            with self._lock:
+                self._responses[url] = Box(etag=etag, last_modified=last_modified, text=result.text)
+        return result.text
+
+    def repomd(self, repo_url):
+        """Return the content of the repomd file of a repository"""
+        return self.fetch(f'{repo_url.rstrip("/")}/repodata/repomd.xml')
+
+    def packages(self, repo_url):
+        """Return the rpm packages listed in the metadata of a repository.
+
+        :param repo_url: the 'Published_At' link of a repo
+        :return: list of Boxes with the name, epoch, version, release, arch, nevra,
+            checksum, checksum_type, location and filename of the packages, ``None``
+            when the repository has no readable metadata
+        """
+        try:
+            repomd = ElementTree.fromstring(self.repomd(repo_url))
+        except requests.HTTPError:
+            return None
+        primary = repomd.find("repo:data[@type='primary']", REPOMD_NS)
+        if primary is None:
+            return None
+        location = primary.find('repo:location', REPOMD_NS).get('href')
+        key = (repo_url, primary.findtext('repo:checksum', namespaces=REPOMD_NS))
+        with self._lock:
+            if key in self._packages:
+                return self._packages[key]
+        opener = METADATA_OPENERS.get(os.path.splitext(location)[1])
+        if opener is None:
+            return None
+        with self.session.get(f'{repo_url.rstrip("/")}/{location}', stream=True) as result:
+            if result.status_code != 200:
+                return None
+            result.raw.decode_content = True
+            packages = list(_iter_primary_packages(opener(result.raw)))
+        with self._lock:
+            self._packages[key] = packages
+        return packages
+
+    def _index_links(self, url):
+        return re.findall(r'(?<=href=")(?!\.\.).*?(?=">)', self.fetch(url))
+
+    def crawl_files_urls(self, url, extension='rpm'):
+        """Return the URLs of the repo files listed by the html index pages, the
+        ``Packages/`` subdirectories being crawled concurrently.
+        """
+        links = self._index_links(url)
+        if 'Packages/' not in links:
+            return sorted(f'{url}{link}' for link in links if extension in link)
+        subs = [
+            f'{url}Packages/{sub}' for sub in self._index_links(f'{url}Packages/') if '/' in sub
+        ]
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            sub_links = executor.map(self._index_links, subs)
+            return sorted(
+                f'{sub}{link}'
+                for sub, links in zip(subs, sub_links, strict=True)
+                for link in links
+                if extension in link
+            )
+
+    def files_urls(self, url, extension='rpm'):
+        """Return the URLs of the repo files, from the metadata for rpms"""
+        if not url.endswith('/'):
+            url += '/'
+        packages = self.packages(url) if extension == 'rpm' else None
+        if packages is None:
+            return self.crawl_files_urls(url, extension)
+        return sorted(f'{url}{package.location}' for package in packages)
+
+
+repo_inspector = RepoInspector()
+
+
 def get_repo_files_urls_by_url(url, extension='rpm'):
     """Returns a list of URLs of repo files (for example rpms) in a specific repository
     published at some URL.
@@ -40,23 +202,7 @@ def get_repo_files_urls_by_url(url, extension='rpm'):
     :param extension: extension of searched files. Defaults to 'rpm'
     :return:  list representing package URLs
     """
-    if not url.endswith('/'):
-        url += '/'
-
-    result = requests.get(url, verify=False)
-    if result.status_code != 200:
-        raise requests.HTTPError(f'{url} is not accessible')
-
-    links = re.findall(r'(?<=href=")(?!\.\.).*?(?=">)', result.text)
-    if 'Packages/' not in links:
-        files = sorted(line for line in links if extension in line)
-        return [f'{url}{file}' for file in files]
-
-    files = []
-    subs = get_repo_files_urls_by_url(f'{url}Packages/', extension='/')
-    for sub in subs:
-        files.extend(get_repo_files_urls_by_url(sub, extension))
-    return sorted(files)
+    return repo_inspector.files_urls(url, extension)
 
 
 def get_repo_files_by_url(url, extension='rpm'):
@@ -75,12 +221,7 @@ def get_repomd(repo_url):
     :param repo_url: the 'Published_At' link of a repo
     :return: string with repomd content
     """
-    repomd_path = 'repodata/repomd.xml'
-    result = requests.get(f'{repo_url}/{repomd_path}', verify=False)
-    if result.status_code != 200:
-        raise requests.HTTPError(f'{repo_url}/{repomd_path} is not accessible')
-
-    return result.text
+    return repo_inspector.repomd(repo_url)
 
 
 def get_repomd_revision(repo_url):
@@ -3,6 +3,7 @@ It is not meant to be used directly, but as part of a robottelo.hosts.Satellite
 example: my_satellite.api_factory.api_method()
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime
 import time
@@ -20,6 +21,28 @@ from robottelo.constants import (
 from robottelo.host_helpers.repository_mixins import initiate_repo_helpers
 
 
+class RHReposHandle:
+    """Waitable handle of the Red Hat repositories enabled by ``APIFactory.enable_rhrepos``
+
+    :ivar list repo_ids: Ids of the enabled repositories, in the requested order.
+    :ivar list tasks: Sync tasks started for the repositories, if any.
+    """
+
+    def __init__(self, satellite, repo_ids, tasks):
+        self._satellite = satellite
+        self.repo_ids = repo_ids
+        self.tasks = tasks
+
+    def wait(self, timeout=2500):
+        """Wait for all the sync tasks to finish successfully.
+
+        :param int timeout: Maximum number of seconds to wait for each task.
+        :return: The read repositories, in the requested order.
+        """
+        self._satellite.api_factory.poll_tasks(self.tasks, timeout=timeout)
+        return [self._satellite.api.Repository(id=repo_id).read() for repo_id in self.repo_ids]
+
+
 class APIFactory:
     """This class is part of a mixin and not to be used directly. See robottelo.hosts.Satellite"""
 
@@ -49,6 +72,64 @@ class APIFactory:
             ).create()
         return None
 
+    def poll_tasks(self, tasks, timeout=1500, max_workers=8):
+        """Wait for the asynchronous tasks to finish successfully, polled concurrently.
+
+        :param list tasks: The tasks, as returned by the asynchronous entity methods.
+        :param int timeout: Maximum number of seconds to wait for each task.
+        :param int optional max_workers: Maximum number of tasks polled concurrently.
+        :return: The finished tasks, in the given order.
+        """
+        if len(tasks) < 2:
+            return [self._poll_task(task, timeout) for task in tasks]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda task: self._poll_task(task, timeout), tasks))
+
+    def _poll_task(self, task, timeout):
+        return self._satellite.api.ForemanTask(id=task['id']).poll(timeout=timeout)
+
+    def latest_cv_version(self, cv_id):
+        """Return the latest version of the content view, searched alone rather than
+        reading the content view with all its versions.
+
+        :param int cv_id: The content view id.
+        :return: The unread ``ContentViewVersion``.
+        """
+        result = self._satellite.api.ContentViewVersion().search_json(
+            query={'content_view_id': cv_id, 'order': 'id DESC', 'per_page': 1}
+        )
+        return self._satellite.api.ContentViewVersion(id=result['results'][0]['id'])
+
+    def publish_promote_cv(self, content_view, lce_ids=(), force=False, timeout=1500):
+        """Publish a new version of the content view and promote it to the environments.
+
+        The version is promoted to all the environments in one request, that of a
+        promotion path included as Satellite promotes to an environment and the ones
+        before it in a single call.
+
+        :param content_view: The content view, a ``ContentView`` or its id.
+        :param list optional lce_ids: Ids of the lifecycle environments, or the
+            ``LifecycleEnvironment``, to promote the new version to.
+        :param bool optional force: Promote out of the promotion paths order.
+        :param int optional timeout: Maximum number of seconds to wait for each task.
+        :return: The unread ``ContentViewVersion`` published.
+        """
+        cv_id = getattr(content_view, 'id', content_view)
+        task = self._satellite.api.ContentView(id=cv_id).publish(synchronous=False)
+        (task,) = self.poll_tasks([task], timeout=timeout)
+        version_id = (task.get('input') or {}).get('content_view_version_id')
+        if version_id:
+            version = self._satellite.api.ContentViewVersion(id=version_id)
+        else:
+            version = self.latest_cv_version(cv_id)
+        if lce_ids:
+            data = {'environment_ids': [getattr(lce, 'id', lce) for lce in lce_ids]}
+            if force:
+                data['force'] = True
+            task = version.promote(synchronous=False, data=data)
+            self.poll_tasks([task], timeout=timeout)
+        return version
+
     def cv_publish_promote(self, name=None, env_name=None, repo_id=None, org_id=None):
         """Create, publish and promote CV to selected environment"""
         if org_id is None:
@@ -63,11 +144,8 @@ class APIFactory:
         if repo_id is not None:
             content_view.repository = [self._satellite.api.Repository(id=repo_id)]
             content_view = content_view.update(['repository'])
-        # Publish content view
-        content_view.publish()
-        # Promote the content view version.
-        content_view_version = content_view.read().version[0]
-        content_view_version.promote(data={'environment_ids': lce.id})
+        # Publish content view and promote the content view version
+        self.publish_promote_cv(content_view, [lce])
         return content_view.read()
 
     def enable_rhrepo_and_fetchid(
@@ -108,6 +186,75 @@ class APIFactory:
         result = self._satellite.api.Repository(name=repo).search(query={'organization_id': org_id})
         return result[0].id
 
+    def enable_rhrepos(self, org_id, repos, sync=True, max_workers=8, strict=False):
+        """Enable many RedHat Repositories concurrently and start their sync.
+
+        Products and repository sets are searched once per distinct name, then all the
+        repositories are enabled concurrently and their syncs started asynchronously.
+
+        :param str org_id: The organization Id.
+        :param list repos: Dicts with the ``product``, ``reposet`` and ``name`` of each
+            repository, and optionally its ``basearch`` and ``releasever``.
+        :param bool optional sync: Start the sync of the enabled repositories.
+        :param int optional max_workers: Maximum number of concurrent API requests.
+        :param bool optional strict: Raise exception if a reposet was already enabled.
+        :return: A ``RHReposHandle`` to wait for the syncs and read the repositories.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            products = {
+                name: executor.submit(
+                    self._satellite.api.Product(name=name, organization=org_id).search
+                )
+                for name in {repo['product'] for repo in repos}
+            }
+            products = {name: future.result()[0] for name, future in products.items()}
+            reposets = {
+                (product, reposet): executor.submit(
+                    self._satellite.api.RepositorySet(
+                        name=reposet, product=products[product]
+                    ).search
+                )
+                for product, reposet in {(repo['product'], repo['reposet']) for repo in repos}
+            }
+            reposets = {key: future.result()[0] for key, future in reposets.items()}
+
+            def _enable(repo):
+                product = products[repo['product']]
+                payload = {
+                    'basearch': repo.get('basearch', DEFAULT_ARCHITECTURE),
+                    'product_id': product.id,
+                }
+                if repo.get('releasever') is not None:
+                    payload['releasever'] = repo['releasever']
+                try:
+                    reposets[(repo['product'], repo['reposet'])].enable(data=payload)
+                except HTTPError as e:
+                    if (
+                        strict
+                        or e.response.status_code != 409
+                        or 'repository is already enabled'
+                        not in e.response.json()['displayMessage']
+                    ):
+                        raise
+                repo_id = (
+                    self._satellite.api.Repository(name=repo['name'])
+                    .search(query={'organization_id': org_id})[0]
+                    .id
+                )
+                task = (
+                    self._satellite.api.Repository(id=repo_id).sync(synchronous=False)
+                    if sync
+                    else None
+                )
+                return repo_id, task
+
+            results = list(executor.map(_enable, repos))
+        return RHReposHandle(
+            self._satellite,
+            repo_ids=[repo_id for repo_id, _ in results],
+            tasks=[task for _, task in results if task],
+        )
+
     def create_sync_custom_repo(
         self,
         org_id=None,
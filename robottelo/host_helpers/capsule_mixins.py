@@ -1,4 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import json
 import time
 
 from box import Box
@@ -8,10 +10,89 @@ from robottelo.constants import (
     PULP_ARTIFACT_DIR,
     PUPPET_CAPSULE_INSTALLER,
     PUPPET_COMMON_INSTALLER_OPTS,
+    REMOTE_PYTHON,
 )
 from robottelo.logging import logger
 from robottelo.utils.installer import InstallerCommand
 
+ARTIFACTS_BATCH_SIZE = 32
+# Computes the checksum index of a published repository on the host serving it. The
+# package checksums, from the yum metadata or the PULP_MANIFEST of file repositories,
+# are bucketed by their first two characters, a bucket hash covers its sorted
+# checksums and the root hash covers the bucket hashes. The checksums of the
+# requested buckets are listed.
+REPO_INDEX_SCRIPT = """
+import gzip, hashlib, json, lzma, ssl, sys, urllib.error, urllib.request
+from xml.etree import ElementTree
+
+url, prefixes = sys.argv[1], set(sys.argv[2:])
+context = ssl._create_unverified_context()
+ns = {'repo': 'http://linux.duke.edu/metadata/repo', 'common': 'http://linux.duke.edu/metadata/common'}
+
+
+def checksums():
+    try:
+        repomd = urllib.request.urlopen(url + 'repodata/repomd.xml', context=context).read()
+    except urllib.error.HTTPError:
+        manifest = urllib.request.urlopen(url + 'PULP_MANIFEST', context=context)
+        for line in manifest.read().decode().splitlines():
+            if line.strip():
+                yield line.split(',')[1]
+        return
+    href = ElementTree.fromstring(repomd).find("repo:data[@type='primary']/repo:location", ns).get('href')
+    stream = urllib.request.urlopen(url + href, context=context)
+    if href.endswith('.gz'):
+        stream = gzip.GzipFile(fileobj=stream)
+    elif href.endswith('.xz'):
+        stream = lzma.LZMAFile(stream)
+    for _, element in ElementTree.iterparse(stream):
+        if element.tag == '{%s}package' % ns['common']:
+            yield element.find('common:checksum', ns).text
+            element.clear()
+
+
+buckets = {}
+for checksum in checksums():
+    buckets.setdefault(checksum[:2], []).append(checksum)
+hashes = {
+    prefix: hashlib.sha256('\\n'.join(sorted(values)).encode()).hexdigest()
+    for prefix, values in buckets.items()
+}
+root = ''.join(f'{prefix}:{hashes[prefix]}\\n' for prefix in sorted(hashes))
+print(json.dumps({
+    'root': hashlib.sha256(root.encode()).hexdigest(),
+    'count': sum(len(values) for values in buckets.values()),
+    'buckets': hashes,
+    'checksums': {prefix: sorted(buckets.get(prefix, [])) for prefix in prefixes},
+}))
+"""
+
+
+def parse_artifact_records(lines):
+    """Parse the records of the bulk artifacts hashing script, yielding a Box per
+    artifact with its status: ``ok``, ``mismatch`` when the sum differs from the
+    one the artifact is stored under, or ``missing``.
+    """
+    for line in lines:
+        state, path, *fields = line.rstrip('\n').split('\t', 4)
+        expected = None
+        if path.startswith(PULP_ARTIFACT_DIR):
+            expected = path[len(PULP_ARTIFACT_DIR) :].replace('/', '')
+        if state == 'MISSING':
+            yield Box(
+                path=path, size=None, sum=None, info=None, expected=expected, status='missing'
+            )
+            continue
+        size, real_sum, info = fields
+        yield Box(
+            path=path,
+            size=int(size),
+            sum=real_sum,
+            info=info,
+            expected=expected,
+            status='mismatch' if expected and expected != real_sum else 'ok',
+        )
+
 
 class EnablePluginsCapsule:
     """Miscellaneous settings helper methods"""
@@ -167,6 +248,139 @@ class CapsuleInfo:
             query = f'{query} -newermt "{since} {tz}"'
         return self.execute(query).stdout.splitlines()
 
+    def get_repo_index(self, repo_url, prefixes=()):
+        """Compute the checksum index of a repository published by this host, remotely.
+
+        :param str repo_url: the 'Published_At' link of a repo, as returned by
+            :meth:`get_published_repo_url`
+        :param prefixes: Checksum prefixes of the buckets whose checksums to list.
+        :return: A Box with the ``root`` hash, the checksums ``count``, the ``buckets``
+            hashes indexed by prefix and the requested bucket ``checksums``.
+        """
+        result = self.execute(
+            f"{REMOTE_PYTHON} - {repo_url} {' '.join(prefixes)} <<'EOF'\n{REPO_INDEX_SCRIPT}\nEOF"
+        )
+        if result.status:
+            raise RuntimeError(f'Failed to index {repo_url} on {self.hostname}: {result.stderr}')
+        return Box(json.loads(result.stdout))
+
+    def check_content_parity(self, satellite, repos):
+        """Compare the content of repositories published by the Satellite and by this
+        Capsule.
+
+        The root hashes of the repositories indexes are compared first, the
+        checksums are only listed for the buckets that differ.
+
+        :param satellite: The Satellite the Capsule syncs from.
+        :param list repos: Repositories as dicts of :meth:`get_published_repo_url` kwargs.
+        :return: A list of Boxes with the ``repo``, whether it is ``in_sync``, the
+            checksums ``missing`` on the Capsule, the ``extra`` ones and the
+            ``duration`` of the check in seconds.
+        """
+
+        def _indexes(prefixes=()):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                return list(
+                    executor.map(
+                        lambda host: host.get_repo_index(
+                            host.get_published_repo_url(**repo), prefixes
+                        ),
+                        (satellite, self),
+                    )
+                )
+
+        results = []
+        for repo in repos:
+            start = time.monotonic()
+            sat_index, caps_index = _indexes()
+            missing, extra = [], []
+            if sat_index.root != caps_index.root:
+                prefixes = sorted(
+                    prefix
+                    for prefix in sat_index.buckets.keys() | caps_index.buckets.keys()
+                    if sat_index.buckets.get(prefix) != caps_index.buckets.get(prefix)
+                )
+                sat_index, caps_index = _indexes(prefixes)
+                sat_checksums = {c for values in sat_index.checksums.values() for c in values}
+                caps_checksums = {c for values in caps_index.checksums.values() for c in values}
+                missing = sorted(sat_checksums - caps_checksums)
+                extra = sorted(caps_checksums - sat_checksums)
+            result = Box(
+                repo=repo,
+                in_sync=sat_index.root == caps_index.root,
+                count=sat_index.count,
+                missing=missing,
+                extra=extra,
+                duration=time.monotonic() - start,
+            )
+            logger.info(
+                f'Content parity of {repo} on {self.hostname}: in sync: {result.in_sync}, '
+                f'missing: {len(missing)}, extra: {len(extra)} ({result.duration:.1f}s)'
+            )
+            results.append(result)
+        return results
+
+    def _artifacts_script(self, paths=None, since=None, tz='UTC'):
+        """Return a script hashing the artifacts in parallel, one tab separated record
+        per artifact: ``OK path size sha256 info`` or ``MISSING path``.
+        """
+        hash_files = (
+            'for f; do if s=$(stat --format %s "$f" 2>/dev/null); then '
+            'printf "OK\\t%s\\t%s\\t%s\\t%s\\n" "$f" "$s" '
+            '"$(sha256sum < "$f" | cut -d" " -f1)" "$(file -b "$f")"; '
+            'else printf "MISSING\\t%s\\n" "$f"; fi; done'
+        )
+        xargs = (
+            f"xargs -d '\\n' -r -P \"$(nproc)\" -n {ARTIFACTS_BATCH_SIZE} sh -c '{hash_files}' _"
+        )
+        if paths is None:
+            query = f'find {PULP_ARTIFACT_DIR} -type f'
+            if since:
+                query = f'{query} -newermt "{since} {tz}"'
+            return f'{query} | {xargs}'
+        listing = '\n'.join(paths)
+        return f"{xargs} <<'EOF'\n{listing}\nEOF"
+
+    def iter_artifacts_info(self, checksums=None, paths=None, since=None, tz='UTC'):
+        """Hash pulp artifacts in bulk, in a single remote pass running one hashing
+        process per cpu, and yield their information as the records are parsed.
+
+        All the artifacts, or those created since a time, are hashed when neither
+        checksums nor paths are given.
+
+        :param list checksums: Checksums of the artifacts to look for.
+        :param list paths: Paths to the artifacts.
+        :param str since: Creation time of artifacts we are looking for.
+        :param str tz: Time zone for `since` param.
+        :return: A generator of Boxes with artifact path, size, latest sum and info, the
+            expected sum for paths in the artifacts dir and the status: ``ok``,
+            ``mismatch`` or ``missing``.
+        """
+        if checksums is not None or paths is not None:
+            paths = [
+                *(
+                    f'{PULP_ARTIFACT_DIR}{checksum[0:2]}/{checksum[2:]}'
+                    for checksum in checksums or []
+                ),
+                *(paths or []),
+            ]
+        result = self.execute(self._artifacts_script(paths, since, tz))
+        yield from parse_artifact_records(result.stdout.splitlines())
+
+    def verify_artifacts(self, checksums=None, paths=None, since=None, tz='UTC'):
+        """Verify pulp artifacts in bulk, see :meth:`iter_artifacts_info`.
+
+        Mismatching and missing artifacts are logged as they are found.
+
+        :return: A Box with the ``ok``, ``mismatch`` and ``missing`` artifacts lists.
+        """
+        report = Box(ok=[], mismatch=[], missing=[])
+        for artifact in self.iter_artifacts_info(checksums, paths, since, tz):
+            if artifact.status != 'ok':
+                logger.warning(f'Artifact {artifact.status} on {self.hostname}: {artifact.path}')
+            report[artifact.status].append(artifact)
+        return report
+
     def get_artifact_info(self, checksum=None, path=None):
         """Returns information about pulp artifact if found on FS,
         throws FileNotFoundError otherwise.
@@ -178,14 +392,173 @@ class CapsuleInfo:
         if not (checksum or path):
             raise ValueError('Either checksum or path must be specified')
 
-        if not path:
-            path = f'{PULP_ARTIFACT_DIR}{checksum[0:2]}/{checksum[2:]}'
+        artifact = next(
+            self.iter_artifacts_info(
+                checksums=[checksum] if not path else None, paths=[path] if path else None
+            )
+        )
+        if artifact.status == 'missing':
+            raise FileNotFoundError(f'Artifact not found: {artifact.path}')
+
+        return Box(path=artifact.path, size=artifact.size, sum=artifact.sum, info=artifact.info)
+
+
+class CapsuleFleet:
+    """Capsules synced together, their sync tasks polled in a single loop
+
+    example::
+
+        reports = CapsuleFleet([capsule1, capsule2]).sync(timeout=1800)
+        reports[capsule1.hostname].artifacts_per_sec
+    """
+
+    def __init__(self, capsules, satellite=None, max_workers=8):
+        """
+        :param list capsules: The Capsules to sync.
+        :param satellite: The Satellite of the Capsules, the first Capsule's by default.
+        :param int max_workers: Maximum number of Capsules requested concurrently.
+        """
+        self.capsules = list(capsules)
+        self.satellite = satellite or self.capsules[0].satellite
+        self.max_workers = max_workers
+
+    def sync(self, timeout=1800, poll_rate=5, measure_bytes=True):
+        """Start the sync of all the Capsules at once, wait for their sync tasks and
+        verify the sync of each Capsule.
+
+        :param int timeout: Maximum number of seconds to wait for all the sync tasks.
+        :param int poll_rate: Seconds between the polls of the unfinished tasks.
+        :param bool measure_bytes: Measure the size of the artifacts downloaded by each
+            Capsule, from its artifacts storage before and after the sync.
+        :return: A Box of the sync report of each Capsule by hostname, with its
+            ``tasks``, sync ``duration`` in seconds, ``artifacts`` and ``bytes``
+            downloaded and their rates ``artifacts_per_sec`` and ``bytes_per_sec``.
+        :raises: ``AssertionError``: If a Capsule sync failed or timed out, for all the
+            failing Capsules.
+        """
+        start_time = datetime.utcnow().replace(microsecond=0) - timedelta(seconds=1)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            sizes_before = (
+                list(executor.map(self._artifacts_size, self.capsules)) if measure_bytes else None
+            )
+            started = list(
+                executor.map(
+                    lambda capsule: capsule.nailgun_capsule.content_sync(synchronous=False),
+                    self.capsules,
+                )
+            )
+            statuses = list(executor.map(self._sync_status, self.capsules))
+        task_ids = {}
+        for capsule, task, status in zip(self.capsules, started, statuses, strict=True):
+            for active_task in [task, *status['active_sync_tasks']]:
+                task_ids.setdefault(active_task['id'], capsule.hostname)
+        logger.info(
+            f'Waiting for {len(task_ids)} sync tasks of capsules '
+            f'{", ".join(capsule.hostname for capsule in self.capsules)} ...'
+        )
+        tasks = self._poll(task_ids, timeout, poll_rate)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            statuses = list(executor.map(self._sync_status, self.capsules))
+            sizes_after = (
+                list(executor.map(self._artifacts_size, self.capsules)) if measure_bytes else None
+            )
+        reports, failures = Box(), []
+        for index, (capsule, status) in enumerate(zip(self.capsules, statuses, strict=True)):
+            capsule_tasks = [
+                task for task_id, task in tasks.items() if task_ids[task_id] == capsule.hostname
+            ]
+            downloaded = sizes_after[index] - sizes_before[index] if measure_bytes else None
+            reports[capsule.hostname] = report = self._report(capsule_tasks, downloaded)
+            failures.extend(
+                f'{capsule.hostname}: {failure}'
+                for failure in self._verify(report, status, start_time)
+            )
+            logger.info(
+                f'Capsule {capsule.hostname} synced in {report.duration:.0f}s, '
+                f'{report.artifacts_per_sec:.1f} artifacts/s'
+                + (f', {report.bytes_per_sec / 2**20:.1f} MiB/s' if measure_bytes else '')
+            )
+        assert not failures, 'Capsule sync failed:\n' + '\n'.join(failures)
+        return reports
+
+    def _sync_status(self, capsule):
+        return capsule.nailgun_capsule.content_get_sync(synchronous=True)
+
+    @staticmethod
+    def _artifacts_size(capsule):
+        """Return the size in bytes of the artifacts stored by the Capsule"""
+        result = capsule.execute(f'du -sb {PULP_ARTIFACT_DIR} 2>/dev/null | cut -f1')
+        return int(result.stdout.strip() or 0)
+
+    def _poll(self, task_ids, timeout, poll_rate):
+        """Poll the tasks until all of them are finished
+
+        :return: The finished tasks by id.
+        """
+        deadline = time.monotonic() + timeout
+        pending, finished = set(task_ids), {}
+        while pending:
+            for task_id in sorted(pending):
+                task = self.satellite.api.ForemanTask(id=task_id).read_json()
+                if task['state'] in ('stopped', 'paused'):
+                    finished[task_id] = task
+                    pending.discard(task_id)
+            if pending:
+                if time.monotonic() > deadline:
+                    for task_id in pending:
+                        finished[task_id] = {'id': task_id, 'state': 'running', 'result': 'timeout'}
+                    break
+                time.sleep(poll_rate)
+        return finished
+
+    @staticmethod
+    def _report(tasks, downloaded):
+        """Return the sync report of a Capsule from its finished sync tasks"""
+        artifacts = sum(
+            report.get('done') or 0
+            for task in tasks
+            for report in _progress_reports(task.get('output'))
+            if 'artifact' in report.get('code', '')
+        )
+        started = [parse(task['started_at']) for task in tasks if task.get('started_at')]
+        ended = [parse(task['ended_at']) for task in tasks if task.get('ended_at')]
+        duration = (max(ended) - min(started)).total_seconds() if started and ended else 0
+        return Box(
+            tasks=tasks,
+            results=[task['result'] for task in tasks],
+            duration=duration,
+            artifacts=artifacts,
+            bytes=downloaded,
+            artifacts_per_sec=artifacts / duration if duration else 0,
+            bytes_per_sec=(downloaded or 0) / duration if duration else 0,
+        )
+
+    @staticmethod
+    def _verify(report, status, start_time):
+        """Return the failures of a Capsule sync, given its report and final status"""
+        failures = [
+            f'task {task["id"]} ended in {task["state"]} with result {task["result"]}'
+            for task in report.tasks
+            if task['result'] != 'success'
+        ]
+        if status['active_sync_tasks']:
+            failures.append(f'{len(status["active_sync_tasks"])} sync tasks still active')
+        if status['last_failed_sync_tasks']:
+            failures.append(f'{len(status["last_failed_sync_tasks"])} failed sync tasks')
+        if (
+            not status.get('last_sync_time')
+            or parse(status['last_sync_time']).replace(tzinfo=None) < start_time
+        ):
+            failures.append(f'last sync time {status.get("last_sync_time")} before the sync')
+        return failures
 
-        res = self.execute(f'stat --format %s {path}')
-        if res.status:
-            raise FileNotFoundError(f'Artifact not found: {path}')
-        size = int(res.stdout)
-        real_sum = self.execute(f'sha256sum {path}').stdout.split()[0]
-        info = self.execute(f'file {path}').stdout.strip().split(': ')[1]
 
-        return Box(path=path, size=size, sum=real_sum, info=info)
+def _progress_reports(output):
+    """Yield the Pulp progress reports found in a task output"""
+    if isinstance(output, dict):
+        yield from output.get('progress_reports') or ()
+        for value in output.values():
+            yield from _progress_reports(value)
+    elif isinstance(output, list):
+        for value in output:
+            yield from _progress_reports(value)
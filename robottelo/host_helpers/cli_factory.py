@@ -31,6 +31,8 @@ from robottelo.cli.proxy import CapsuleTunnelError
 from robottelo.config import settings
 from robottelo.exceptions import CLIFactoryError, CLIReturnCodeError
 from robottelo.host_helpers.repository_mixins import initiate_repo_helpers
+from robottelo.host_helpers.setup_planner import SetupPlan
+from robottelo.utils.entity_ledger import record_entity
 from robottelo.utils.manifest import clone
 
 
@@ -50,6 +52,7 @@ def create_object(cli_object, options, values=None, credentials=None, timeout=No
 
     """
     options.update(values or {})
+    kind = cli_object.__name__
     if credentials:
         cli_object = cli_object.with_user(*credentials)
     try:
@@ -62,6 +65,12 @@ def create_object(cli_object, options, values=None, credentials=None, timeout=No
     # Sometimes we get a list with a dictionary and not a dictionary.
     if isinstance(result, list) and len(result) > 0:
         result = result[0]
+    if isinstance(result, dict):
+        record_entity(
+            cli_object.hostname or settings.server.hostname,
+            kind,
+            {'id': result.get('id'), 'organization_id': options.get('organization-id')},
+        )
     return Box(result)
 
 
@@ -575,128 +584,290 @@ class CLIFactory:
                         f'Failed to add subscription to activation key\n{err.msg}'
                     ) from err
 
-    def setup_org_for_a_custom_repo(self, options=None):
-        """Sets up Org for the given custom repo by:
-
-        1. Checks if organization and lifecycle environment were given, otherwise
-            creates new ones.
-        2. Creates a new product with the custom repo. Synchronizes the repo.
-        3. Checks if content view was given, otherwise creates a new one and
-            - adds the RH repo
-            - publishes
-            - promotes to the lifecycle environment
-        4. Checks if activation key was given, otherwise creates a new one and
-            associates it with the content view.
-        5. Adds the custom repo subscription to the activation key
-        6. Override custom product to true ( turned off by default in 6.14 )
-
-        :return: A dictionary with the entity ids of Activation key, Content view,
-            Lifecycle Environment, Organization, Product and Repository
-
+    def _org_setup_plan(self, name, options):
+        """Return a plan of the steps shared by the org setup helpers, the organization,
+        lifecycle environment and content view ones, made when not given
         """
-        # Create new organization and lifecycle environment if needed
-        if options.get('organization-id') is None:
-            org_id = self.make_org()['id']
-        else:
-            org_id = options['organization-id']
-        if options.get('lifecycle-environment-id') is None:
-            env_id = self.make_lifecycle_environment({'organization-id': org_id})['id']
-        else:
-            env_id = options['lifecycle-environment-id']
-        # Create custom product and repository
-        custom_product = self.make_product({'organization-id': org_id})
-        custom_repo = self.make_repository(
-            {'content-type': 'yum', 'product-id': custom_product['id'], 'url': options.get('url')}
+        plan = SetupPlan(name)
+        plan.add(
+            'org_id',
+            lambda: (
+                self.make_org()['id']
+                if options.get('organization-id') is None
+                else options['organization-id']
+            ),
         )
-        # Synchronize custom repository
-        try:
-            self._satellite.cli.Repository.synchronize({'id': custom_repo['id']})
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(f'Failed to synchronize repository\n{err.msg}') from err
-        # Create CV if needed and associate repo with it
-        if options.get('content-view-id') is None:
-            cv_id = self.make_content_view({'organization-id': org_id})['id']
-        else:
-            cv_id = options['content-view-id']
+        plan.add(
+            'env_id',
+            lambda org_id: (
+                self.make_lifecycle_environment({'organization-id': org_id})['id']
+                if options.get('lifecycle-environment-id') is None
+                else options['lifecycle-environment-id']
+            ),
+            ['org_id'],
+        )
+        plan.add(
+            'cv_id',
+            lambda org_id: (
+                self.make_content_view({'organization-id': org_id})['id']
+                if options.get('content-view-id') is None
+                else options['content-view-id']
+            ),
+            ['org_id'],
+        )
+        plan.add('sca', self._satellite.is_sca_mode_enabled, ['org_id'])
+        return plan
+
+    def _add_cv_repository(self, cv_id, org_id, repo):
+        """Add the repository to the content view"""
         try:
             self._satellite.cli.ContentView.add_repository(
-                {'id': cv_id, 'organization-id': org_id, 'repository-id': custom_repo['id']}
+                {'id': cv_id, 'organization-id': org_id, 'repository-id': repo['id']}
             )
         except CLIReturnCodeError as err:
             raise CLIFactoryError(f'Failed to add repository to content view\n{err.msg}') from err
-        # Publish a new version of CV
+
+    def _publish_cv(self, cv_id):
         try:
             self._satellite.cli.ContentView.publish({'id': cv_id})
         except CLIReturnCodeError as err:
             raise CLIFactoryError(
                 f'Failed to publish new version of content view\n{err.msg}'
             ) from err
-        # Get the version id
-        cv_info = self._satellite.cli.ContentView.info({'id': cv_id})
-        assert len(cv_info['versions']) > 0
-        cv_info['versions'].sort(key=lambda version: version['id'])
-        cvv = cv_info['versions'][-1]
-        lce_promoted = cv_info['lifecycle-environments']
-        # Promote version to next env
-        try:
-            if env_id not in [int(lce['id']) for lce in lce_promoted]:
-                self._satellite.cli.ContentView.version_promote(
+
+    def _add_activation_key_steps(self, plan, options):
+        """Add the steps making the activation key if not given, associated with the
+        content view promoted, and overriding its repository content to enabled
+        """
+
+        def activation_key(org_id, env_id, cv_id):
+            if options.get('activationkey-id') is None:
+                return self.make_activation_key(
                     {
-                        'id': cvv['id'],
+                        'content-view-id': cv_id,
+                        'lifecycle-environment-id': env_id,
                         'organization-id': org_id,
-                        'to-lifecycle-environment-id': env_id,
                     }
-                )
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(
-                f'Failed to promote version to next environment\n{err.msg}'
-            ) from err
-        # Create activation key if needed and associate content view with it
-        if options.get('activationkey-id') is None:
-            activationkey_id = self.make_activation_key(
-                {
-                    'content-view-id': cv_id,
-                    'lifecycle-environment-id': env_id,
-                    'organization-id': org_id,
-                }
-            )['id']
-        else:
-            activationkey_id = options['activationkey-id']
+                )['id']
             # Given activation key may have no (or different) CV associated.
             # Associate activation key with CV just to be sure
             try:
                 self._satellite.cli.ActivationKey.update(
-                    {'content-view-id': cv_id, 'id': activationkey_id, 'organization-id': org_id}
+                    {
+                        'content-view-id': cv_id,
+                        'id': options['activationkey-id'],
+                        'organization-id': org_id,
+                    }
                 )
             except CLIReturnCodeError as err:
                 raise CLIFactoryError(
                     f'Failed to associate activation-key with CV\n{err.msg}'
                 ) from err
+            return options['activationkey-id']
 
-        # Add custom_product subscription to activation-key, if SCA mode is disabled
-        if self._satellite.is_sca_mode_enabled(org_id) is False:
-            self.activationkey_add_subscription_to_repo(
-                {
-                    'activationkey-id': activationkey_id,
-                    'organization-id': org_id,
-                    'subscription': custom_product['name'],
-                }
+        def content_override(ak_id, repo):
+            # Override the repository product to true ( turned off by default in 6.14 )
+            repo = self._satellite.cli.Repository.info({'id': repo['id']})
+            self._satellite.cli.ActivationKey.content_override(
+                {'id': ak_id, 'content-label': repo['content-label'], 'value': 'true'}
             )
-        # Override custom product to true ( turned off by default in 6.14 )
-        custom_repo = self._satellite.cli.Repository.info({'id': custom_repo['id']})
-        self._satellite.cli.ActivationKey.content_override(
-            {'id': activationkey_id, 'content-label': custom_repo['content-label'], 'value': 'true'}
+            return repo
+
+        plan.add('ak_id', activation_key, ['org_id', 'env_id', 'cv_id'], after=['promote'])
+        plan.add('override', content_override, ['ak_id', 'repo'])
+
+    def custom_repo_setup_plan(self, options):
+        """Return the plan of ``setup_org_for_a_custom_repo``, see ``SetupPlan``
+
+        The product and repository are made and synchronized while the lifecycle
+        environment and content view are.
+        """
+        plan = self._org_setup_plan('org for a custom repo', options)
+
+        def synchronize(repo):
+            try:
+                self._satellite.cli.Repository.synchronize({'id': repo['id']})
+            except CLIReturnCodeError as err:
+                raise CLIFactoryError(f'Failed to synchronize repository\n{err.msg}') from err
+
+        def promote(org_id, env_id, cv_id):
+            # Get the version id
+            cv_info = self._satellite.cli.ContentView.info({'id': cv_id})
+            assert len(cv_info['versions']) > 0
+            cv_info['versions'].sort(key=lambda version: version['id'])
+            cvv = cv_info['versions'][-1]
+            lce_promoted = cv_info['lifecycle-environments']
+            # Promote version to next env
+            try:
+                if env_id not in [int(lce['id']) for lce in lce_promoted]:
+                    self._satellite.cli.ContentView.version_promote(
+                        {
+                            'id': cvv['id'],
+                            'organization-id': org_id,
+                            'to-lifecycle-environment-id': env_id,
+                        }
+                    )
+            except CLIReturnCodeError as err:
+                raise CLIFactoryError(
+                    f'Failed to promote version to next environment\n{err.msg}'
+                ) from err
+
+        def add_subscription(org_id, ak_id, product, sca):
+            # Add custom_product subscription to activation-key, if SCA mode is disabled
+            if sca is False:
+                self.activationkey_add_subscription_to_repo(
+                    {
+                        'activationkey-id': ak_id,
+                        'organization-id': org_id,
+                        'subscription': product['name'],
+                    }
+                )
+
+        plan.add(
+            'product', lambda org_id: self.make_product({'organization-id': org_id}), ['org_id']
         )
+        plan.add(
+            'repo',
+            lambda product: self.make_repository(
+                {'content-type': 'yum', 'product-id': product['id'], 'url': options.get('url')}
+            ),
+            ['product'],
+        )
+        plan.add('sync', synchronize, ['repo'])
+        plan.add('cv_repo', self._add_cv_repository, ['cv_id', 'org_id', 'repo'])
+        plan.add('publish', self._publish_cv, ['cv_id'], after=['cv_repo', 'sync'])
+        plan.add('promote', promote, ['org_id', 'env_id', 'cv_id'], after=['publish'])
+        self._add_activation_key_steps(plan, options)
+        plan.add('subscription', add_subscription, ['org_id', 'ak_id', 'product', 'sca'])
+        return plan
+
+    def setup_org_for_a_custom_repo(self, options=None, done=None):
+        """Sets up Org for the given custom repo by:
+
+        1. Checks if organization and lifecycle environment were given, otherwise
+            creates new ones.
+        2. Creates a new product with the custom repo. Synchronizes the repo.
+        3. Checks if content view was given, otherwise creates a new one and
+            - adds the RH repo
+            - publishes
+            - promotes to the lifecycle environment
+        4. Checks if activation key was given, otherwise creates a new one and
+            associates it with the content view.
+        5. Adds the custom repo subscription to the activation key
+        6. Override custom product to true ( turned off by default in 6.14 )
+
+        The independent steps run concurrently, see ``custom_repo_setup_plan``.
+
+        :param dict done: Results of the steps already done, a ``SetupResult`` of
+            ``custom_repo_setup_plan`` run until some of its steps.
+        :return: A dictionary with the entity ids of Activation key, Content view,
+            Lifecycle Environment, Organization, Product and Repository
+
+        """
+        setup = self.custom_repo_setup_plan(options).run(done)
         return {
-            'activationkey-id': activationkey_id,
-            'content-view-id': cv_id,
-            'lifecycle-environment-id': env_id,
-            'organization-id': org_id,
-            'product-id': custom_product['id'],
-            'repository-id': custom_repo['id'],
+            'activationkey-id': setup['ak_id'],
+            'content-view-id': setup['cv_id'],
+            'lifecycle-environment-id': setup['env_id'],
+            'organization-id': setup['org_id'],
+            'product-id': setup['product']['id'],
+            'repository-id': setup['override']['id'],
         }
 
-    def _setup_org_for_a_rh_repo(self, options=None, force=False):
+    def rh_repo_setup_plan(self, options, force=False):
+        """Return the plan of ``_setup_org_for_a_rh_repo``, see ``SetupPlan``
+
+        The manifest is uploaded and the repository enabled and synchronized while the
+        lifecycle environment and content view are made.
+        """
+        plan = self._org_setup_plan('org for a RH repo', options)
+        repo_options = {'name': options['repository'], 'product': options['product']}
+
+        def upload_manifest(org_id):
+            # If manifest does not exist, clone and upload it
+            if len(self._satellite.cli.Subscription.exists({'organization-id': org_id})) == 0:
+                with clone() as manifest:
+                    self._satellite.upload_manifest(org_id, manifest.content)
+
+        def enable(org_id):
+            # Enable repo from Repository Set
+            try:
+                self._satellite.cli.RepositorySet.enable(
+                    {
+                        'basearch': 'x86_64',
+                        'name': options['repository-set'],
+                        'organization-id': org_id,
+                        'product': options['product'],
+                        'releasever': options.get('releasever'),
+                    }
+                )
+            except CLIReturnCodeError as err:
+                raise CLIFactoryError(f'Failed to enable repository set\n{err.msg}') from err
+
+        def repository(org_id):
+            # Fetch repository info
+            try:
+                return self._satellite.cli.Repository.info(
+                    {**repo_options, 'organization-id': org_id}
+                )
+            except CLIReturnCodeError as err:
+                raise CLIFactoryError(f'Failed to fetch repository info\n{err.msg}') from err
+
+        def synchronize(org_id):
+            # Synchronize the RH repository
+            try:
+                self._satellite.cli.Repository.synchronize(
+                    {**repo_options, 'organization-id': org_id}
+                )
+            except CLIReturnCodeError as err:
+                raise CLIFactoryError(f'Failed to synchronize repository\n{err.msg}') from err
+
+        def promote(org_id, env_id, cv_id):
+            # Get the version id
+            try:
+                cvv = self._satellite.cli.ContentView.info({'id': cv_id})['versions'][-1]
+            except CLIReturnCodeError as err:
+                raise CLIFactoryError(f'Failed to fetch content view info\n{err.msg}') from err
+            # Promote version1 to next env
+            try:
+                self._satellite.cli.ContentView.version_promote(
+                    {
+                        'id': cvv['id'],
+                        'organization-id': org_id,
+                        'to-lifecycle-environment-id': env_id,
+                        'force': force,
+                    }
+                )
+            except CLIReturnCodeError as err:
+                raise CLIFactoryError(
+                    f'Failed to promote version to next environment\n{err.msg}'
+                ) from err
+
+        def add_subscription(org_id, ak_id, sca):
+            # Add default subscription to activation-key, if SCA mode is disabled
+            if sca is False:
+                self.activationkey_add_subscription_to_repo(
+                    {
+                        'organization-id': org_id,
+                        'activationkey-id': ak_id,
+                        'subscription': options.get(
+                            'subscription', constants.DEFAULT_SUBSCRIPTION_NAME
+                        ),
+                    }
+                )
+
+        plan.add('manifest', upload_manifest, ['org_id'])
+        plan.add('enable', enable, ['org_id'], after=['manifest'])
+        plan.add('repo', repository, ['org_id'], after=['enable'])
+        plan.add('sync', synchronize, ['org_id'], after=['enable'])
+        plan.add('cv_repo', self._add_cv_repository, ['cv_id', 'org_id', 'repo'])
+        plan.add('publish', self._publish_cv, ['cv_id'], after=['cv_repo', 'sync'])
+        plan.add('promote', promote, ['org_id', 'env_id', 'cv_id'], after=['publish'])
+        self._add_activation_key_steps(plan, options)
+        plan.add('subscription', add_subscription, ['org_id', 'ak_id', 'sca'])
+        return plan
+
+    def _setup_org_for_a_rh_repo(self, options=None, force=False, done=None):
         """Sets up Org for the given Red Hat repository by:
 
         1. Checks if organization and lifecycle environment were given, otherwise
@@ -711,142 +882,24 @@ class CLIFactory:
             associates it with the content view.
         6. Adds the RH repo subscription to the activation key
 
+        The independent steps run concurrently, see ``rh_repo_setup_plan``.
+
         Note that in most cases you should use ``setup_org_for_a_rh_repo`` instead
         as it's more flexible.
 
+        :param dict done: Results of the steps already done, a ``SetupResult`` of
+            ``rh_repo_setup_plan`` run until some of its steps.
         :return: A dictionary with the entity ids of Activation key, Content view,
             Lifecycle Environment, Organization and Repository
 
         """
-        # Create new organization and lifecycle environment if needed
-        if options.get('organization-id') is None:
-            org_id = self.make_org()['id']
-        else:
-            org_id = options['organization-id']
-        if options.get('lifecycle-environment-id') is None:
-            env_id = self.make_lifecycle_environment({'organization-id': org_id})['id']
-        else:
-            env_id = options['lifecycle-environment-id']
-        # If manifest does not exist, clone and upload it
-        if len(self._satellite.cli.Subscription.exists({'organization-id': org_id})) == 0:
-            with clone() as manifest:
-                self._satellite.upload_manifest(org_id, manifest.content)
-        # Enable repo from Repository Set
-        try:
-            self._satellite.cli.RepositorySet.enable(
-                {
-                    'basearch': 'x86_64',
-                    'name': options['repository-set'],
-                    'organization-id': org_id,
-                    'product': options['product'],
-                    'releasever': options.get('releasever'),
-                }
-            )
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(f'Failed to enable repository set\n{err.msg}') from err
-        # Fetch repository info
-        try:
-            rhel_repo = self._satellite.cli.Repository.info(
-                {
-                    'name': options['repository'],
-                    'organization-id': org_id,
-                    'product': options['product'],
-                }
-            )
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(f'Failed to fetch repository info\n{err.msg}') from err
-        # Synchronize the RH repository
-        try:
-            self._satellite.cli.Repository.synchronize(
-                {
-                    'name': options['repository'],
-                    'organization-id': org_id,
-                    'product': options['product'],
-                }
-            )
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(f'Failed to synchronize repository\n{err.msg}') from err
-        # Create CV if needed and associate repo with it
-        if options.get('content-view-id') is None:
-            cv_id = self.make_content_view({'organization-id': org_id})['id']
-        else:
-            cv_id = options['content-view-id']
-        try:
-            self._satellite.cli.ContentView.add_repository(
-                {'id': cv_id, 'organization-id': org_id, 'repository-id': rhel_repo['id']}
-            )
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(f'Failed to add repository to content view\n{err.msg}') from err
-        # Publish a new version of CV
-        try:
-            self._satellite.cli.ContentView.publish({'id': cv_id})
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(
-                f'Failed to publish new version of content view\n{err.msg}'
-            ) from err
-        # Get the version id
-        try:
-            cvv = self._satellite.cli.ContentView.info({'id': cv_id})['versions'][-1]
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(f'Failed to fetch content view info\n{err.msg}') from err
-        # Promote version1 to next env
-        try:
-            self._satellite.cli.ContentView.version_promote(
-                {
-                    'id': cvv['id'],
-                    'organization-id': org_id,
-                    'to-lifecycle-environment-id': env_id,
-                    'force': force,
-                }
-            )
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(
-                f'Failed to promote version to next environment\n{err.msg}'
-            ) from err
-        # Create activation key if needed and associate content view with it
-        if options.get('activationkey-id') is None:
-            activationkey_id = self.make_activation_key(
-                {
-                    'content-view-id': cv_id,
-                    'lifecycle-environment-id': env_id,
-                    'organization-id': org_id,
-                }
-            )['id']
-        else:
-            activationkey_id = options['activationkey-id']
-            # Given activation key may have no (or different) CV associated.
-            # Associate activation key with CV just to be sure
-            try:
-                self._satellite.cli.ActivationKey.update(
-                    {'id': activationkey_id, 'organization-id': org_id, 'content-view-id': cv_id}
-                )
-            except CLIReturnCodeError as err:
-                raise CLIFactoryError(
-                    f'Failed to associate activation-key with CV\n{err.msg}'
-                ) from err
-
-        # Add default subscription to activation-key, if SCA mode is disabled
-        if self._satellite.is_sca_mode_enabled(org_id) is False:
-            self.activationkey_add_subscription_to_repo(
-                {
-                    'organization-id': org_id,
-                    'activationkey-id': activationkey_id,
-                    'subscription': options.get(
-                        'subscription', constants.DEFAULT_SUBSCRIPTION_NAME
-                    ),
-                }
-            )
-        # Override RHST product to true ( turned off by default in 6.14 )
-        rhel_repo = self._satellite.cli.Repository.info({'id': rhel_repo['id']})
-        self._satellite.cli.ActivationKey.content_override(
-            {'id': activationkey_id, 'content-label': rhel_repo['content-label'], 'value': 'true'}
-        )
+        setup = self.rh_repo_setup_plan(options, force).run(done)
         return {
-            'activationkey-id': activationkey_id,
-            'content-view-id': cv_id,
-            'lifecycle-environment-id': env_id,
-            'organization-id': org_id,
-            'repository-id': rhel_repo['id'],
+            'activationkey-id': setup['ak_id'],
+            'content-view-id': setup['cv_id'],
+            'lifecycle-environment-id': setup['env_id'],
+            'organization-id': setup['org_id'],
+            'repository-id': setup['override']['id'],
         }
 
     def setup_org_for_a_rh_repo(
@@ -1094,45 +1147,45 @@ class CLIFactory:
         :param list rh_subscriptions: a list of RH subscription to attach to
             activation key
         :return: a dict containing the activation key, content view and repos info
+
+        The content view is made while the repositories are set up, see ``SetupPlan``.
         """
         if repos is None:
             repos = []
         if rh_subscriptions is None:
             rh_subscriptions = []
+        plan = SetupPlan('cdn and custom repos content')
 
-        if upload_manifest:
+        def upload():
             # Upload the organization manifest
             try:
                 self._satellite.upload_manifest(org_id, interface='CLI')
             except CLIReturnCodeError as err:
                 raise CLIFactoryError(f'Failed to upload manifest\n{err.msg}') from err
 
-        custom_product, repos_info = self.setup_cdn_and_custom_repositories(
-            org_id=org_id, repos=repos, download_policy=download_policy
-        )
-        if default_cv:
-            activation_key = self.make_activation_key(
-                {'organization-id': org_id, 'lifecycle-environment': 'Library'}
-            )
-            content_view = self._satellite.cli.ContentView.info(
-                {'organization-id': org_id, 'name': 'Default Organization View'}
-            )
-        else:
+        def content_view():
+            if default_cv:
+                return self._satellite.cli.ContentView.info(
+                    {'organization-id': org_id, 'name': 'Default Organization View'}
+                )
             # Create a content view
-            content_view = self.make_content_view({'organization-id': org_id})
+            return self.make_content_view({'organization-id': org_id})
+
+        def promote(new_cv, repos):
+            _, repos_info = repos
             # Add repositories to content view
             for repo_info in repos_info:
                 self._satellite.cli.ContentView.add_repository(
                     {
-                        'id': content_view['id'],
+                        'id': new_cv['id'],
                         'organization-id': org_id,
                         'repository-id': repo_info['id'],
                     }
                 )
             # Publish the content view
-            self._satellite.cli.ContentView.publish({'id': content_view['id']})
+            self._satellite.cli.ContentView.publish({'id': new_cv['id']})
             # Get the latest content view version id
-            content_view_version = self._satellite.cli.ContentView.info({'id': content_view['id']})[
+            content_view_version = self._satellite.cli.ContentView.info({'id': new_cv['id']})[
                 'versions'
             ][-1]
             # Promote content view version to lifecycle environment
@@ -1143,53 +1196,90 @@ class CLIFactory:
                     'to-lifecycle-environment-id': lce_id,
                 }
             )
-            content_view = self._satellite.cli.ContentView.info({'id': content_view['id']})
-            activation_key = self.make_activation_key(
+            return self._satellite.cli.ContentView.info({'id': new_cv['id']})
+
+        def activation_key(content_view):
+            if default_cv:
+                return self.make_activation_key(
+                    {'organization-id': org_id, 'lifecycle-environment': 'Library'}
+                )
+            return self.make_activation_key(
                 {
                     'organization-id': org_id,
                     'lifecycle-environment-id': lce_id,
                     'content-view-id': content_view['id'],
                 }
             )
+
+        def add_subscriptions(subscriptions, activation_key, repos):
+            custom_product, _ = repos
+            # Add subscriptions to activation-key
+            needed_subscription_names = list(rh_subscriptions)
+            if custom_product:
+                needed_subscription_names.append(custom_product['name'])
+            added_subscription_names = []
+            for subscription in subscriptions:
+                if (
+                    subscription['name'] in needed_subscription_names
+                    and subscription['name'] not in added_subscription_names
+                ):
+                    self._satellite.cli.ActivationKey.add_subscription(
+                        {
+                            'id': activation_key['id'],
+                            'subscription-id': subscription['id'],
+                            'quantity': 1,
+                        }
+                    )
+                    added_subscription_names.append(subscription['name'])
+                    if len(added_subscription_names) == len(needed_subscription_names):
+                        break
+            missing_subscription_names = set(needed_subscription_names).difference(
+                set(added_subscription_names)
+            )
+            if missing_subscription_names:
+                raise CLIFactoryError(f'Missing subscriptions: {missing_subscription_names}')
+
+        plan.add('manifest', upload if upload_manifest else lambda: None)
+        plan.add(
+            'repos',
+            lambda: self.setup_cdn_and_custom_repositories(
+                org_id=org_id, repos=repos, download_policy=download_policy
+            ),
+            after=['manifest'],
+        )
+        if default_cv:
+            plan.add('content_view', content_view)
+        else:
+            plan.add('new_cv', content_view)
+            plan.add('content_view', promote, ['new_cv', 'repos'])
+        plan.add('activation_key', activation_key, ['content_view'])
         # Get organization subscriptions
-        subscriptions = self._satellite.cli.Subscription.list(
-            {'organization-id': org_id}, per_page=False
+        plan.add(
+            'subscriptions',
+            lambda: self._satellite.cli.Subscription.list(
+                {'organization-id': org_id}, per_page=False
+            ),
+            after=['repos'],
         )
-        # Add subscriptions to activation-key
-        needed_subscription_names = list(rh_subscriptions)
-        if custom_product:
-            needed_subscription_names.append(custom_product['name'])
-        added_subscription_names = []
-        for subscription in subscriptions:
-            if (
-                subscription['name'] in needed_subscription_names
-                and subscription['name'] not in added_subscription_names
-            ):
-                self._satellite.cli.ActivationKey.add_subscription(
-                    {
-                        'id': activation_key['id'],
-                        'subscription-id': subscription['id'],
-                        'quantity': 1,
-                    }
-                )
-                added_subscription_names.append(subscription['name'])
-                if len(added_subscription_names) == len(needed_subscription_names):
-                    break
-        missing_subscription_names = set(needed_subscription_names).difference(
-            set(added_subscription_names)
+        plan.add(
+            'add_subscriptions', add_subscriptions, ['subscriptions', 'activation_key', 'repos']
         )
-        if missing_subscription_names:
-            raise CLIFactoryError(f'Missing subscriptions: {missing_subscription_names}')
+        if lce_id:
+            plan.add(
+                'lce',
+                lambda: self._satellite.cli.LifecycleEnvironment.info(
+                    {'id': lce_id, 'organization-id': org_id}
+                ),
+            )
+        setup = plan.run()
+        custom_product, repos_info = setup['repos']
         data = dict(
-            activation_key=activation_key,
-            content_view=content_view,
+            activation_key=setup['activation_key'],
+            content_view=setup['content_view'],
             product=custom_product,
             repos=repos_info,
         )
         if lce_id:
-            lce = self._satellite.cli.LifecycleEnvironment.info(
-                {'id': lce_id, 'organization-id': org_id}
-            )
-            data['lce'] = lce
+            data['lce'] = setup['lce']
 
         return data
@@ -657,10 +657,10 @@ class RepositoryCollection:
         # Publish the content view
         self.satellite.cli.ContentView.publish({'id': content_view['id']})
         if lce['name'] != constants.ENVIRONMENT:
-            # Get the latest content view version id
-            content_view_version = self.satellite.cli.ContentView.info({'id': content_view['id']})[
-                'versions'
-            ][-1]
+            # Get the latest content view version id, without listing all the versions
+            content_view_version = self.satellite.cli.ContentView.version_list(
+                {'content-view-id': content_view['id'], 'order': 'id DESC', 'per-page': 1}
+            )[0]
             # Promote content view version to lifecycle environment
             self.satellite.cli.ContentView.version_promote(
                 {
@@ -1,13 +1,16 @@
 import contextlib
 from functools import lru_cache
 import io
+import json
 import os
 import random
 import re
+import shlex
 
-import requests
+from box import Box
 from wait_for import TimedOutError, wait_for
 
+from robottelo import content_info
 from robottelo.cli.proxy import CapsuleTunnelError
 from robottelo.config import settings
 from robottelo.constants import (
@@ -15,6 +18,7 @@ from robottelo.constants import (
     PULP_IMPORT_DIR,
     PUPPET_COMMON_INSTALLER_OPTS,
     PUPPET_SATELLITE_INSTALLER,
+    REMOTE_PYTHON,
 )
 from robottelo.exceptions import CLIReturnCodeError
 from robottelo.host_helpers.api_factory import APIFactory
@@ -24,6 +28,59 @@ from robottelo.logging import logger
 from robottelo.utils.installer import InstallerCommand
 from robottelo.utils.manifest import clone
 
+DEFAULT_SUM_TYPES = ('md5sum', 'sha256sum', 'sha512sum')
+# Downloads the files of the job concurrently, streaming each one through all the
+# requested digests, and prints a json record per file. Known ETags are sent in
+# If-None-Match, unchanged files are reported as not modified.
+CHECKSUM_SCRIPT = """
+from concurrent.futures import ThreadPoolExecutor
+import hashlib, json, os, ssl, sys, urllib.error, urllib.parse, urllib.request
+
+job = json.loads(sys.argv[1])
+context = ssl._create_unverified_context()
+
+
+def checksum(item):
+    url, etag = item
+    record = {'url': url}
+    request = urllib.request.Request(url, headers={'If-None-Match': etag} if etag else {})
+    try:
+        response = urllib.request.urlopen(request, context=context, timeout=600)
+    except urllib.error.HTTPError as err:
+        if err.code == 304:
+            record['not_modified'] = True
+        else:
+            record['error'] = str(err)
+        return record
+    except OSError as err:
+        record['error'] = str(err)
+        return record
+    digests = {sum_type: hashlib.new(sum_type[: -len('sum')]) for sum_type in job['sum_types']}
+    target = None
+    if job['download_dir']:
+        filename = os.path.basename(urllib.parse.urlparse(url).path)
+        target = open(os.path.join(job['download_dir'], filename), 'wb')
+    with response:
+        record['etag'] = response.headers.get('ETag')
+        chunk = response.read(1 << 20)
+        while chunk:
+            for digest in digests.values():
+                digest.update(chunk)
+            if target:
+                target.write(chunk)
+            chunk = response.read(1 << 20)
+    if target:
+        target.close()
+    record['sums'] = {sum_type: digest.hexdigest() for sum_type, digest in digests.items()}
+    return record
+
+
+with ThreadPoolExecutor(max_workers=job['workers']) as executor:
+    for record in executor.map(checksum, job['urls']):
+        print(json.dumps(record), flush=True)
+"""
+_url_checksums = {}
+
 
 class EnablePluginsSatellite:
     """Miscellaneous settings helper methods"""
@@ -72,24 +129,7 @@ class ContentInfo:
         :param extension: extension of searched files. Defaults to 'rpm'
         :return:  list representing rpm package names
         """
-        if not url.endswith('/'):
-            url += '/'
-
-        result = requests.get(url, verify=False)
-        if result.status_code != 200:
-            raise requests.HTTPError(f'{url} is not accessible')
-
-        links = re.findall(r'(?<=href=").*?(?=">)', result.text)
-
-        if 'Packages/' not in links:
-            return sorted(line for line in links if extension in line)
-
-        files = []
-        subs = self.get_repo_files_by_url(f'{url}Packages/', extension='/')
-        for sub in subs:
-            files.extend(self.get_repo_files_by_url(f'{url}Packages/{sub}', extension))
-
-        return sorted(files)
+        return content_info.get_repo_files_by_url(url, extension)
 
     def get_repomd(self, repo_url):
         """Fetches content of the repomd file of a repository
@@ -97,12 +137,7 @@ class ContentInfo:
         :param repo_url: the 'Published_At' link of a repo
         :return: string with repomd content
         """
-        repomd_path = 'repodata/repomd.xml'
-        result = requests.get(f'{repo_url}/{repomd_path}', verify=False)
-        if result.status_code != 200:
-            raise requests.HTTPError(f'{repo_url}/{repomd_path} is not accessible')
-
-        return result.text
+        return content_info.get_repomd(repo_url)
 
     def get_repomd_revision(self, repo_url):
         """Fetches a revision of a repository.
@@ -111,16 +146,68 @@ class ContentInfo:
         :return: string containing repository revision
         :rtype: str
         """
-        match = re.search('(?<=<revision>).*?(?=</revision>)', self.get_repomd(repo_url))
-        if not match:
-            raise ValueError(f'<revision> not found in repomd file of {repo_url}')
-
-        return match.group(0)
+        return content_info.get_repomd_revision(repo_url)
+
+    def checksums_by_urls(self, urls, sum_types=DEFAULT_SUM_TYPES, download_dir=None, workers=8):
+        """Returns checksums of files accessible via URLs, computed remotely by a
+        single script downloading the files concurrently. Every file is streamed
+        once through all the digests and is not stored unless ``download_dir`` is
+        given.
+
+        Checksums are memoized per host and URL along with the ETag of the file, a
+        file is not downloaded again as long as the server reports it unchanged.
+
+        :param list urls: URLs of the files.
+        :param sum_types: Checksum types like md5sum, sha256sum, sha512sum, etc.
+            computed in addition to the default ones.
+        :param str download_dir: Remote directory to store the downloaded files in.
+        :param int workers: Number of concurrent downloads.
+        :return dict: Boxes of checksums indexed by checksum type, indexed by URL.
+        :raises: AssertionError: If some file couldn't be reached or calculation was
+            not successful.
+        """
+        sum_types = sorted({*DEFAULT_SUM_TYPES, *sum_types})
+        urls = list(dict.fromkeys(urls))
+        cached = {url: _url_checksums.get((self.hostname, url)) for url in urls}
+        etags = {
+            url: entry.etag
+            for url, entry in cached.items()
+            if entry and not download_dir and set(sum_types) <= entry.sums.keys()
+        }
+        job = {
+            'urls': [[url, etags.get(url)] for url in urls],
+            'sum_types': sum_types,
+            'download_dir': download_dir,
+            'workers': workers,
+        }
+        result = self.execute(
+            f"{REMOTE_PYTHON} - {shlex.quote(json.dumps(job))} <<'EOF'\n{CHECKSUM_SCRIPT}\nEOF"
+        )
+        if result.status != 0:
+            raise AssertionError(f'Failed to compute checksums on {self.hostname}: {result.stderr}')
+        checksums = {}
+        failures = []
+        for line in result.stdout.splitlines():
+            record = json.loads(line)
+            url = record['url']
+            if record.get('not_modified'):
+                checksums[url] = cached[url].sums
+            elif record.get('error'):
+                failures.append(f'`{url.split("/")[-1]}` from `{url}`: {record["error"]}')
+            else:
+                checksums[url] = Box(record['sums'])
+                if record.get('etag'):
+                    _url_checksums[(self.hostname, url)] = Box(
+                        etag=record['etag'], sums=checksums[url]
+                    )
+        if failures:
+            raise AssertionError(f'Failed to get {", ".join(failures)}.')
+        return checksums
 
     def checksum_by_url(self, url, sum_type='md5sum'):
         """Returns desired checksum of a file, accessible via URL. Useful when you want
         to calculate checksum but don't want to deal with storing a file and
-        removing it afterwards.
+        removing it afterwards. See :meth:`checksums_by_urls`.
 
         :param str url: URL of a file.
         :param str sum_type: Checksum type like md5sum, sha256sum, sha512sum, etc.
@@ -129,13 +216,7 @@ class ContentInfo:
         :raises: AssertionError: If non-zero return code received (file couldn't be
             reached or calculation was not successful).
         """
-        filename = url.split('/')[-1]
-        result = self.execute(f'wget -q --spider {url}')
-        if result.status != 0:
-            raise AssertionError(f'Failed to get `{filename}` from `{url}`.')
-        return self.execute(
-            f'wget -qO - {url} | tee {filename} | {sum_type} | awk \'{{print $1}}\''
-        ).stdout.strip()
+        return self.checksums_by_urls([url], sum_types=[sum_type])[url][sum_type]
 
     def upload_manifest(self, org_id, manifest=None, interface='API', timeout=None):
         """Upload a manifest using the requested interface.
@@ -194,7 +275,7 @@ class ContentInfo:
         """
         repo = repo_list if isinstance(repo_list, list) else [repo_list]
         content_view = self.api.ContentView(organization=org, repository=repo).create()
-        content_view.publish()
+        self.api_factory.publish_promote_cv(content_view)
         return content_view.read()
 
     def move_pulp_archive(self, org, export_message):
@@ -0,0 +1,129 @@
+"""Setup helpers declared as a graph of steps, the independent ones run concurrently.
+
+A ``SetupPlan`` lists the steps of a setup helper, each a function called with the
+results of the steps it requires, by name, once they are done. ``SetupPlan.run`` runs
+the steps as soon as their requirements are done, the independent branches of the
+graph concurrently, and times them. The results of an already run plan, or of a
+prefix of it, can be given to a run to share them, as a fixture would share the
+organization and synced repository its tests build upon, the steps already done
+being skipped. A run can be limited to the steps some steps require, a prefix of the
+graph to share.
+
+example::
+
+    plan = SetupPlan('custom repo')
+    plan.add('org_id', lambda: make_org()['id'])
+    plan.add('product', lambda org_id: make_product({'organization-id': org_id}), ['org_id'])
+    plan.add('cv_id', lambda org_id: make_content_view(...)['id'], ['org_id'])
+    setup = plan.run()
+    setup['cv_id'], setup.timings['product']
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import time
+
+from robottelo.logging import logger
+
+
+class SetupStep:
+    """A step of a setup plan"""
+
+    def __init__(self, name, func, requires=(), after=()):
+        """
+        :param str name: Name of the step, its result is given by this name to the
+            steps requiring it.
+        :param func: Called with the results of the required steps as keyword arguments.
+        :param requires: Names of the steps to run before, their results given to func.
+        :param after: Names of the steps to run before, their results not needed.
+        """
+        self.name = name
+        self.func = func
+        self.requires = tuple(requires)
+        self.after = tuple(after)
+
+    def __call__(self, results):
+        return self.func(**{name: results[name] for name in self.requires})
+
+
+class SetupResult(dict):
+    """Results of the steps of a setup plan by name, with their ``timings`` in seconds"""
+
+    def __init__(self, results=(), timings=()):
+        super().__init__(results)
+        self.timings = dict(timings)
+
+
+class SetupPlan:
+    """Steps of a setup helper and their dependencies"""
+
+    def __init__(self, name, workers=4):
+        """
+        :param str name: Name of the plan, for logging.
+        :param int workers: Number of steps run concurrently at most.
+        """
+        self.name = name
+        self.workers = workers
+        self.steps = {}
+
+    def add(self, name, func, requires=(), after=()):
+        """Add a step, after the steps it requires, see ``SetupStep``"""
+        missing = [other for other in (*requires, *after) if other not in self.steps]
+        if missing:
+            raise ValueError(f'Step {name} of {self.name} requires unknown steps {missing}')
+        self.steps[name] = SetupStep(name, func, requires, after)
+
+    def run(self, done=None, until=()):
+        """Run the steps not done yet, as soon as the steps they require are done
+
+        :param dict done: Results of the steps already done, as the ``SetupResult`` of
+            a plan sharing the first steps.
+        :param until: Names of the steps to run with the steps they require, all the
+            steps by default.
+        :return: A ``SetupResult`` of the steps run, the done ones included.
+        :raises: The exception of the first step failing, the steps not started yet
+            are not run.
+        """
+        done = done or {}
+        result = SetupResult({name: done[name] for name in self.steps if name in done})
+        wanted = self._required(until) if until else self.steps
+        pending = {
+            name: step for name, step in self.steps.items() if name in wanted and name not in result
+        }
+        started = time.monotonic()
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='setup') as pool:
+            while pending or running:
+                for name, step in list(pending.items()):
+                    if all(other in result for other in (*step.requires, *step.after)):
+                        del pending[name]
+                        running[pool.submit(self._run_step, step, dict(result))] = name
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    if future.exception():
+                        for other in running:
+                            other.cancel()
+                        raise future.exception()
+                    result[name], result.timings[name] = future.result()
+        logger.debug(
+            f'Setup {self.name} done in {time.monotonic() - started:.1f}s, steps: '
+            + ', '.join(f'{name} {duration:.1f}s' for name, duration in result.timings.items())
+        )
+        return result
+
+    def _required(self, names):
+        """Return the names of the steps and of the steps they require, recursively"""
+        required = set()
+        names = list(names)
+        while names:
+            name = names.pop()
+            if name not in required:
+                required.add(name)
+                names.extend((*self.steps[name].requires, *self.steps[name].after))
+        return required
+
+    @staticmethod
+    def _run_step(step, results):
+        started = time.monotonic()
+        value = step(results)
+        return value, time.monotonic() - started
@@ -18,13 +18,11 @@ import apypie
 from box import Box
 from broker import Broker
 from broker.hosts import Host
-from dynaconf.vendor.box.exceptions import BoxKeyError
 from fauxfactory import gen_alpha, gen_string
 from manifester import Manifester
 from nailgun import entities
 from packaging.version import Version
 import requests
-from ssh2.exceptions import AuthenticationError
 from wait_for import TimedOutError, wait_for
 from wrapanapi.entities.vm import VmState
 import yaml
@@ -58,7 +56,9 @@ from robottelo.host_helpers import CapsuleMixins, ContentHostMixins, SatelliteMi
 from robottelo.logging import logger
 from robottelo.utils import validate_ssh_pub_key
 from robottelo.utils.datafactory import valid_emails_list
+from robottelo.utils.entity_ledger import PURGE_ORDER, recorded_create_json
 from robottelo.utils.installer import InstallerCommand
+from robottelo.utils.version_probe import version_probe
 
 POWER_OPERATIONS = {
     VmState.RUNNING: 'running',
@@ -82,12 +82,10 @@ def lru_sat_ready_rhel(rhel_ver):
 
 
 def get_sat_version():
-    """Try to read sat_version from envvar SATELLITE_VERSION
-    if not available fallback to ssh connection to get it."""
+    """Read sat_version from the Satellite, probed in the background and cached,
+    if not available fallback to robottelo configuration."""
 
-    try:
-        sat_version = Satellite().version
-    except (AuthenticationError, ContentHostError, BoxKeyError):
+    if not (sat_version := version_probe().versions().get('sat_version')):
         if sat_version := str(settings.server.version.get('release')) == 'stream':
             sat_version = str(settings.robottelo.get('satellite_version'))
         if not sat_version:
@@ -96,16 +94,15 @@ def get_sat_version():
 
 
 def get_sat_rhel_version():
-    """Try to read rhel_version from Satellite host
+    """Read rhel_version from the Satellite, probed in the background and cached,
     if not available fallback to robottelo configuration."""
 
-    try:
-        return Satellite().os_version
-    except (AuthenticationError, ContentHostError, BoxKeyError):
-        if hasattr(settings.server.version, 'rhel_version'):
-            rhel_version = str(settings.server.version.rhel_version)
-        elif hasattr(settings.robottelo, 'rhel_version'):
-            rhel_version = settings.robottelo.rhel_version
+    if rhel_version := version_probe().versions().get('rhel_version'):
+        return Version(rhel_version)
+    if hasattr(settings.server.version, 'rhel_version'):
+        rhel_version = str(settings.server.version.rhel_version)
+    elif hasattr(settings.robottelo, 'rhel_version'):
+        rhel_version = settings.robottelo.rhel_version
     return Version(rhel_version)
 
 
@@ -130,17 +127,19 @@ def setup_capsule(satellite, capsule, org, registration_args=None, installation_
         satellite.upload_manifest(org.id, manifest.content)
 
     # Enable RHEL 8 BaseOS and AppStream repos and sync
-    for rh_repo_key in ['rhel8_bos', 'rhel8_aps']:
-        satellite.api_factory.enable_rhrepo_and_fetchid(
-            basearch=DEFAULT_ARCHITECTURE,
-            org_id=org.id,
-            product=PRDS['rhel8'],
-            repo=REPOS[rh_repo_key]['name'],
-            reposet=REPOSET[rh_repo_key],
-            releasever=REPOS[rh_repo_key]['releasever'],
-        )
-    product = satellite.api.Product(name=PRDS['rhel8'], organization=org.id).search()[0]
-    product.sync(timeout=1800, synchronous=True)
+    satellite.api_factory.enable_rhrepos(
+        org_id=org.id,
+        repos=[
+            {
+                'product': PRDS['rhel8'],
+                'reposet': REPOSET[rh_repo_key],
+                'name': REPOS[rh_repo_key]['name'],
+                'basearch': DEFAULT_ARCHITECTURE,
+                'releasever': REPOS[rh_repo_key]['releasever'],
+            }
+            for rh_repo_key in ['rhel8_bos', 'rhel8_aps']
+        ],
+    ).wait(timeout=1800)
 
     if not registration_args:
         registration_args = {}
@@ -1891,6 +1890,11 @@ class Satellite(Capsule, SatelliteMixins):
             class DecClass(cls):
                 __init__ = functools.partialmethod(cls.__init__, server_config=server_config)
 
+            # record the created entities in the entity ledger, purged at session end
+            if cls.__name__ in PURGE_ORDER and hasattr(cls, 'create_json'):
+                DecClass.create_json = recorded_create_json(
+                    cls.create_json, self.hostname, cls.__name__
+                )
             return DecClass
 
         # set the server configuration to point to this satellite
@@ -1,6 +1,12 @@
+import atexit
+from contextlib import contextmanager
+import copy
+import json
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import os
 from pathlib import Path
+import queue
 
 from box import Box
 from broker.logger import setup_logzero as broker_log_setup
@@ -11,6 +17,7 @@ import yaml
 robottelo_root_dir = Path(os.environ.get('ROBOTTELO_DIR', Path(__file__).resolve().parent.parent))
 robottelo_log_dir = robottelo_root_dir.joinpath('logs')
 robottelo_log_file = robottelo_log_dir.joinpath('robottelo.log')
+robottelo_json_log_file = robottelo_log_dir.joinpath('robottelo.jsonl')
 robottelo_log_file.parent.mkdir(parents=True, exist_ok=True)
 
 with robottelo_root_dir.joinpath('logging.yaml').open() as f:
@@ -81,3 +88,173 @@ config_logger = logzero.setup_logger(
     fileLoglevel=logging_yaml.config.fileLevel,
     formatter=defaultFormatter,
 )
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format the log records as JSON lines, for structured processing of the logs"""
+
+    def __init__(self, worker_id=None):
+        super().__init__(datefmt=DEFAULT_DATE_FORMAT)
+        self.worker_id = worker_id
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record, self.datefmt),
+            'created': record.created,
+            'logger': record.name,
+            'level': record.levelname,
+            'message': record.getMessage(),
+        }
+        if self.worker_id:
+            entry['worker'] = self.worker_id
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def json_lines_handler(path, worker_id=None):
+    """Return a file handler writing the log records as JSON lines to the path"""
+    handler = logging.FileHandler(path)
+    handler.setFormatter(JsonLinesFormatter(worker_id))
+    handler.setLevel(logging_yaml.robottelo.fileLevel)
+    return handler
+
+
+class LogQueueHandler(QueueHandler):
+    """Queue the log records of a logger for its file handlers, written by the writer thread
+
+    When the queue is full, the logging call blocks until the writer catches up, or the
+    record is dropped and the number of records dropped is logged once the queue accepts
+    records again.
+    """
+
+    def __init__(self, queue, targets, full='block'):
+        if full not in ('block', 'drop'):
+            raise ValueError(f'Unknown full log queue policy {full}, expected block or drop')
+        super().__init__(queue)
+        self.targets = tuple(targets)
+        self.full = full
+        self.dropped = 0
+
+    def prepare(self, record):
+        """Return a copy of the record, its message merged with its arguments, left for
+        the target handlers to format, unlike ``QueueHandler.prepare`` which formats it and
+        merges the traceback into the message"""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        # the targets are captured with the record, they may change while it waits
+        if self.full == 'block':
+            self.queue.put((self.targets, record))
+            return
+        try:
+            if self.dropped:
+                warning = logging.makeLogRecord(
+                    {
+                        'name': record.name,
+                        'levelno': logging.WARNING,
+                        'levelname': 'WARNING',
+                        'msg': f'{self.dropped} log records dropped, the log queue was full',
+                    }
+                )
+                self.queue.put_nowait((self.targets, warning))
+                self.dropped = 0
+            self.queue.put_nowait((self.targets, record))
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogWriter(QueueListener):
+    """Write the queued log records to the file handlers of the logger they were logged by"""
+
+    def enqueue_sentinel(self):
+        # waits for room in a full queue, the records before are written
+        self.queue.put(self._sentinel)
+
+    def handle(self, item):
+        targets, record = item
+        for handler in targets:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class LogQueue:
+    """Write the log records of the file handlers of loggers from a background thread
+
+    The file handlers of the loggers are replaced by a ``LogQueueHandler`` queueing the
+    records, bounded to ``size`` records, for a ``LogWriter`` thread writing them.
+    """
+
+    def __init__(self, size=10000, full='block'):
+        self.queue = queue.Queue(size)
+        self.full = full
+        self.writer = LogWriter(self.queue)
+        self.writing = False
+        self.handlers = {}
+
+    def add(self, *loggers):
+        """Queue the records of the file handlers of the loggers, starting the writer"""
+        for _logger in loggers:
+            targets = [h for h in _logger.handlers if isinstance(h, logging.FileHandler)]
+            if not targets:
+                continue
+            for handler in targets:
+                _logger.removeHandler(handler)
+            if _logger in self.handlers:
+                handler = self.handlers[_logger]
+                handler.targets = (*handler.targets, *targets)
+            else:
+                handler = self.handlers[_logger] = LogQueueHandler(self.queue, targets, self.full)
+                _logger.addHandler(handler)
+        if not self.writing:
+            self.writer.start()
+            self.writing = True
+
+    def remove(self, *loggers):
+        """Give the file handlers back to the loggers, all of them by default"""
+        for _logger in loggers or list(self.handlers):
+            handler = self.handlers.pop(_logger, None)
+            if handler is None:
+                continue
+            _logger.removeHandler(handler)
+            for target in handler.targets:
+                _logger.addHandler(target)
+
+    @contextmanager
+    def unqueued(self):
+        """Give the file handlers back to the loggers while they are reconfigured"""
+        loggers = list(self.handlers)
+        self.remove(*loggers)
+        try:
+            yield
+        finally:
+            self.add(*loggers)
+
+    def stop(self):
+        """Write the records left in the queue and stop the writer"""
+        if self.writing:
+            self.writer.stop()
+            self.writing = False
+
+
+@contextmanager
+def file_handlers_unqueued():
+    """Give the file handlers back to the loggers, if queued, while they are reconfigured"""
+    if log_queue is None:
+        yield
+    else:
+        with log_queue.unqueued():
+            yield
+
+
+if logging_yaml.backend.json_lines:
+    logger.addHandler(json_lines_handler(robottelo_json_log_file))
+
+log_queue = None
+if logging_yaml.backend.queue:
+    log_queue = LogQueue(size=logging_yaml.backend.queue_size, full=logging_yaml.backend.queue_full)
+    log_queue.add(logger, logzero.logger, collection_logger, config_logger)
+    atexit.register(log_queue.stop)
@@ -1,7 +1,30 @@
 """Utility module to handle the shared ssh connection."""
 
+from contextlib import contextmanager
+
 from robottelo.cli import hammer
 
+# the factory of the clients used instead of the ssh connected hosts, see client_factory
+_client_factory = {}
+
+
+@contextmanager
+def client_factory(factory):
+    """Use the clients of the factory instead of ssh connected hosts in the context
+
+    :param factory: Called with the ``get_client`` arguments, returns an object with
+        the ``execute`` method of a host, as ``robottelo.utils.fake_ssh.FakeSSH``.
+    """
+    previous = _client_factory.get('factory')
+    _client_factory['factory'] = factory
+    try:
+        yield factory
+    finally:
+        if previous is None:
+            _client_factory.pop('factory', None)
+        else:
+            _client_factory['factory'] = previous
+
 
 def get_client(
     hostname=None,
@@ -15,9 +38,14 @@ def get_client(
     Config validation enforces one of the three must be set in settings.server
     """
     from robottelo.config import settings
-    from robottelo.hosts import ContentHost
 
-    return ContentHost(
+    if 'factory' in _client_factory:
+        host_class = _client_factory['factory']
+    else:
+        from robottelo.hosts import ContentHost
+
+        host_class = ContentHost
+    return host_class(
         hostname=hostname or settings.server.hostname,
         username=username or settings.server.ssh_username,
         password=password or settings.server.ssh_password,
@@ -0,0 +1,172 @@
+"""Single pass filtering and annotation of the collected test items.
+
+The plugins filtering and annotating the collected items add stages to a
+``CollectionPipeline``, see ``pytest_plugins.collection_pipeline``, instead of each
+iterating the items in their own ``pytest_collection_modifyitems``. The stages run
+item by item in a single pass, an item deselected by a stage skipping the next
+ones, and are timed. The markers, fixtures and docstrings of the items are indexed
+once, in an ``ItemIndex`` kept up to date by the stages adding markers through it.
+"""
+
+from collections import Counter, defaultdict
+from functools import cached_property
+import inspect
+import time
+
+import pytest
+
+from robottelo.logging import collection_logger as logger
+
+INDEX_KEY = pytest.StashKey()
+
+
+class ItemIndex:
+    """Markers, fixtures and docstrings of a test item, markers indexed by name
+    closest first as ``item.iter_markers`` yields them"""
+
+    def __init__(self, item):
+        self.item = item
+        self.fixtures = frozenset(getattr(item, 'fixturenames', ()))
+        self._markers = []
+        self._by_name = defaultdict(list)
+        # number of markers of the item itself, listed before those of its parents
+        self._own = Counter()
+        for node, marker in item.iter_markers_with_node():
+            self._markers.append(marker)
+            self._by_name[marker.name].append(marker)
+            if node is item:
+                self._own[marker.name] += 1
+        self._own_total = len(item.own_markers)
+
+    @property
+    def stale(self):
+        """Whether markers were added to the item without the index"""
+        return self._own_total != len(self.item.own_markers)
+
+    @property
+    def names(self):
+        """Names of the item markers"""
+        return self._by_name.keys()
+
+    def closest(self, name, default=None):
+        """Return the marker of the name closest to the item, like ``get_closest_marker``"""
+        markers = self._by_name.get(name)
+        return markers[0] if markers else default
+
+    def iter_markers(self, name=None):
+        """Iterate the markers, of a name if given, like ``item.iter_markers``"""
+        return iter(self._markers if name is None else self._by_name.get(name, ()))
+
+    def add_marker(self, marker):
+        """Add a marker, a name or a ``MarkDecorator``, to the item and the index"""
+        self.item.add_marker(marker)
+        marker = self.item.own_markers[-1]
+        self._markers.insert(sum(self._own.values()), marker)
+        self._by_name[marker.name].insert(self._own[marker.name], marker)
+        self._own[marker.name] += 1
+        self._own_total += 1
+
+    @cached_property
+    def docstrings(self):
+        """Docstrings of the test function, class and module, if any"""
+        item = self.item
+        return [
+            d
+            for d in map(inspect.getdoc, (item.function, getattr(item, 'cls', None), item.module))
+            if d is not None
+        ]
+
+
+def item_index(item):
+    """Return the index of an item, built once unless markers were added without it"""
+    index = item.stash.get(INDEX_KEY, None)
+    if index is None or index.stale:
+        index = item.stash[INDEX_KEY] = ItemIndex(item)
+    return index
+
+
+class Stage:
+    """A filtering or annotating step of the collection pipeline"""
+
+    def __init__(self, name, select, prepare=None, finish=None, keep_all_if_none_selected=False):
+        """
+        :param str name: Name of the stage, for logging.
+        :param select: Called with each item reaching the stage and its ``ItemIndex``,
+            returns ``False`` to deselect the item.
+        :param prepare: Called with all the items before the pass.
+        :param finish: Called with the list of the selected items after the pass, may
+            reorder it in place.
+        :param bool keep_all_if_none_selected: Keep the items deselected by the stage
+            when it selected none of the items reaching it.
+        """
+        self.name = name
+        self.select = select
+        self.prepare = prepare
+        self.finish = finish
+        self.keep_all_if_none_selected = keep_all_if_none_selected
+        self.stats = Counter()
+        self.duration = 0.0
+
+
+class CollectionPipeline:
+    """Stages filtering and annotating the collected items in a single pass"""
+
+    def __init__(self):
+        self.stages = []
+
+    def add(self, name, select, **kwargs):
+        """Add a stage, after the stages already added, see ``Stage``"""
+        self.stages.append(Stage(name, select, **kwargs))
+
+    def _pass(self, items, start=0):
+        """Run the items through the stages from the start one, return the selected items
+        and the deselected items with the index of the stage deselecting them"""
+        selected, deselected = [], {}
+        stages = list(enumerate(self.stages))[start:]
+        for item in items:
+            index = item_index(item)
+            for position, stage in stages:
+                started = time.perf_counter()
+                keep = stage.select(item, index) is not False
+                stage.duration += time.perf_counter() - started
+                stage.stats['selected' if keep else 'deselected'] += 1
+                if not keep:
+                    deselected[item] = position
+                    break
+            else:
+                selected.append(item)
+        return selected, deselected
+
+    def run(self, items):
+        """Run the stages on the items.
+
+        :return: The selected items, in the collection order unless reordered by a
+            stage, and the deselected items, in the collection order.
+        """
+        order = {item: position for position, item in enumerate(items)}
+        for stage in self.stages:
+            if stage.prepare:
+                started = time.perf_counter()
+                stage.prepare(items)
+                stage.duration += time.perf_counter() - started
+        selected, deselected = self._pass(items)
+        for position, stage in enumerate(self.stages):
+            if stage.keep_all_if_none_selected and not stage.stats['selected']:
+                kept = [item for item, by in deselected.items() if by == position]
+                for item in kept:
+                    del deselected[item]
+                kept_selected, kept_deselected = self._pass(kept, position + 1)
+                selected.extend(kept_selected)
+                deselected.update(kept_deselected)
+        selected.sort(key=order.__getitem__)
+        for stage in self.stages:
+            if stage.finish:
+                started = time.perf_counter()
+                stage.finish(selected)
+                stage.duration += time.perf_counter() - started
+        for stage in self.stages:
+            logger.debug(
+                f'Collection stage {stage.name}: {stage.stats["selected"]} selected, '
+                f'{stage.stats["deselected"]} deselected in {stage.duration:.3f}s'
+            )
+        return selected, sorted(deselected, key=order.__getitem__)
@@ -1,3 +1,4 @@
 from robottelo.utils.decorators.func_shared.shared import shared  # noqa
 from robottelo.utils.decorators.func_shared.shared import SharedFunctionError  # noqa
 from robottelo.utils.decorators.func_shared.shared import SharedFunctionException  # noqa
+from robottelo.utils.decorators.func_shared.shared_fixture import shared_fixture  # noqa
@@ -0,0 +1,206 @@
+"""Shared fixture is a decorator of a fixture that builds its value once per Satellite
+and parameter set for all the pytest xdist workers, when the shared functions are
+enabled, see ``robottelo.utils.decorators.func_shared.shared``.
+
+The value is stored as JSON handles, the nailgun entities by class and id, and the
+other workers read the entities again from their Satellite. The consumers of the value
+are counted, the ``teardown`` given, if any, being called by the last one.
+
+Note: The value must be made of nailgun entities, dicts, lists and JSON compatible
+    values, the dicts being given back as ``Box``. The fixture arguments other than
+    ``request`` and the request param are the key, they must be the same in all the
+    workers, as Satellites, by hostname, and JSON compatible values. The entities of a
+    worker, as its module organization, cannot be part of the key, the fixture makes
+    the entities its value is built upon. A ``TypeError`` is raised otherwise.
+
+Usage::
+
+    from robottelo.utils.decorators.func_shared import shared_fixture
+
+    @pytest.fixture(scope='module')
+    @shared_fixture
+    def module_sync_kickstart_content(request, module_target_sat):
+        org = module_target_sat.api.Organization().create()
+        ...
+        return Box(org=org, os=os, domain=domain)
+"""
+
+import datetime
+import functools
+import hashlib
+from importlib import import_module
+import inspect
+import json
+
+from box import Box
+from nailgun.entities import Entity
+
+from robottelo.logging import logger
+from robottelo.utils.decorators.func_shared.shared import (
+    _DATETIME_FORMAT,
+    _STATE_READY,
+    _get_default_storage_handler,
+    _get_function_name_key,
+)
+
+# the module, shadowed in the package by the shared function
+shared = import_module('robottelo.utils.decorators.func_shared.shared')
+
+_STATE_RELEASED = 'RELEASED'
+
+
+def _to_handle(value):
+    """Return the JSON compatible handle of a value, its entities by class and id"""
+    if isinstance(value, Entity):
+        return {'_entity': type(value).__name__, 'id': value.id}
+    if isinstance(value, dict):
+        return {key: _to_handle(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_to_handle(item) for item in value]
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    raise TypeError(f'A {type(value).__name__} cannot be shared across the workers')
+
+
+def _key_handle(value):
+    """Return the JSON compatible handle of a key value, its Satellites by hostname"""
+    from robottelo.hosts import Satellite
+
+    if isinstance(value, Satellite):
+        return {'_satellite': value.hostname}
+    if isinstance(value, Entity):
+        raise TypeError(
+            f'A {type(value).__name__} entity of a worker cannot be a shared fixture key'
+        )
+    if isinstance(value, dict):
+        return {key: _key_handle(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_key_handle(item) for item in value]
+    return _to_handle(value)
+
+
+def _from_handle(handle, satellite):
+    """Return the value of a handle, its entities read from the Satellite"""
+    if isinstance(handle, dict):
+        if '_entity' in handle:
+            return getattr(satellite.api, handle['_entity'])(id=handle['id']).read()
+        return Box({key: _from_handle(item, satellite) for key, item in handle.items()})
+    if isinstance(handle, list):
+        return [_from_handle(item, satellite) for item in handle]
+    return handle
+
+
+def _find_satellite(values):
+    """Return the first Satellite of the fixture arguments, or of their attributes"""
+    from robottelo.hosts import Satellite
+
+    for value in values:
+        nested = value.values() if isinstance(value, dict) else ()
+        for candidate in (value, *nested):
+            if isinstance(candidate, Satellite):
+                return candidate
+    return None
+
+
+class _SharedFixture:
+    """The stored value of a shared fixture and its consumers count"""
+
+    def __init__(self, key, timeout, storage_handler=None):
+        self.key = key
+        self.timeout = timeout
+        self.storage = storage_handler or _get_default_storage_handler()
+
+    def _is_valid(self, stored):
+        if not stored or stored['state'] != _STATE_READY:
+            return False
+        created = datetime.datetime.strptime(stored['creation_datetime'], _DATETIME_FORMAT)
+        return datetime.datetime.utcnow() < created + datetime.timedelta(seconds=self.timeout)
+
+    def acquire(self, build):
+        """Count a consumer of the value, built if not stored yet
+
+        :param build: Called to build the value, in the first consumer.
+        :return: A tuple of the value built, or None, and the stored handle.
+        """
+        with self.storage.lock(self.key) as data:
+            self.storage.when_lock_acquired(data)
+            stored = self.storage.get(self.key)
+            value = None
+            if self._is_valid(stored):
+                stored['refs'] += 1
+            else:
+                logger.info(f'building shared fixture: {self.key}')
+                value = build()
+                stored = dict(
+                    state=_STATE_READY,
+                    result=_to_handle(value),
+                    refs=1,
+                    creation_datetime=datetime.datetime.utcnow().strftime(_DATETIME_FORMAT),
+                )
+            self.storage.set(self.key, stored)
+        return value, stored['result']
+
+    def release(self, teardown=None, value=None):
+        """Uncount a consumer of the value, the last one calling the teardown"""
+        with self.storage.lock(self.key) as data:
+            self.storage.when_lock_acquired(data)
+            stored = self.storage.get(self.key)
+            if not stored or stored['state'] != _STATE_READY:
+                return
+            stored['refs'] -= 1
+            if stored['refs'] <= 0 and teardown is not None:
+                logger.info(f'tearing down shared fixture: {self.key}')
+                stored['state'] = _STATE_RELEASED
+                try:
+                    teardown(value)
+                finally:
+                    self.storage.set(self.key, stored)
+            else:
+                self.storage.set(self.key, stored)
+
+
+def shared_fixture(function_=None, teardown=None, timeout=None):
+    """Share the value of a fixture across the pytest xdist workers.
+
+    :param function_: The fixture function, returning its value.
+    :param teardown: Called with the value by its last consumer.
+    :param timeout: Seconds the stored value is valid, the shared functions one by
+        default.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            shared._check_config()
+            if not shared.ENABLED:
+                value = func(*args, **kwargs)
+                yield value
+                if teardown is not None:
+                    teardown(value)
+                return
+            arguments = signature.bind(*args, **kwargs).arguments
+            request = arguments.pop('request', None)
+            handles = {
+                'param': _key_handle(getattr(request, 'param', None)),
+                'arguments': _key_handle(arguments),
+            }
+            digest = hashlib.md5(json.dumps(handles, sort_keys=True).encode()).hexdigest()
+            key = _get_function_name_key(
+                f'{func.__module__}.{func.__name__}.{digest}', scope=shared._get_default_scope
+            )
+            shared_value = _SharedFixture(key, timeout or shared.SHARE_DEFAULT_TIMEOUT)
+            value, handle = shared_value.acquire(functools.partial(func, *args, **kwargs))
+            if value is None:
+                value = _from_handle(handle, _find_satellite(arguments.values()))
+            try:
+                yield value
+            finally:
+                shared_value.release(teardown, value)
+
+        return wrapper
+
+    if function_:
+        return decorator(function_)
+    return decorator
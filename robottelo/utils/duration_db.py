@@ -0,0 +1,129 @@
+"""Historical test and fixture durations and cost-aware scheduling.
+
+Durations of the setup, call and teardown phases of the tests and the setup
+durations of the fixtures are recorded in a local SQLite store, keyed by the
+test node id, or fixture name, and the Satellite version. They are used to
+predict the cost of the tests of a run, order them longest first and keep the
+tests sharing an expensive module or class scoped fixture on the same worker.
+"""
+
+from collections import defaultdict
+from contextlib import closing
+import heapq
+import sqlite3
+import statistics
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tests (
+    nodeid TEXT, sat_version TEXT, phase TEXT, duration REAL, outcome TEXT, recorded REAL
+);
+CREATE INDEX IF NOT EXISTS tests_nodeid ON tests (nodeid, sat_version);
+CREATE TABLE IF NOT EXISTS fixtures (
+    name TEXT, scope TEXT, sat_version TEXT, duration REAL, recorded REAL
+);
+CREATE INDEX IF NOT EXISTS fixtures_name ON fixtures (name, sat_version);
+CREATE TABLE IF NOT EXISTS runs (
+    started REAL, workers INTEGER, predicted_makespan REAL
+);
+"""
+
+
+class DurationDB:
+    """SQLite store of test and fixture durations"""
+
+    def __init__(self, path, history=5):
+        """
+        :param path: Path of the SQLite database, created if needed.
+        :param int history: Number of latest durations averaged for predictions.
+        """
+        self.path = str(path)
+        self.history = history
+        with closing(self._connect()) as connection, connection:
+            connection.executescript(SCHEMA)
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=60)
+        connection.execute('PRAGMA journal_mode=WAL')
+        return connection
+
+    def record(self, tests=(), fixtures=()):
+        """Record durations in a single transaction.
+
+        :param tests: ``(nodeid, sat_version, phase, duration, outcome)`` tuples.
+        :param fixtures: ``(name, scope, sat_version, duration)`` tuples.
+        """
+        now = time.time()
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                'INSERT INTO tests VALUES (?, ?, ?, ?, ?, ?)', [(*row, now) for row in tests]
+            )
+            connection.executemany(
+                'INSERT INTO fixtures VALUES (?, ?, ?, ?, ?)', [(*row, now) for row in fixtures]
+            )
+
+    def _latest_averages(self, query, sat_version):
+        """Average the latest durations per key, those of the Satellite version when
+        there are, those of any version otherwise"""
+        history = defaultdict(lambda: defaultdict(list))
+        with closing(self._connect()) as connection:
+            for key, version, duration in connection.execute(query):
+                history[key][version].append(duration)
+                history[key][None].append(duration)
+        return {
+            key: statistics.mean((versions.get(sat_version) or versions[None])[: self.history])
+            for key, versions in history.items()
+        }
+
+    def test_costs(self, sat_version):
+        """Return the predicted duration of the tests, setup to teardown, by node id"""
+        return self._latest_averages(
+            'SELECT nodeid, sat_version, SUM(duration) FROM tests '
+            'GROUP BY nodeid, sat_version, recorded ORDER BY recorded DESC',
+            sat_version,
+        )
+
+    def fixture_costs(self, sat_version):
+        """Return the predicted setup duration of the fixtures, by name"""
+        return self._latest_averages(
+            'SELECT name, sat_version, duration FROM fixtures ORDER BY recorded DESC',
+            sat_version,
+        )
+
+    def record_prediction(self, started, workers, predicted_makespan):
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                'INSERT INTO runs VALUES (?, ?, ?)', (started, workers, predicted_makespan)
+            )
+
+    def prediction(self, since):
+        """Return the latest predicted makespan recorded since a time, if any"""
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                'SELECT predicted_makespan FROM runs WHERE started >= ? '
+                'ORDER BY started DESC LIMIT 1',
+                (since,),
+            ).fetchone()
+        return row[0] if row else None
+
+
+def schedule(items, costs, default_cost=None):
+    """Order jobs longest processing time first.
+
+    :param items: Job names.
+    :param dict costs: Predicted cost by job name.
+    :param default_cost: Cost of the jobs without history, the median cost by default.
+    :return: The jobs sorted by decreasing predicted cost, and their costs.
+    """
+    if default_cost is None:
+        default_cost = statistics.median(costs.values()) if costs else 0.0
+    predicted = {item: costs.get(item, default_cost) for item in items}
+    return sorted(items, key=lambda item: -predicted[item]), predicted
+
+
+def makespan(costs, workers):
+    """Return the makespan of the jobs assigned, in order, to the least loaded worker"""
+    loads = [0.0] * max(workers, 1)
+    for cost in costs:
+        heapq.heappush(loads, heapq.heappop(loads) + cost)
+    return max(loads)
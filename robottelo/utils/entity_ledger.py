@@ -0,0 +1,315 @@
+"""Ledger of the entities created during a session, purged at its end.
+
+The entities created through ``satellite.api`` and ``satellite.cli_factory`` are
+recorded, once the ledger is started, as JSON lines appended to a file per process,
+see ``pytest_plugins.entity_ledger``. They are purged in ``PURGE_ORDER``, the ones
+depending on others first, with the bulk destroy endpoints when there are some and
+concurrent deletes otherwise, waiting for the asynchronous tasks between the kinds.
+The content of the purged organizations is left to their asynchronous deletion.
+"""
+
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import json
+from pathlib import Path
+import threading
+from typing import NamedTuple
+
+from robottelo.config import robottelo_tmp_dir
+from robottelo.logging import logger
+
+LEDGER_DIR = robottelo_tmp_dir.joinpath('entity_ledger')
+# the entities failing to be purged at session end, purged on demand
+LEFTOVERS = LEDGER_DIR.joinpath('leftovers.jsonl')
+
+# the kinds of entities purged, in order, the entities depending on others first
+PURGE_ORDER = (
+    'Host',
+    'HostGroup',
+    'ActivationKey',
+    'HostCollection',
+    'SyncPlan',
+    'ContentView',
+    'Repository',
+    'Product',
+    'ContentCredential',
+    'LifecycleEnvironment',
+    'Subnet',
+    'Domain',
+    'UserGroup',
+    'User',
+    'Role',
+    'Organization',
+    'Location',
+)
+# the kinds of entities deleted with their organization
+ORG_CASCADE = frozenset(
+    {
+        'ActivationKey',
+        'HostCollection',
+        'SyncPlan',
+        'ContentView',
+        'Repository',
+        'Product',
+        'ContentCredential',
+        'LifecycleEnvironment',
+    }
+)
+# the bulk destroy endpoints, those of hosts per organization
+BULK_DESTROY = {
+    'Host': 'api/hosts/bulk/destroy',
+    'Product': 'katello/api/products/bulk/destroy',
+    'Repository': 'katello/api/repositories/bulk/destroy',
+}
+# the robottelo.cli entities named differently than the nailgun ones
+CLI_KINDS = {'Org': 'Organization'}
+
+
+class LedgerEntry(NamedTuple):
+    hostname: str
+    kind: str
+    id: int
+    org_id: int = None
+
+
+class EntityLedger:
+    """Entities created on the Satellites, appended to a JSON lines file if given"""
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else None
+        self.entries = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, paths):
+        """Return a ledger of the entities recorded in the JSON lines files"""
+        ledger = cls()
+        for path in paths:
+            for line in Path(path).read_text().splitlines():
+                if line.strip():
+                    ledger.entries.append(LedgerEntry(*json.loads(line)))
+        return ledger
+
+    def record(self, hostname, kind, entity_json):
+        """Record an entity created on the Satellite, if of a kind purged
+
+        :param str hostname: Hostname of the Satellite.
+        :param str kind: The nailgun entity class name, or the robottelo.cli one.
+        :param dict entity_json: The created entity, with ``id`` and the organization
+            as ``organization_id`` or ``organization``.
+        """
+        kind = CLI_KINDS.get(kind, kind)
+        if kind not in PURGE_ORDER or not entity_json or entity_json.get('id') is None:
+            return
+        organization = entity_json.get('organization') or {}
+        org_id = entity_json.get('organization_id') or organization.get('id')
+        entry = LedgerEntry(hostname, kind, int(entity_json['id']), org_id and int(org_id))
+        with self._lock:
+            self.entries.append(entry)
+            if self.path:
+                with self.path.open('a') as ledger_file:
+                    ledger_file.write(json.dumps(entry) + '\n')
+
+    def save(self, path, append=False):
+        """Write the entries to a JSON lines file, or append them to it"""
+        with Path(path).open('a' if append else 'w') as ledger_file:
+            ledger_file.writelines(json.dumps(entry) + '\n' for entry in self.entries)
+
+    def drop_hosts(self, hostnames):
+        """Drop the entries of the Satellites other than the given ones, as the
+        Satellites provisioned during the session and already checked in
+
+        :param hostnames: Hostnames of the Satellites left to purge.
+        :return: A ``Counter`` of the entries dropped by hostname.
+        """
+        hostnames = set(hostnames)
+        dropped = Counter(e.hostname for e in self.entries if e.hostname not in hostnames)
+        self.entries = [e for e in self.entries if e.hostname in hostnames]
+        return dropped
+
+    def plan(self):
+        """Return the entries to purge by kind, in purge order, the entries deleted with
+        their organization left out
+
+        :return: A list of ``(kind, entries)``.
+        """
+        entries = list(dict.fromkeys(self.entries))
+        purged_orgs = {(e.hostname, e.id) for e in entries if e.kind == 'Organization'}
+        return _by_kind(
+            e
+            for e in entries
+            if e.kind not in ORG_CASCADE or (e.hostname, e.org_id) not in purged_orgs
+        )
+
+    def purge(self, dry_run=False, workers=8, task_timeout=1800, progress=logger.info):
+        """Purge the entities, those failing to be deleted being retried once at the end
+
+        :param bool dry_run: Only report the entities to purge.
+        :param int workers: Number of concurrent delete requests.
+        :param int task_timeout: Seconds to wait for each asynchronous delete task.
+        :param progress: Called with the progress report lines.
+        :return: A ``Counter`` of the entities ``purged`` and ``failed`` by kind, the
+            failed ones left in the ledger.
+        """
+        plan = self.plan()
+        total = sum(len(entries) for _, entries in plan)
+        stats = Counter()
+        if dry_run:
+            for kind, entries in plan:
+                progress(f'Would purge {len(entries)} {kind}')
+            progress(f'Would purge {total} entities, the others with their organization')
+            return stats
+        purger = _Purger(workers, task_timeout)
+        purged, failed = 0, []
+        for kind, entries in plan:
+            kind_failed = purger.purge(kind, entries)
+            failed.extend(kind_failed)
+            stats[kind, 'purged'] += len(entries) - len(kind_failed)
+            purged += len(entries) - len(kind_failed)
+            progress(
+                f'Purged {len(entries) - len(kind_failed)}/{len(entries)} {kind}, '
+                f'{purged}/{total} entities'
+            )
+        # some entities depend on others of the same kind, as composite content views
+        left = []
+        for kind, entries in _by_kind(failed):
+            kind_failed = purger.purge(kind, entries, bulk=False)
+            left.extend(kind_failed)
+            stats[kind, 'purged'] += len(entries) - len(kind_failed)
+            stats[kind, 'failed'] += len(kind_failed)
+            if kind_failed:
+                progress(f'Failed to purge {len(kind_failed)}/{len(entries)} {kind}')
+        purger.shutdown()
+        self.entries = left
+        return stats
+
+
+def _by_kind(entries):
+    """Return the entries by kind, in purge order"""
+    by_kind = defaultdict(list)
+    for entry in entries:
+        by_kind[entry.kind].append(entry)
+    return [(kind, by_kind[kind]) for kind in PURGE_ORDER if by_kind[kind]]
+
+
+class _Purger:
+    """Deletes the entities of a kind, in bulk or concurrently, waiting for the tasks"""
+
+    def __init__(self, workers, task_timeout):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='purge')
+        self.task_timeout = task_timeout
+        self._satellites = {}
+        self._lock = threading.Lock()
+
+    def shutdown(self):
+        self.executor.shutdown()
+
+    def satellite(self, hostname):
+        from robottelo.hosts import Satellite
+
+        with self._lock:
+            if hostname not in self._satellites:
+                satellite = Satellite(hostname=hostname)
+                # configures the nailgun entities once, not by the concurrent deletes
+                satellite.api  # noqa: B018
+                self._satellites[hostname] = satellite
+            return self._satellites[hostname]
+
+    def purge(self, kind, entries, bulk=True):
+        """Delete the entries of a kind, return the ones failing to be deleted"""
+        groups = defaultdict(list)
+        for entry in entries:
+            key = (entry.hostname, entry.org_id if kind == 'Host' else None)
+            groups[key].append(entry)
+        if bulk and kind in BULK_DESTROY:
+            jobs = [(self._bulk_delete, group) for group in groups.values()]
+        else:
+            jobs = [(self._delete, [entry]) for entry in entries]
+        futures = [(self.executor.submit(job, group), group) for job, group in jobs]
+        tasks, failed = [], []
+        for future, group in futures:
+            try:
+                tasks.extend((task, group) for task in future.result())
+            except Exception as err:
+                logger.warning(f'Failed to delete {len(group)} {kind}: {err}')
+                failed.extend(group)
+        waits = [
+            (self.executor.submit(self._wait, group[0].hostname, task), group)
+            for task, group in tasks
+        ]
+        for future, group in waits:
+            try:
+                future.result()
+            except Exception as err:
+                logger.warning(f'Failed to delete {len(group)} {kind}: {err}')
+                failed.extend(group)
+        return failed
+
+    def _delete(self, entries):
+        """Delete an entity, return its delete task if asynchronous"""
+        entry = entries[0]
+        api = self.satellite(entry.hostname).api
+        response = getattr(api, entry.kind)(id=entry.id).delete_raw()
+        if response.status_code == 404:
+            return []
+        response.raise_for_status()
+        return [response.json()] if response.status_code == 202 else []
+
+    def _bulk_delete(self, entries):
+        """Delete entities of a kind in bulk, return the delete task"""
+        from nailgun import client
+
+        entry = entries[0]
+        server_config = self.satellite(entry.hostname).nailgun_cfg
+        data = {'ids': [e.id for e in entries]}
+        if entry.kind == 'Host':
+            data = {'organization_id': entry.org_id, 'included': data}
+        response = client.put(
+            f'{server_config.url}/{BULK_DESTROY[entry.kind]}',
+            json=data,
+            **server_config.get_client_kwargs(),
+        )
+        response.raise_for_status()
+        return [response.json()] if response.status_code == 202 else []
+
+    def _wait(self, hostname, task):
+        self.satellite(hostname).api.ForemanTask(id=task['id']).poll(timeout=self.task_timeout)
+
+
+_ledger = {}
+
+
+def start_ledger(path=None):
+    """Start recording the entities created, to a JSON lines file if given"""
+    if path:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    _ledger['ledger'] = EntityLedger(path)
+    return _ledger['ledger']
+
+
+def stop_ledger():
+    """Stop recording the entities created, return the ledger if started"""
+    return _ledger.pop('ledger', None)
+
+
+def record_entity(hostname, kind, entity_json):
+    """Record an entity created on the Satellite in the ledger, if started"""
+    ledger = _ledger.get('ledger')
+    if ledger is not None:
+        ledger.record(hostname, kind, entity_json)
+
+
+def recorded_create_json(create_json, hostname, kind):
+    """Wrap the ``create_json`` of a nailgun entity class to record the created entities"""
+
+    def wrapper(self, *args, **kwargs):
+        entity_json = create_json(self, *args, **kwargs)
+        record_entity(hostname, kind, entity_json)
+        return entity_json
+
+    return wrapper
+
+
+def ledger_files(directory):
+    """Return the JSON lines files of the ledgers in the directory, of all the processes"""
+    return sorted(Path(directory).glob('*.jsonl'))
@@ -0,0 +1,150 @@
+"""In-process fake of the ssh transport, replaying recorded command outputs.
+
+A ``FakeSSH`` replaces the ssh connected hosts returned by ``robottelo.ssh.get_client``
+in its context, so that the CLI layer runs end to end, from ``Base.execute`` to the
+``hammer`` parsers, without a Satellite. The outputs are matched by a regular
+expression searched in the command, the first added matching, and can be recorded
+from a Satellite with ``recording``. A latency can be added to each command and
+failures injected, to measure the effect of connection pooling, batching or parser
+changes with ``tests/robottelo/benchmarks``.
+
+example::
+
+    fake = FakeSSH(latency=0.01)
+    fake.add('organization list', stdout='Id,Name\\n1,Default Organization\\n')
+    with fake:
+        Org.list()
+    fake.commands
+"""
+
+from contextlib import contextmanager
+import json
+from pathlib import Path
+import random
+import re
+import threading
+import time
+
+from broker.helpers import Result
+
+from robottelo import ssh
+
+# the status and stderr of the commands without an output recorded, as a shell's
+MISSING_STATUS = 127
+
+
+class FakeSSHClient:
+    """The host of a ``FakeSSH``, as returned by ``robottelo.ssh.get_client``"""
+
+    def __init__(self, fake, hostname, username=None, password=None, port=22):
+        self.fake = fake
+        self.hostname = hostname
+        self.username = username
+        self.password = password
+        self.port = port
+
+    def execute(self, command, timeout=None):
+        return self.fake.execute(self.hostname, command, timeout=timeout)
+
+
+class FakeSSH:
+    """Replays the recorded outputs of the commands, from the clients it makes"""
+
+    def __init__(self, outputs=(), latency=0, failure_rate=0, failure=None, seed=None):
+        """
+        :param outputs: The recorded outputs, dicts of the ``add`` arguments.
+        :param float latency: Seconds each command takes.
+        :param float failure_rate: Ratio of the commands failing, at random.
+        :param dict failure: The ``status``, ``stdout`` and ``stderr`` of the failing
+            commands, a hammer error by default.
+        :param seed: The seed of the failures, to fail the same commands each run.
+        """
+        self.outputs = []
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.failure = {
+            'status': 70,
+            'stdout': '',
+            'stderr': 'Error: Internal Server Error',
+            **(failure or {}),
+        }
+        self.commands = []
+        self.clients = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._factory = None
+        for output in outputs:
+            self.add(**output)
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        """Return a ``FakeSSH`` replaying the outputs of a JSON lines file, as written by
+        ``recording``
+        """
+        outputs = [json.loads(line) for line in Path(path).read_text().splitlines() if line.strip()]
+        return cls(outputs, **kwargs)
+
+    def add(self, command, stdout='', stderr='', status=0):
+        """Add the output of the commands matching a regular expression"""
+        self.outputs.append(
+            (re.compile(command), {'stdout': stdout, 'stderr': stderr, 'status': status})
+        )
+
+    def __call__(self, hostname=None, username=None, password=None, port=22):
+        with self._lock:
+            self.clients += 1
+        return FakeSSHClient(self, hostname, username, password, port)
+
+    def execute(self, hostname, command, timeout=None):
+        """Return the result of the command, the first output matching it"""
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.commands.append((hostname, command))
+            failing = self.failure_rate and self._random.random() < self.failure_rate
+        if failing:
+            return Result(**self.failure)
+        for pattern, output in self.outputs:
+            if pattern.search(command):
+                return Result(**output)
+        return Result(
+            status=MISSING_STATUS,
+            stdout='',
+            stderr=f'fake ssh: no output recorded for: {command}',
+        )
+
+    def __enter__(self):
+        self._factory = ssh.client_factory(self)
+        return self._factory.__enter__()
+
+    def __exit__(self, *exc_info):
+        factory, self._factory = self._factory, None
+        return factory.__exit__(*exc_info)
+
+
+@contextmanager
+def recording(path):
+    """Record the outputs of the commands run in the context, to replay them with
+    ``FakeSSH.from_file``
+
+    :param path: The JSON lines file the outputs are appended to.
+    """
+    from robottelo.hosts import ContentHost
+
+    lock = threading.Lock()
+
+    class RecordingHost(ContentHost):
+        def execute(self, command, *args, **kwargs):
+            result = super().execute(command, *args, **kwargs)
+            output = {
+                'command': f'^{re.escape(command)}$',
+                'stdout': result.stdout,
+                'stderr': result.stderr,
+                'status': result.status,
+            }
+            with lock, Path(path).open('a') as record_file:
+                record_file.write(json.dumps(output) + '\n')
+            return result
+
+    with ssh.client_factory(RecordingHost):
+        yield
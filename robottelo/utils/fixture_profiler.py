@@ -0,0 +1,194 @@
+"""Attribution of the fixtures setup and teardown costs.
+
+The setup and teardown of the fixtures are timed on a stack, so that the time spent
+in the fixtures they request is attributed to those, and the SSH commands, hammer
+calls and API requests issued meanwhile are counted for the fixture on top of the
+stack. The profile is grouped by fixture name and scope, and the self times are
+also aggregated by fixture stack, in the folded format of the flame graph tools.
+"""
+
+from collections import Counter
+import functools
+import json
+import re
+import threading
+import time
+
+from broker.hosts import Host
+import requests
+
+COUNTERS = ('ssh', 'hammer', 'api')
+HAMMER_COMMAND = re.compile(r'(^|[\s;&|(])hammer\s')
+
+
+class FixtureProfiler:
+    """Profiles the fixtures setup and teardown"""
+
+    def __init__(self):
+        self.fixtures = {}
+        self.folded = Counter()
+        self._stack = []
+        self._lock = threading.Lock()
+        self._patched = {}
+
+    def start(self, name, scope, phase, key=None):
+        """Start timing a fixture phase, nested in the fixture phase being timed
+
+        :param str phase: ``setup`` or ``teardown``.
+        :param key: Identifies the fixture instance, its name by default.
+        """
+        with self._lock:
+            path = f'{self._stack[-1].path};{name}' if self._stack else f'{phase};{name}'
+            self._stack.append(_Frame(key or name, name, scope, phase, path))
+
+    def stop(self, key):
+        """Stop timing the fixture phase on top of the stack, if it is the one given"""
+        with self._lock:
+            if not self._stack or self._stack[-1].key != key:
+                return
+            frame = self._stack.pop()
+            elapsed = time.monotonic() - frame.start
+            if self._stack:
+                self._stack[-1].children += elapsed
+            fixture = self.fixtures.setdefault(
+                frame.name, {'scope': frame.scope, 'setup': Counter(), 'teardown': Counter()}
+            )
+            stats = fixture[frame.phase]
+            stats.update(frame.counts)
+            stats['calls'] += 1
+            stats['total'] += elapsed
+            stats['self'] += elapsed - frame.children
+            self.folded[frame.path] += elapsed - frame.children
+
+    def count(self, kind):
+        """Count an SSH command, hammer call or API request for the fixture being timed"""
+        with self._lock:
+            if self._stack:
+                self._stack[-1].counts[kind] += 1
+
+    def instrument(self):
+        """Count the SSH commands, hammer calls and API requests issued from now on"""
+        profiler = self
+
+        def execute(original):
+            @functools.wraps(original)
+            def wrapper(host, command, *args, **kwargs):
+                profiler.count('ssh')
+                if HAMMER_COMMAND.search(command):
+                    profiler.count('hammer')
+                return original(host, command, *args, **kwargs)
+
+            return wrapper
+
+        def request(original):
+            @functools.wraps(original)
+            def wrapper(session, method, url, *args, **kwargs):
+                if '/api/' in str(url):
+                    profiler.count('api')
+                return original(session, method, url, *args, **kwargs)
+
+            return wrapper
+
+        for owner, name, wrap in (
+            (Host, 'execute', execute),
+            (requests.Session, 'request', request),
+        ):
+            self._patched[owner, name] = getattr(owner, name)
+            setattr(owner, name, wrap(getattr(owner, name)))
+
+    def uninstrument(self):
+        for (owner, name), original in self._patched.items():
+            setattr(owner, name, original)
+        self._patched.clear()
+
+    def profile(self):
+        """Return the profile, as saved in the JSON artifact"""
+        return {
+            'fixtures': {
+                name: {
+                    'scope': fixture['scope'],
+                    **{
+                        phase: _phase_stats(fixture[phase])
+                        for phase in ('setup', 'teardown')
+                        if fixture[phase]
+                    },
+                }
+                for name, fixture in self.fixtures.items()
+            },
+            'folded': {path: round(seconds, 3) for path, seconds in self.folded.items()},
+        }
+
+    def save(self, path):
+        with open(path, 'w') as profile_file:
+            json.dump(self.profile(), profile_file, indent=2, sort_keys=True)
+
+
+class _Frame:
+    def __init__(self, key, name, scope, phase, path):
+        self.key = key
+        self.name = name
+        self.scope = scope
+        self.phase = phase
+        self.path = path
+        self.start = time.monotonic()
+        self.children = 0.0
+        self.counts = Counter()
+
+
+def _phase_stats(stats):
+    return {
+        'calls': stats['calls'],
+        'total': round(stats['total'], 3),
+        'self': round(stats['self'], 3),
+        **{kind: stats[kind] for kind in COUNTERS},
+    }
+
+
+def merge_profiles(profiles):
+    """Merge profiles, of the xdist workers for instance, into one"""
+    merged = {'fixtures': {}, 'folded': Counter()}
+    for profile in profiles:
+        for name, fixture in profile['fixtures'].items():
+            target = merged['fixtures'].setdefault(name, {'scope': fixture['scope']})
+            for phase in ('setup', 'teardown'):
+                if phase in fixture:
+                    stats = target.setdefault(phase, {})
+                    for key, value in fixture[phase].items():
+                        stats[key] = stats.get(key, 0) + value
+        merged['folded'].update(profile['folded'])
+    merged['folded'] = dict(merged['folded'])
+    return merged
+
+
+def folded_lines(profile):
+    """Return the folded stacks of a profile with their self time in milliseconds, the
+    input format of flamegraph.pl and speedscope"""
+    return [
+        f'{path} {round(seconds * 1000)}' for path, seconds in sorted(profile['folded'].items())
+    ]
+
+
+def report_lines(profile, top=20):
+    """Return a table of the fixtures with the longest setup and teardown"""
+
+    def cost(fixture):
+        return sum(fixture.get(phase, {}).get('total', 0) for phase in ('setup', 'teardown'))
+
+    fixtures = sorted(profile['fixtures'].items(), key=lambda item: -cost(item[1]))[:top]
+    if not fixtures:
+        return []
+    longest = cost(fixtures[0][1]) or 1
+    lines = [
+        f'{"fixture":40} {"scope":8} {"calls":>5} {"setup":>9} {"self":>9} {"teardown":>9} '
+        f'{"ssh":>5} {"hammer":>6} {"api":>5}'
+    ]
+    for name, fixture in fixtures:
+        setup, teardown = fixture.get('setup', {}), fixture.get('teardown', {})
+        counts = {kind: setup.get(kind, 0) + teardown.get(kind, 0) for kind in COUNTERS}
+        lines.append(
+            f'{name[:40]:40} {fixture["scope"]:8} {setup.get("calls", 0):>5} '
+            f'{setup.get("total", 0):>8.1f}s {setup.get("self", 0):>8.1f}s '
+            f'{teardown.get("total", 0):>8.1f}s {counts["ssh"]:>5} {counts["hammer"]:>6} '
+            f'{counts["api"]:>5} {"#" * round(20 * cost(fixture) / longest)}'
+        )
+    return lines
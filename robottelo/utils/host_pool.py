@@ -0,0 +1,128 @@
+"""Session wide pool of content hosts reused across tests.
+
+Instead of a Broker checkout and checkin per test, the hosts are leased to the
+tests and reset between leases: unregistered, their host record deleted, the
+katello-ca consumer removed, the custom facts cleared and the yum repositories
+restored to their state at checkout. A host which fails the verification of its
+reset is quarantined: checked in and never leased again. A host a test keeps, by
+setting its ``_skip_context_checkin`` as for a Broker context, is dropped from the
+pool, neither reset nor checked in.
+"""
+
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+import json
+import threading
+
+from broker import Broker
+
+from robottelo.logging import logger
+
+BASELINE_DIR = '/var/tmp/robottelo_host_pool'
+
+
+def save_baseline(host):
+    """Save the yum repositories of a freshly checked out host, to restore them on reset"""
+    result = host.execute(
+        f'rm -rf {BASELINE_DIR} && mkdir -p {BASELINE_DIR} && '
+        f'cp -a /etc/yum.repos.d {BASELINE_DIR}/yum.repos.d'
+    )
+    if result.status != 0:
+        raise RuntimeError(f'Failed to save the baseline of {host.hostname}: {result.stderr}')
+
+
+def reset_host(host):
+    """Reset a host to its state at checkout, with ``ContentHost.teardown`` semantics"""
+    host.teardown()
+    host.remove_katello_ca()
+    host.execute(
+        'rm -f /etc/rhsm/facts/*.facts && rm -rf /etc/yum.repos.d && '
+        f'cp -a {BASELINE_DIR}/yum.repos.d /etc/yum.repos.d && yum clean all'
+    )
+    host.clean_cached_properties()
+
+
+def verify_reset(host):
+    """Return the list of the reset checks the host fails"""
+    checks = {
+        'registered': 'subscription-manager identity',
+        'katello-ca installed': 'rpm -qa | grep -q katello-ca-consumer',
+        'custom facts present': 'ls /etc/rhsm/facts/*.facts',
+        'repositories changed': f'! diff -r {BASELINE_DIR}/yum.repos.d /etc/yum.repos.d',
+    }
+    script = ' ; '.join(
+        f'{command} >/dev/null 2>&1 && echo "{failure}"' for failure, command in checks.items()
+    )
+    return host.execute(f'{script} ; true').stdout.splitlines()
+
+
+class ContentHostPool:
+    """Pool of content hosts indexed by their Broker deployment arguments"""
+
+    def __init__(self):
+        self._idle = defaultdict(list)
+        self._lock = threading.Lock()
+        self.quarantined = []
+        self.stats = Counter()
+
+    @staticmethod
+    def key(conf):
+        return json.dumps(conf, sort_keys=True, default=str)
+
+    def _acquire(self, conf, host_class):
+        with self._lock:
+            idle = self._idle[self.key(conf)]
+            host = idle.pop() if idle else None
+        if host is not None:
+            self.stats['reused'] += 1
+            return host
+        host = Broker(**conf, host_class=host_class).checkout()
+        try:
+            host.setup()
+            save_baseline(host)
+        except Exception:
+            Broker(hosts=[host]).checkin()
+            raise
+        self.stats['checked_out'] += 1
+        return host
+
+    def _release(self, conf, host):
+        if getattr(host, '_skip_context_checkin', False):
+            logger.info(f'Content host {host.hostname} kept by its test, dropped from the pool')
+            self.stats['kept'] += 1
+            return
+        try:
+            reset_host(host)
+            failures = verify_reset(host)
+        except Exception as err:
+            failures = [f'reset failed: {err}']
+        if failures:
+            logger.warning(f'Quarantining content host {host.hostname}: {", ".join(failures)}')
+            self.stats['quarantined'] += 1
+            self.quarantined.append(host.hostname)
+            Broker(hosts=[host]).checkin()
+            return
+        with self._lock:
+            self._idle[self.key(conf)].append(host)
+
+    @contextmanager
+    def lease(self, conf, host_class):
+        """Lease a host deployed with the Broker arguments, reusing an idle one if any
+
+        :param dict conf: Broker deployment arguments, as returned by ``host_conf``.
+        :param host_class: Class of the host, ``ContentHost`` or a subclass.
+        """
+        host = self._acquire(conf, host_class)
+        try:
+            yield host
+        finally:
+            self._release(conf, host)
+
+    def close(self):
+        """Check in all the idle hosts"""
+        with self._lock:
+            hosts = [host for idle in self._idle.values() for host in idle]
+            self._idle.clear()
+        if hosts:
+            Broker(hosts=hosts).checkin()
+        logger.info(f'Content host pool closed: {dict(self.stats)}')
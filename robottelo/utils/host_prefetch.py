@@ -0,0 +1,114 @@
+"""Checkout of Broker hosts ahead of the tests needing them.
+
+The expected demand for a host type is computed at collection time. Up to a quota
+of hosts are checked out in background threads and handed to the fixtures from a
+ready queue, a new checkout being started whenever a host is taken while more are
+expected to be needed. The hosts left unused are checked in at session end.
+"""
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+
+from broker import Broker
+
+from robottelo.logging import logger
+
+
+class HostPrefetcher:
+    """Prefetches the hosts returned by a checkout function"""
+
+    def __init__(self, name, checkout, demand, quota):
+        """
+        :param str name: Name of the host type, for logging.
+        :param checkout: Function checking out and returning a host.
+        :param int demand: Number of hosts expected to be needed.
+        :param int quota: Maximum number of hosts prefetched or being prefetched.
+        """
+        self.name = name
+        self._checkout = checkout
+        self._remaining = demand
+        self._quota = quota
+        self._outstanding = 0
+        self._closed = False
+        self._ready = queue.Queue()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(quota, 1), thread_name_prefix=f'prefetch-{name}'
+        )
+        self.stats = Counter()
+        self._fill()
+
+    def _fill(self):
+        with self._lock:
+            while not self._closed and self._outstanding < min(self._quota, self._remaining):
+                self._outstanding += 1
+                self._executor.submit(self._prefetch)
+
+    def _prefetch(self):
+        try:
+            host = self._checkout()
+        except Exception as err:
+            logger.warning(f'Prefetching a {self.name} host failed: {err}')
+            host = None
+        self._ready.put(host)
+
+    def get(self):
+        """Return a prefetched host, waiting for one being checked out if needed.
+
+        :return: The host, ``None`` when no prefetched host is available and the
+            caller should check out a host itself.
+        """
+        with self._lock:
+            self._remaining = max(self._remaining - 1, 0)
+            if not self._outstanding:
+                self.stats['missed'] += 1
+                return None
+            self._outstanding -= 1
+        host = self._ready.get()
+        self._fill()
+        self.stats['hits' if host else 'failed'] += 1
+        return host
+
+    def close(self):
+        """Stop prefetching and check in the hosts left unused"""
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        unused = []
+        while not self._ready.empty():
+            if host := self._ready.get():
+                unused.append(host)
+        if unused:
+            Broker(hosts=unused).checkin()
+        logger.info(
+            f'{self.name} prefetcher closed, {len(unused)} unused hosts checked in: '
+            f'{dict(self.stats)}'
+        )
+
+
+def calls_factory(factory, when=None):
+    """Declare that a fixture calls a host factory with its default arguments, the calls
+    served by the prefetched hosts, for the expected demand of the factory.
+
+    Usage::
+
+        @pytest.fixture
+        @calls_factory('satellite_factory', when=_checks_out_satellite_host)
+        def satellite_host(request, satellite_factory):
+            ...
+
+    :param str factory: Name of the factory fixture.
+    :param when: Called with a test item, or the node of the fixture request, whether the
+        fixture calls the factory for it, always by default.
+    """
+
+    def decorator(func):
+        func.factory_calls = {
+            **getattr(func, 'factory_calls', {}),
+            factory: when or (lambda node: True),
+        }
+        return func
+
+    return decorator
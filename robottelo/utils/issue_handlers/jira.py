@@ -1,10 +1,19 @@
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import re
+import threading
+import time
 
 from packaging.version import Version
 import pytest
 import requests
-from tenacity import retry, stop_after_attempt, wait_fixed
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+    wait_fixed,
+)
 
 from robottelo.config import settings
 from robottelo.constants import (
@@ -20,6 +29,9 @@ from robottelo.logging import logger
 # The .version group being a `d.d` string that can be casted to Version()
 VERSION_RE = re.compile(r'(?:sat-)*?(?P<version>\d\.\d)\.\w*')
 
+# the default maxResults of a Jira search, the issues searched at once at most
+JIRA_SEARCH_MAX_RESULTS = 50
+
 
 def is_open_jira(issue_id, data=None):
     """Check if specific Jira is open consulting a cached `data` dict or
@@ -274,22 +286,17 @@ def get_default_jira(issue_id):  # pragma: no cover
     }
 
 
-def add_comment_on_jira(
-    issue_id,
-    comment,
-    comment_type=settings.jira.comment_type,
-    comment_visibility=settings.jira.comment_visibility,
-):
+def add_comment_on_jira(issue_id, comment, comment_type=None, comment_visibility=None):
     """Adds a new comment to a Jira issue.
 
     Arguments:
         issue_id {str} -- Jira issue number, ex. SAT-12232
         comment {str}  -- Comment to add on the issue.
-        comment_type {str}  -- Type of comment to add.
-        comment_visibility {str}  -- Comment visibility.
+        comment_type {str}  -- Type of comment to add, ``jira.comment_type`` by default.
+        comment_visibility {str}  -- Comment visibility, ``jira.comment_visibility`` by default.
 
     Returns:
-        [list of dicts] -- [{'id':..., 'status':..., 'resolution': ...}]
+        [dict] -- The comment added, None if not added
     """
     # Raise a warning if any of the following option is not set. Note: It's a xor condition.
     if settings.jira.enable_comment != bool(pytest.jira_comments):
@@ -302,21 +309,179 @@ def add_comment_on_jira(
     data = try_from_cache(issue_id)
     if data["status"] in settings.jira.issue_status:
         logger.debug(f"Adding a new comment on {issue_id} Jira issue.")
-        response = requests.post(
+        with requests.Session() as session:
+            return _post_jira_comment(
+                session,
+                issue_id,
+                comment,
+                RateLimiter(None),
+                settings.jira.comment_retries,
+                comment_type=comment_type,
+                comment_visibility=comment_visibility,
+            )
+    logger.warning(
+        f"Jira comments are currently disabled for this issue because it's in {data['status']} state. "
+        f"Please update issue_status in jira.conf to overide this behaviour."
+    )
+    return None
+
+
+def get_jira_issues_data(issue_ids):
+    """Resolve data of many Jira issues at once.
+
+    Issues already loaded on pytest collection are reused, the remaining ones are
+    fetched with a Jira search per ``JIRA_SEARCH_MAX_RESULTS`` issues instead of one
+    request per issue.
+
+    Arguments:
+        issue_ids {list of str} -- ['SAT-12345', ...]
+
+    Returns:
+        [dict] -- Issue data indexed by issue id
+    """
+    resolved = {}
+    for issue_id in issue_ids:
+        try:
+            if pytest.issue_data[issue_id]['data']:
+                resolved[issue_id] = pytest.issue_data[issue_id]['data']
+        except (KeyError, AttributeError, TypeError):
+            pass
+    missing = sorted(set(issue_ids) - set(resolved))
+    for start in range(0, len(missing), JIRA_SEARCH_MAX_RESULTS):
+        for data in get_data_jira(missing[start : start + JIRA_SEARCH_MAX_RESULTS]):
+            resolved[data['key']] = data
+            CACHED_RESPONSES['get_single'][data['key']] = data
+    return {
+        issue_id: resolved.get(issue_id) or get_default_jira(issue_id) for issue_id in issue_ids
+    }
+
+
+class RateLimiter:
+    """Thread safe limiter spacing out calls to at most ``rate`` calls per second"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0
+        self._lock = threading.Lock()
+        self._next_call = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_call - now
+            self._next_call = max(now, self._next_call) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _is_retryable_jira_error(exception):
+    """Retry on connection errors, throttling (429) and server side (5xx) errors"""
+    if isinstance(exception, requests.HTTPError):
+        return exception.response is not None and (
+            exception.response.status_code == 429 or exception.response.status_code >= 500
+        )
+    return isinstance(exception, requests.ConnectionError | requests.Timeout)
+
+
+def _post_jira_comment(
+    session, issue_id, comment, limiter, retries, comment_type=None, comment_visibility=None
+):
+    """Post a comment on a Jira issue, retrying with exponential backoff"""
+
+    @retry(
+        retry=retry_if_exception(_is_retryable_jira_error),
+        stop=stop_after_attempt(retries + 1),
+        wait=wait_exponential(multiplier=1, max=30),
+        reraise=True,
+    )
+    def _post():
+        limiter.wait()
+        response = session.post(
             f"{settings.jira.url}/rest/api/latest/issue/{issue_id}/comment",
             json={
                 "body": comment,
                 "visibility": {
-                    "type": comment_type,
-                    "value": comment_visibility,
+                    "type": comment_type or settings.jira.comment_type,
+                    "value": comment_visibility or settings.jira.comment_visibility,
                 },
             },
             headers={"Authorization": f"Bearer {settings.jira.api_key}"},
+            timeout=60,
         )
         response.raise_for_status()
         return response.json()
-    logger.warning(
-        f"Jira comments are currently disabled for this issue because it's in {data['status']} state. "
-        f"Please update issue_status in jira.conf to overide this behaviour."
-    )
-    return None
+
+    return _post()
+
+
+def add_comments_on_jira(comments, dry_run=False, max_workers=None, rate_limit=None, retries=None):
+    """Adds comments to many Jira issues concurrently.
+
+    Issue data is resolved in bulk and only issues in one of the
+    ``jira.issue_status`` states are commented. Comments are posted from a
+    thread pool, throttled to ``rate_limit`` requests per second and retried
+    with exponential backoff on throttling and server errors.
+
+    Arguments:
+        comments {dict} -- Comment body indexed by Jira issue id, ex. {'SAT-12232': '...'}
+        dry_run {bool} -- Only log the comments that would be added.
+        max_workers {int} -- Number of concurrent requests, ``jira.comment_workers`` by default.
+        rate_limit {float} -- Requests per second, ``jira.comment_rate_limit`` by default.
+        retries {int} -- Retries per comment, ``jira.comment_retries`` by default.
+
+    Returns:
+        [dict] -- Outcome indexed by issue id, one of posted, skipped, dry-run or failed
+    """
+    if settings.jira.enable_comment != bool(pytest.jira_comments):
+        logger.warning(
+            'Jira comments are currently disabled for this run. '
+            'To enable it, please set "enable_comment" to "true" in "config/jira.yaml '
+            'and provide --jira-comment pytest option."'
+        )
+        return {}
+    if not comments:
+        return {}
+    max_workers = max_workers or settings.jira.comment_workers
+    rate_limit = settings.jira.comment_rate_limit if rate_limit is None else rate_limit
+    retries = settings.jira.comment_retries if retries is None else retries
+
+    results = {}
+    to_post = {}
+    for issue_id, data in get_jira_issues_data(list(comments)).items():
+        if data['status'] not in settings.jira.issue_status:
+            logger.warning(
+                f"Jira comments are currently disabled for {issue_id} because it's in "
+                f"{data['status']} state. Please update issue_status in jira.conf to overide "
+                "this behaviour."
+            )
+            results[issue_id] = 'skipped'
+        elif dry_run:
+            logger.info(
+                f'Dry run, skipping comment on {issue_id} Jira issue:\n{comments[issue_id]}'
+            )
+            results[issue_id] = 'dry-run'
+        else:
+            to_post[issue_id] = comments[issue_id]
+    if not to_post:
+        return results
+
+    logger.debug(f'Adding comments on {len(to_post)} Jira issues with {max_workers} workers.')
+    limiter = RateLimiter(rate_limit)
+    with (
+        requests.Session() as session,
+        ThreadPoolExecutor(max_workers=max_workers) as executor,
+    ):
+        futures = {
+            executor.submit(_post_jira_comment, session, issue_id, comment, limiter, retries): (
+                issue_id
+            )
+            for issue_id, comment in to_post.items()
+        }
+        for future in as_completed(futures):
+            issue_id = futures[future]
+            try:
+                future.result()
+                results[issue_id] = 'posted'
+            except Exception as e:
+                logger.warning(f'Failed to add comment to Jira issue {issue_id}: {e}')
+                results[issue_id] = 'failed'
+    return results
@@ -0,0 +1,64 @@
+"""Incremental reading of log files on remote hosts"""
+
+from robottelo import ssh
+from robottelo.logging import logger
+
+
+class RemoteLogCursor:
+    """Read a remote log file incrementally, fetching only the bytes appended since
+    the previous read.
+
+    The cursor remembers the inode and byte offset of the file. When the file was
+    rotated or truncated, detected by an inode change or a size smaller than the
+    offset, reading restarts from the beginning of the new file.
+
+    Usage::
+
+        cursor = RemoteLogCursor('/var/log/rhsm/rhsm.log', hostname='host.example.com')
+        new_lines = cursor.read()
+        # ... later, only what was logged in the meantime is transferred
+        new_lines = cursor.read()
+    """
+
+    def __init__(self, path, **connection_kwargs):
+        """
+        :param str path: Path of the log file on the remote host.
+        :param connection_kwargs: ``hostname``, ``username``, ``password`` and ``port``
+            passed to ``robottelo.ssh.command``.
+        """
+        self.path = path
+        self.connection_kwargs = connection_kwargs
+        self.inode = None
+        self.offset = 0
+        self.rotations = 0
+
+    def reset(self):
+        """Forget the position, next read starts from the beginning of the file"""
+        self.inode = None
+        self.offset = 0
+
+    def _fetch(self, offset):
+        """Return the inode, the size and the file content from offset up to that size"""
+        result = ssh.command(
+            f"s=$(stat -c '%i %s' {self.path}) && echo \"$s\" && "
+            f"tail -c +{offset + 1} {self.path} | head -c $(( ${{s#* }} - {offset} ))",
+            **self.connection_kwargs,
+        )
+        if result.status != 0:
+            # the file does not exist (yet)
+            return None, 0, ''
+        header, _, content = result.stdout.partition('\n')
+        inode, size = header.split()
+        return inode, int(size), content
+
+    def read(self):
+        """Return the content appended to the file since the previous read"""
+        inode, size, content = self._fetch(self.offset)
+        if self.inode is not None and (inode != self.inode or size < self.offset):
+            logger.debug(f'{self.path} was rotated, reading it from the beginning')
+            self.rotations += 1
+            self.reset()
+            inode, size, content = self._fetch(0)
+        self.inode = inode
+        self.offset = size
+        return content
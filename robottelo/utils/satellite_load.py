@@ -0,0 +1,140 @@
+"""Load aware assignment of pytest-xdist workers to Satellites.
+
+The live load of every candidate Satellite is sampled once per test run, each
+Satellite is scored by its weighted free capacity and the xdist workers are
+distributed proportionally to those capacities. The first worker to start takes
+the decision and records it in the robottelo tmp dir, the other workers of the
+same run reuse it.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+
+from box import Box
+from broker.helpers import FileLock
+import requests
+
+from robottelo.config import get_credentials, robottelo_tmp_dir, settings
+from robottelo.logging import logger
+
+DEFAULT_WEIGHTS = {'load_average': 1.0, 'running_tasks': 0.1, 'dynflow_queue': 0.05}
+
+
+def _count_tasks(satellite, search):
+    response = requests.get(
+        f'{satellite.url}/foreman_tasks/api/tasks',
+        params={'search': search, 'per_page': 1},
+        auth=get_credentials(),
+        verify=settings.server.verify_ca,
+        timeout=30,
+    )
+    response.raise_for_status()
+    return int(response.json()['subtotal'])
+
+
+def sample_satellite_load(hostname):
+    """Sample the live load of a Satellite.
+
+    :param str hostname: The Satellite hostname.
+    :return: A Box with the cpus count, 1 minute load average, running foreman tasks
+        and dynflow queue depth, the tasks planned but not yet running.
+    """
+    from robottelo.hosts import Satellite
+
+    satellite = Satellite(hostname)
+    cpus, load_average = satellite.execute("nproc && cut -d' ' -f1 /proc/loadavg").stdout.split()
+    return Box(
+        cpus=int(cpus),
+        load_average=float(load_average),
+        running_tasks=_count_tasks(satellite, 'state = running'),
+        dynflow_queue=_count_tasks(satellite, 'state = planned or state = scheduled'),
+    )
+
+
+def sample_satellites_load(hostnames, sampler=sample_satellite_load):
+    """Sample the load of all the Satellites concurrently.
+
+    :return: Load samples indexed by hostname, ``None`` for unreachable Satellites.
+    """
+
+    def _sample(hostname):
+        try:
+            return sampler(hostname)
+        except Exception as err:
+            logger.warning(f'Unable to sample the load of Satellite {hostname}: {err}')
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(len(hostnames), 1)) as executor:
+        return dict(zip(hostnames, executor.map(_sample, hostnames), strict=True))
+
+
+def capacity_score(load, weights=None):
+    """Return the free capacity of a Satellite, between 0 (unreachable or saturated) and 1"""
+    if load is None:
+        return 0.0
+    weights = {**DEFAULT_WEIGHTS, **{key.lower(): value for key, value in (weights or {}).items()}}
+    pressure = (
+        weights['load_average'] * load.load_average / max(load.cpus, 1)
+        + weights['running_tasks'] * load.running_tasks
+        + weights['dynflow_queue'] * load.dynflow_queue
+    )
+    return 1 / (1 + pressure)
+
+
+def assign_workers(scores, worker_count):
+    """Distribute the workers to the Satellites proportionally to their scores.
+
+    Largest remainder allocation, the workers slots are then interleaved so that the
+    first workers are spread over the Satellites with the most capacity.
+
+    :param dict scores: Capacity score indexed by hostname.
+    :param int worker_count: Number of xdist workers.
+    :return: List of hostnames indexed by worker position.
+    """
+    candidates = {hostname: score for hostname, score in scores.items() if score > 0}
+    if not candidates:
+        # no usable load sample, fall back to an even distribution
+        candidates = dict.fromkeys(scores, 1.0)
+    total = sum(candidates.values())
+    quotas = {hostname: worker_count * score / total for hostname, score in candidates.items()}
+    allocation = {hostname: int(quota) for hostname, quota in quotas.items()}
+    by_remainder = sorted(quotas, key=lambda hostname: (allocation[hostname] - quotas[hostname]))
+    for hostname in by_remainder[: worker_count - sum(allocation.values())]:
+        allocation[hostname] += 1
+    ordered = sorted(allocation, key=lambda hostname: -candidates[hostname])
+    assignment = []
+    while len(assignment) < worker_count:
+        for hostname in ordered:
+            if allocation[hostname]:
+                assignment.append(hostname)
+                allocation[hostname] -= 1
+    return assignment
+
+
+def load_aware_assignment(run_id, hostnames, worker_count, sampler=sample_satellite_load):
+    """Return the load aware assignment of a test run, computing it on first call.
+
+    The decision, with the load samples and scores it is based on, is recorded in a
+    json file shared by all the workers of the run.
+
+    :param str run_id: Unique id of the test run, as the xdist ``testrun_uid``.
+    :param list hostnames: Candidate Satellite hostnames.
+    :param int worker_count: Number of xdist workers.
+    :return: A Box with ``assignment``, the hostnames indexed by worker position,
+        and the ``loads`` and ``scores`` indexed by hostname.
+    """
+    decision_file = robottelo_tmp_dir.joinpath(f'xdist_load_aware_{run_id}.json')
+    with FileLock(decision_file, timeout=600):
+        if decision_file.exists() and decision_file.stat().st_size:
+            return Box(json.loads(decision_file.read_text()))
+        loads = sample_satellites_load(hostnames, sampler=sampler)
+        weights = settings.server.get('load_aware_weights')
+        scores = {hostname: capacity_score(load, weights) for hostname, load in loads.items()}
+        decision = Box(
+            loads=loads,
+            scores=scores,
+            assignment=assign_workers(scores, worker_count),
+        )
+        decision_file.write_text(decision.to_json(indent=2))
+        logger.info(f'Load aware Satellite assignment recorded in {decision_file}: {decision}')
+    return decision
@@ -13,16 +13,13 @@ def get_client(
 
     Processes ssh credentials in the order: password, key_filename, ssh_key
     Config validation enforces one of the three must be set in settings.server
+
+    The hosts are made by ``robottelo.ssh.get_client``, the clients of the
+    ``robottelo.ssh.client_factory`` in its context.
     """
-    from robottelo.config import settings
-    from robottelo.hosts import ContentHost
-
-    return ContentHost(
-        hostname=hostname or settings.server.hostname,
-        username=username or settings.server.ssh_username,
-        password=password or settings.server.ssh_password,
-        port=port or settings.server.ssh_client.port,
-    )
+    from robottelo import ssh
+
+    return ssh.get_client(hostname=hostname, username=username, password=password, port=port)
 
 
 def command(
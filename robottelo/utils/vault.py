@@ -1,14 +1,34 @@
-"""Hashicorp Vault Utils where vault CLI is wrapped to perform vault operations"""
+"""Hashicorp Vault Utils where vault CLI is wrapped to perform vault operations
+
+The token is cached with its expiry time in a credential cache shared by the processes,
+the xdist workers included, so the vault is logged in once per token lifetime. The
+vault secrets are loaded in the settings on the first access of a key missing from the
+configuration files, as the ``@format {this.vault_secret}`` settings refer to them,
+see ``VaultSettings``.
+"""
 
 import json
 import os
 import re
 import subprocess
 import sys
+import time
+
+from dynaconf.base import Settings
+from dynaconf.validator import ValidationError
+from pytest_services.locks import file_lock
 
 from robottelo.exceptions import InvalidVaultURLForOIDC
 from robottelo.logging import logger, robottelo_root_dir
 
+VAULT_LOADER = 'dynaconf.loaders.vault_loader'
+# seconds before its expiry a cached token is not used anymore
+TOKEN_EXPIRY_MARGIN = 300
+# seconds to wait for another process logging in, the OIDC login may take a while
+TOKEN_LOCK_TIMEOUT = 300
+# the keys a lazy formatted setting refers to, as in '@format {this.vault_secret}'
+REFERENCE_RE = re.compile(r'\{this\.(\w+)')
+
 
 class Vault:
     HELP_TEXT = (
@@ -17,8 +37,9 @@ class Vault:
         "install vault CLI as per your system spec!"
     )
 
-    def __init__(self, env_file='.env'):
+    def __init__(self, env_file='.env', token_cache='.vault_token.json'):
         self.env_path = robottelo_root_dir.joinpath(env_file)
+        self.token_cache_path = robottelo_root_dir.joinpath(token_cache)
         self.envdata = None
         self.vault_enabled = None
 
@@ -75,34 +96,80 @@ class Vault:
                     logger.error(f"Error! {verror}")
         return vcommand
 
+    def cached_token(self):
+        """Return the cached token of the vault, None if missing or about to expire"""
+        try:
+            cached = json.loads(self.token_cache_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if cached.get('url') != os.environ.get('VAULT_ADDR'):
+            return None
+        if cached['expires'] is not None and cached['expires'] - TOKEN_EXPIRY_MARGIN < time.time():
+            return None
+        return cached['token']
+
+    def cache_token(self, **kwargs):
+        """Look the current token up and cache it with its expiry time
+
+        :return: The token.
+        """
+        lookup = self.exec_vault_command("vault token lookup --format json", **kwargs).stdout
+        data = json.loads(str(lookup.decode('UTF-8')))['data']
+        cached = {
+            'url': os.environ.get('VAULT_ADDR'),
+            'token': data['id'],
+            # a token without ttl never expires
+            'expires': time.time() + data['ttl'] if data['ttl'] else None,
+        }
+        # written aside then renamed, the other processes never read a partial file
+        tmp_path = self.token_cache_path.with_name(f'{self.token_cache_path.name}.{os.getpid()}')
+        tmp_path.touch(mode=0o600)
+        tmp_path.write_text(json.dumps(cached))
+        os.replace(tmp_path, self.token_cache_path)
+        return cached['token']
+
     def login(self, **kwargs):
+        """Log the vault in unless a valid token is cached, one process at a time
+
+        :return: The token, exported for dynaconf, or None when vault is not enabled or
+            authenticated with AppRole.
+        """
         if (
-            self.vault_enabled
-            and self.vault_enabled in ['True', 'true']
-            and 'VAULT_SECRET_ID_FOR_DYNACONF' not in os.environ
-            and self.status(**kwargs).returncode != 0
+            not self.vault_enabled
+            or self.vault_enabled not in ['True', 'true']
+            or 'VAULT_SECRET_ID_FOR_DYNACONF' in os.environ
         ):
-            logger.info(
-                "Warning! The browser is about to open for vault OIDC login, "
-                "close the tab once the sign-in is done!"
-            )
-            if (
-                self.exec_vault_command(command="vault login -method=oidc", **kwargs).returncode
-                == 0
-            ):
-                self.exec_vault_command(command="vault token renew -i 10h", **kwargs)
-                logger.info("Success! Vault OIDC Logged-In and extended for 10 hours!")
-            # Fetching tokens
-            token = self.exec_vault_command("vault token lookup --format json").stdout
-            token = json.loads(str(token.decode('UTF-8')))['data']['id']
-            # Setting new token in env file
-            _envdata = re.sub(
-                '.*VAULT_TOKEN_FOR_DYNACONF=.*',
-                f"VAULT_TOKEN_FOR_DYNACONF={token}",
-                self.envdata,
-            )
-            self.env_path.write_text(_envdata)
-            logger.info("Success! New OIDC token added to .env file to access secrets from vault!")
+            return None
+        lock_path = self.token_cache_path.with_suffix('.lock')
+        with file_lock(lock_path, remove=False, timeout=TOKEN_LOCK_TIMEOUT):
+            token = self.cached_token()
+            if token is None:
+                if self.status(**kwargs).returncode != 0:
+                    logger.info(
+                        "Warning! The browser is about to open for vault OIDC login, "
+                        "close the tab once the sign-in is done!"
+                    )
+                    if (
+                        self.exec_vault_command(
+                            command="vault login -method=oidc", **kwargs
+                        ).returncode
+                        == 0
+                    ):
+                        self.exec_vault_command(command="vault token renew -i 10h", **kwargs)
+                        logger.info("Success! Vault OIDC Logged-In and extended for 10 hours!")
+                token = self.cache_token(**kwargs)
+                # Setting new token in env file
+                _envdata = re.sub(
+                    '.*VAULT_TOKEN_FOR_DYNACONF=.*',
+                    f"VAULT_TOKEN_FOR_DYNACONF={token}",
+                    self.envdata,
+                )
+                self.env_path.write_text(_envdata)
+                logger.info(
+                    "Success! New OIDC token added to .env file to access secrets from vault!"
+                )
+        os.environ['VAULT_TOKEN_FOR_DYNACONF'] = token
+        return token
 
     def logout(self):
         # Teardown - Setting dymmy token in env file
@@ -110,6 +177,7 @@ class Vault:
             '.*VAULT_TOKEN_FOR_DYNACONF=.*', "# VAULT_TOKEN_FOR_DYNACONF=myroot", self.envdata
         )
         self.env_path.write_text(_envdata)
+        self.token_cache_path.unlink(missing_ok=True)
         vstatus = self.exec_vault_command('vault token revoke -self')
         if vstatus.returncode == 0:
             logger.info("Success! OIDC token removed from Env file successfully!")
@@ -126,3 +194,103 @@ class Vault:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.teardown()
+
+
+class VaultSettings(Settings):
+    """Dynaconf settings loading the vault secrets lazily
+
+    The vault loader is left out of the loaders run on setup, the secrets are loaded on
+    the first access of a key missing from the settings, with the cached token. The
+    settings referring to such keys are validated once the secrets are loaded.
+    """
+
+    @property
+    def loaders(self):
+        return [loader for loader in super().loaders if loader.__name__ != VAULT_LOADER]
+
+    def clean(self, *args, **kwargs):
+        vars(self).pop('_vault_loaded', None)
+        super().clean(*args, **kwargs)
+
+    def __getattr__(self, name):
+        if (
+            name.startswith('_')
+            or name.upper().endswith('_FOR_DYNACONF')
+            or vars(self).get('_vault_loaded')
+            or VAULT_LOADER not in (self.LOADERS_FOR_DYNACONF or ())
+        ):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        object.__setattr__(self, '_vault_loaded', True)
+        self.load_vault_secrets()
+        value = self.get(name, default=None)
+        if value is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        return value
+
+    def _refers_to_vault(self, name):
+        """Whether the raw value of a setting refers to a key missing from the settings,
+        read without formatting it"""
+        value = self._store
+        for key in name.split('.'):
+            try:
+                value = value._safe_get(key)
+            except (AttributeError, KeyError):
+                return False
+        if not getattr(value, '_dynaconf_lazy_format', False):
+            return False
+        for reference in REFERENCE_RE.findall(str(value.value)):
+            try:
+                self._store._safe_get(reference)
+            except KeyError:
+                return True
+        return False
+
+    def load_vault_secrets(self):
+        """Load the vault secrets in the settings, logging the vault in if needed, and
+        validate the settings referring to them"""
+        from dynaconf.loaders import vault_loader
+
+        with Vault() as vclient:
+            token = vclient.login()
+        if token:
+            self.set('VAULT_FOR_DYNACONF', {**self.VAULT_FOR_DYNACONF, 'token': token})
+        vault_loader.load(self)
+        if deferred := vars(self).pop('_vault_validations', None):
+            try:
+                self.validators.validate(only=deferred)
+            except ValidationError as err:
+                if self.get('robottelo.settings.ignore_validation_errors'):
+                    logger.warning(f'Dynaconf validation failed with\n{err}')
+                else:
+                    raise
+
+
+def _validator_names(validator):
+    """Return the names of the settings a validator checks, the ones of the validators
+    it combines, as ``|`` and ``&`` do, included"""
+    combined = getattr(validator, 'validators', None) or [
+        other
+        for other in (
+            getattr(validator, 'validator_a', None),
+            getattr(validator, 'validator_b', None),
+        )
+        if other is not None
+    ]
+    if combined:
+        return [name for other in combined for name in _validator_names(other)]
+    return [name for name in validator.names if isinstance(name, str)]
+
+
+def validate_settings(settings):
+    """Validate the settings, the ones referring to vault secrets once these are loaded,
+    so that the validation does not log the vault in, see ``VaultSettings``
+
+    :param settings: The ``LazySettings`` wrapping a ``VaultSettings``.
+    """
+    validators = settings.validators
+    # set up by the access to the validators
+    vault_settings = settings._wrapped
+    names = {name for validator in validators for name in _validator_names(validator)}
+    deferred = sorted(name for name in names if vault_settings._refers_to_vault(name))
+    object.__setattr__(vault_settings, '_vault_validations', deferred)
+    validators.validate(exclude=deferred)
@@ -0,0 +1,157 @@
+"""Satellite and RHEL versions of the Satellite, probed in the background and cached.
+
+Reading the versions of the Satellite takes SSH round trips, slow to time out when the
+Satellite is not reachable. They are probed concurrently in daemon threads, never
+waited for at exit, started once a test using the Satellite is collected so that the
+probes overlap the rest of the collection, and cached per hostname in the robottelo
+tmp dir, shared by the xdist workers, until the ``robottelo.version_probe.ttl``
+expires or the configured ``server.version`` release or snap changes, as on an
+upgrade keeping the hostname. With ``robottelo.version_probe.offline``, the
+Satellite is never probed and the versions come from the configuration."""
+
+from concurrent.futures import Future, wait
+import json
+import os
+import threading
+import time
+
+from robottelo.config import robottelo_tmp_dir, settings
+from robottelo.logging import logger
+
+PROBES = {
+    'sat_version': lambda sat: sat.version,
+    'rhel_version': lambda sat: str(sat.os_version),
+}
+
+_probes = {}
+_probes_lock = threading.Lock()
+
+
+def _submit(func, *args):
+    """Return the future of the function called in a daemon thread, which unlike the
+    threads of a ThreadPoolExecutor is not joined at interpreter exit"""
+    future = Future()
+
+    def run():
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(func(*args))
+            except Exception as err:
+                future.set_exception(err)
+
+    threading.Thread(target=run, name='version-probe', daemon=True).start()
+    return future
+
+
+class VersionProbe:
+    """Versions of a Satellite host, probed in the background and cached"""
+
+    def __init__(self, hostname, ttl=None, offline=None, configured=None):
+        """
+        :param str hostname: Hostname of the Satellite.
+        :param int ttl: Seconds the probed versions are cached for.
+        :param bool offline: Never probe the Satellite, the default without hostname.
+        :param str configured: The configured version, the cache being dropped when it
+            changes, ``configured_version()`` by default.
+        """
+        self.hostname = hostname
+        self.configured = configured_version() if configured is None else configured
+        self.ttl = settings.robottelo.version_probe.ttl if ttl is None else ttl
+        if offline is None:
+            offline = settings.robottelo.version_probe.offline or not hostname
+        self.offline = offline
+        self.cache_file = robottelo_tmp_dir.joinpath(f'version_probe_{hostname}.json')
+        self._futures = {}
+        self._versions = None
+        self._deadline = None
+        self._reported = set()
+        self._lock = threading.Lock()
+
+    def _cached(self):
+        try:
+            cached = json.loads(self.cache_file.read_text())
+        except (OSError, ValueError):
+            return {}
+        if time.time() - cached.pop('probed', 0) > self.ttl:
+            return {}
+        if cached.pop('configured', None) != self.configured:
+            return {}
+        return cached
+
+    def _save(self, versions):
+        # written aside then renamed, the xdist workers never read a partial file
+        tmp_file = self.cache_file.with_name(f'{self.cache_file.name}.{os.getpid()}')
+        tmp_file.write_text(
+            json.dumps({**versions, 'probed': time.time(), 'configured': self.configured})
+        )
+        os.replace(tmp_file, self.cache_file)
+
+    def _probe(self, name):
+        from robottelo.hosts import Satellite
+
+        return PROBES[name](Satellite(hostname=self.hostname))
+
+    def start(self):
+        """Start probing the versions missing from the cache, unless offline"""
+        if self.offline:
+            return
+        cached = self._cached()
+        with self._lock:
+            for name in PROBES:
+                if name not in cached and name not in self._futures:
+                    self._futures[name] = _submit(self._probe, name)
+
+    def versions(self, timeout=None):
+        """Return the versions, waiting for the probes at most the timeout since the first
+        call, the probes left running or failed are not waited for by the next calls.
+
+        :param timeout: Seconds to wait for the probes, ``robottelo.version_probe.timeout``
+            by default.
+        :return: A dict of the versions known by name, empty when offline.
+        """
+        if self.offline:
+            return {}
+        if self._versions is None:
+            self._versions = self._cached() or None
+        if self._versions:
+            return self._versions
+        self.start()
+        with self._lock:
+            if self._deadline is None:
+                if timeout is None:
+                    timeout = settings.robottelo.version_probe.timeout
+                self._deadline = time.monotonic() + timeout
+            futures = dict(self._futures)
+        wait(futures.values(), timeout=max(self._deadline - time.monotonic(), 0))
+        versions = {}
+        for name, future in futures.items():
+            if future.done() and not future.exception():
+                versions[name] = future.result()
+            elif name not in self._reported:
+                self._reported.add(name)
+                logger.warning(
+                    f'Probing the {name} of {self.hostname} '
+                    f'{"failed: " + str(future.exception()) if future.done() else "timed out"}, '
+                    'using the configured version'
+                )
+        if len(versions) == len(PROBES):
+            self._save(versions)
+            self._versions = versions
+        return versions
+
+
+def configured_version():
+    """Return the configured release and snap of the Satellite"""
+    version = settings.server.version
+    return f'{version.get("release")}-{version.get("snap")}'
+
+
+def version_probe(hostname=None):
+    """Return the version probe of a Satellite, the configured one by default, a new one
+    once the configured version changes"""
+    hostname = hostname or settings.server.get('hostname')
+    key = (hostname, configured_version())
+    with _probes_lock:
+        if key not in _probes:
+            _probes[key] = VersionProbe(hostname, configured=key[1])
+        return _probes[key]
@@ -1,6 +1,7 @@
 """Utility module to handle the virtwho configure UI/CLI/API testing"""
 
 import json
+import random
 import re
 import uuid
 
@@ -15,8 +16,10 @@ from robottelo.cli.host import Host
 from robottelo.cli.virt_who_config import VirtWhoConfig
 from robottelo.config import settings
 from robottelo.constants import DEFAULT_ORG
+from robottelo.utils.remote_log import RemoteLogCursor
 
 ETC_VIRTWHO_CONFIG = "/etc/virt-who.conf"
+RHSM_LOG = "/var/log/rhsm/rhsm.log"
 
 
 class VirtWhoError(Exception):
@@ -31,6 +34,95 @@ def _parse_entry(entry):
         return None
 
 
+class MappingSectionParser:
+    """Streaming parser of the json sections virt-who writes to rhsm.log.
+
+    A section starts after a log record line, the lines starting with a digit of
+    the timestamp, and spans the following lines up to the next log record. The
+    log can be fed in increments which may end in the middle of a line.
+    """
+
+    def __init__(self):
+        self.sections = []
+        self._entry = None
+        self._partial_line = ''
+
+    def feed(self, text):
+        """Parse the next increment of the log"""
+        lines = (self._partial_line + text).split('\n')
+        self._partial_line = lines.pop()
+        for line in lines:
+            self._feed_line(line)
+
+    def _feed_line(self, line):
+        if not line:
+            return
+        if line[0].isdigit():
+            self._close_entry()
+            self._entry = ['{']
+        elif self._entry is not None:
+            self._entry.append(line)
+
+    def _close_entry(self):
+        if self._entry:
+            section = _parse_entry(''.join(self._entry))
+            if section is not None:
+                self.sections.append(section)
+        self._entry = None
+
+    @property
+    def mapping(self):
+        """The parsed json sections, including the last one if it is complete"""
+        entry = list(self._entry or [])
+        if entry and self._partial_line and not self._partial_line[0].isdigit():
+            entry.append(self._partial_line)
+        last = _parse_entry(''.join(entry)) if entry else None
+        return self.sections if last is None else [*self.sections, last]
+
+
+class RhsmLog:
+    """The rhsm.log of a host, read incrementally and parsed as it grows"""
+
+    def __init__(self, system):
+        self.cursor = RemoteLogCursor(RHSM_LOG, **system)
+        self.reset()
+
+    def reset(self):
+        """Forget the content read so far"""
+        self.cursor.reset()
+        self._chunks = []
+        self.parser = MappingSectionParser()
+
+    def refresh(self):
+        """Fetch and parse the lines logged since the previous refresh"""
+        rotations = self.cursor.rotations
+        content = self.cursor.read()
+        if self.cursor.rotations != rotations:
+            self._chunks = []
+            self.parser = MappingSectionParser()
+        if content:
+            self._chunks.append(content)
+            self.parser.feed(content)
+        return self
+
+    @property
+    def content(self):
+        if len(self._chunks) > 1:
+            self._chunks = [''.join(self._chunks)]
+        return self._chunks[0] if self._chunks else ''
+
+
+_rhsm_logs = {}
+
+
+def rhsm_log(system=None):
+    """Return the incrementally read rhsm.log of the system, the satellite by default"""
+    system = system or get_system('satellite')
+    if system['hostname'] not in _rhsm_logs:
+        _rhsm_logs[system['hostname']] = RhsmLog(system)
+    return _rhsm_logs[system['hostname']]
+
+
 def get_system(system_type):
     """Return a dict account for ssh connect.
 
@@ -125,7 +217,8 @@ def virtwho_cleanup():
     runcmd("systemctl stop virt-who")
     runcmd("pkill -9 virt-who")
     runcmd("rm -f /var/run/virt-who.pid")
-    runcmd("rm -f /var/log/rhsm/rhsm.log")
+    runcmd(f"rm -f {RHSM_LOG}")
+    rhsm_log().reset()
     runcmd("rm -rf /etc/virt-who.d/*")
     runcmd("rm -rf /tmp/deploy_script.sh")
 
@@ -134,7 +227,7 @@ def get_virtwho_status():
     """Return the status of virt-who service, it will help us to know
     the virt-who configuration file is deployed or not.
     """
-    _, logs = runcmd('cat /var/log/rhsm/rhsm.log')
+    logs = get_rhsm_log()
     error = len(re.findall(r'\[.*ERROR.*\]', logs))
     ret, stdout = runcmd('systemctl status virt-who')
     running_stauts = ['is running', 'Active: active (running)']
@@ -195,10 +288,10 @@ def get_configure_option(option, filename):
 
 def get_rhsm_log():
     """
-    Return the content of log file /var/log/rhsm/rhsm.log
+    Return the content of log file /var/log/rhsm/rhsm.log, only the lines logged
+    since the previous call are transferred.
     """
-    _, logs = runcmd('cat /var/log/rhsm/rhsm.log')
-    return logs
+    return rhsm_log().refresh().content
 
 
 def check_message_in_rhsm_log(message):
@@ -225,23 +318,8 @@ def _get_hypervisor_mapping(hypervisor_type):
         timeout=20,
         delay=2,
     )
-    logs = get_rhsm_log()
-    mapping = list()
-    entry = None
+    mapping = rhsm_log().refresh().parser.mapping
     guest_name, guest_uuid = get_guest_info(hypervisor_type)
-    for line in logs.split('\n'):
-        if not line:
-            continue
-        if line[0].isdigit():
-            if entry:
-                mapping.append(_parse_entry(entry))
-            entry = '{'
-            continue
-        if entry:
-            entry += line
-    else:
-        mapping.append(_parse_entry(entry))
-    mapping = [_ for _ in mapping if _ is not None]
     # Always check the last json section to get the hypervisorId
     for item in mapping[-1]['hypervisors']:
         for guest in item['guestIds']:
@@ -266,23 +344,9 @@ def get_hypervisor_ahv_mapping(hypervisor_type):
         timeout=10,
         delay=2,
     )
-    logs = get_rhsm_log()
-    mapping = list()
-    entry = None
+    log = rhsm_log().refresh()
+    logs, mapping = log.content, log.parser.mapping
     guest_name, guest_uuid = get_guest_info(hypervisor_type)
-    for line in logs.split('\n'):
-        if not line:
-            continue
-        if line[0].isdigit():
-            if entry:
-                mapping.append(_parse_entry(entry))
-            entry = '{'
-            continue
-        if entry:
-            entry += line
-    else:
-        mapping.append(_parse_entry(entry))
-    mapping = [_ for _ in mapping if _ is not None]
     # Always check the last json section to get the host_uuid
     for item in mapping:
         if 'entities' in item:
@@ -385,7 +449,8 @@ def restart_virtwho_service():
     1. remove rhsm.log to ensure there are no old messages.
     2. restart virt-who service via systemctl command
     """
-    runcmd("rm -f /var/log/rhsm/rhsm.log")
+    runcmd(f"rm -f {RHSM_LOG}")
+    rhsm_log().reset()
     runcmd("systemctl restart virt-who; sleep 10")
 
 
@@ -432,7 +497,55 @@ def add_configure_option(option, value, config_file):
         raise VirtWhoError(f"option {option} is already exist in {config_file}")
 
 
-def hypervisor_json_create(hypervisors, guests):
+def _seeded_uuid(rng):
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def iter_hypervisors(hypervisors, guests, seed=None, fake=False):
+    """Generate the hypervisors of a report one at a time.
+
+    :param hypervisors: how many hypervisors will be created
+    :param guests: how many guests will be created per hypervisor
+    :param seed: the same seed always generates the same hypervisors and guests uuids,
+        a random report is generated when None
+    :param fake: generate the hypervisors in the fake config format, ``uuid`` and
+        ``guests`` keys instead of ``hypervisorId`` and ``guestIds``
+    """
+    rng = random.Random(seed)
+    for _ in range(hypervisors):
+        guest_list = [
+            {
+                "guestId": _seeded_uuid(rng),
+                "state": 1,
+                "attributes": {"active": 1, "virtWhoType": "esx"},
+            }
+            for _ in range(guests)
+        ]
+        name = _seeded_uuid(rng)
+        if fake:
+            yield {'guests': guest_list, 'name': name, 'uuid': _seeded_uuid(rng)}
+        else:
+            yield {"guestIds": guest_list, "name": name, "hypervisorId": {"hypervisorId": name}}
+
+
+def iter_hypervisor_json(hypervisors, guests, seed=None, fake=False, batch=100):
+    """Generate the json body of a hypervisors report in chunks of ``batch``
+    hypervisors, the report is never held in memory as a whole. Suitable as
+    streamed ``data`` for ``requests.post``.
+
+    See :func:`iter_hypervisors` for the parameters.
+    """
+    yield b'{"hypervisors": ['
+    chunk = []
+    for index, hypervisor in enumerate(iter_hypervisors(hypervisors, guests, seed, fake)):
+        chunk.append(f'{", " if index else ""}{json.dumps(hypervisor)}')
+        if len(chunk) == batch:
+            yield ''.join(chunk).encode()
+            chunk = []
+    yield f'{"".join(chunk)}]}}'.encode()
+
+
+def hypervisor_json_create(hypervisors, guests, seed=None):
     """
     Create a hypervisor guest json data. For example:
     {'hypervisors': [{'hypervisorId': '820b5143-3885-4dba-9358-4ce8c30d934e',
@@ -440,25 +553,12 @@ def hypervisor_json_create(hypervisors, guests):
     'attributes': {'active': 1, 'virtWhoType': 'esx'}}]}]}
     :param hypervisors: how many hypervisors will be created
     :param guests: how many guests will be created
+    :param seed: seed of the generated uuids, random when None
     """
-    hypervisors_list = []
-    for _ in range(hypervisors):
-        guest_list = []
-        for _ in range(guests):
-            guest_list.append(
-                {
-                    "guestId": str(uuid.uuid4()),
-                    "state": 1,
-                    "attributes": {"active": 1, "virtWhoType": "esx"},
-                }
-            )
-        name = str(uuid.uuid4())
-        hypervisor = {"guestIds": guest_list, "name": name, "hypervisorId": {"hypervisorId": name}}
-        hypervisors_list.append(hypervisor)
-    return {"hypervisors": hypervisors_list}
-
-
-def hypervisor_fake_json_create(hypervisors, guests):
+    return {"hypervisors": list(iter_hypervisors(hypervisors, guests, seed))}
+
+
+def hypervisor_fake_json_create(hypervisors, guests, seed=None):
     """
     Create a hypervisor guest json data for fake config usages. For example:
     {'hypervisors': [{'uuid': '820b5143-3885-4dba-9358-4ce8c30d934e',
@@ -466,23 +566,9 @@ def hypervisor_fake_json_create(hypervisors, guests):
     'attributes': {'active': 1, 'virtWhoType': 'esx'}}]}]}
     :param hypervisors: how many hypervisors will be created
     :param guests: how many guests will be created
+    :param seed: seed of the generated uuids, random when None
     """
-    hypervisors_list = [
-        {
-            'guests': [
-                {
-                    "guestId": str(uuid.uuid4()),
-                    "state": 1,
-                    "attributes": {"active": 1, "virtWhoType": "esx"},
-                }
-                for _ in range(guests)
-            ],
-            'name': str(uuid.uuid4()),
-            'uuid': str(uuid.uuid4()),
-        }
-        for _ in range(hypervisors)
-    ]
-    return {"hypervisors": hypervisors_list}
+    return {"hypervisors": list(iter_hypervisors(hypervisors, guests, seed, fake=True))}
 
 
 def create_fake_hypervisor_content(org_label, hypervisors, guests):
@@ -0,0 +1,141 @@
+"""Load generator for the ingest of virt-who hypervisors reports.
+
+Reports of customer scale are generated on the fly and streamed to the
+``/rhsm/hypervisors`` endpoint, for many organizations concurrently. For every
+report the ingest latency, the time to post the report, and the time until all
+its hypervisors are visible through the API are measured.
+
+Usage::
+
+    results = run_hypervisor_load(orgs, hypervisors=10000, guests=50, seed=42)
+    print(results.summary)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import statistics
+import time
+
+from box import Box
+import requests
+from wait_for import TimedOutError, wait_for
+
+from robottelo.config import settings
+from robottelo.logging import logger
+from robottelo.utils.virtwho import iter_hypervisor_json
+
+
+def _server_defaults(url, auth):
+    return (
+        url or f'https://{settings.server.hostname}',
+        auth or (settings.server.admin_username, settings.server.admin_password),
+    )
+
+
+def count_hypervisors(org_id, url=None, auth=None, verify=False):
+    """Return the number of virt-who hypervisor hosts of the organization"""
+    url, auth = _server_defaults(url, auth)
+    response = requests.get(
+        f'{url}/api/v2/hosts',
+        params={'search': f'organization_id = {org_id} and name ~ virt-who-', 'per_page': 1},
+        auth=auth,
+        verify=verify,
+        timeout=60,
+    )
+    response.raise_for_status()
+    return int(response.json()['subtotal'])
+
+
+def post_hypervisor_report(
+    org,
+    hypervisors,
+    guests,
+    seed=None,
+    url=None,
+    auth=None,
+    verify=False,
+    visibility_timeout=1800,
+    poll_interval=5,
+):
+    """Stream a generated hypervisors report for the organization and wait until its
+    hypervisors are visible through the API.
+
+    :param org: The organization, with ``id`` and ``label`` attributes.
+    :param int hypervisors: Number of hypervisors of the report.
+    :param int guests: Number of guests per hypervisor.
+    :param seed: Seed of the report, the organization label is appended to it so
+        that every organization gets its own hypervisors.
+    :param str url: Base url of the server, the configured Satellite by default.
+    :param int visibility_timeout: Seconds to wait for the hypervisors, no wait when 0.
+    :return: A Box with the ``org`` label, the http ``status``, the ``ingest_latency``
+        and the ``visible_after`` seconds, ``None`` when the wait timed out.
+    """
+    url, auth = _server_defaults(url, auth)
+    start = time.monotonic()
+    response = requests.post(
+        f'{url}/rhsm/hypervisors/{org.label}',
+        data=iter_hypervisor_json(hypervisors, guests, seed=f'{seed}-{org.label}'),
+        headers={'Content-Type': 'application/json'},
+        auth=auth,
+        verify=verify,
+    )
+    result = Box(
+        org=org.label,
+        status=response.status_code,
+        ingest_latency=time.monotonic() - start,
+        visible_after=None,
+    )
+    if response.ok and visibility_timeout:
+        try:
+            wait_for(
+                lambda: count_hypervisors(org.id, url, auth, verify) >= hypervisors,
+                timeout=visibility_timeout,
+                delay=poll_interval,
+            )
+            result.visible_after = time.monotonic() - start
+        except TimedOutError:
+            logger.warning(f'Hypervisors of {org.label} not visible after {visibility_timeout}s')
+    return result
+
+
+def _stats(values):
+    if not values:
+        return None
+    return Box(
+        min=min(values),
+        avg=statistics.mean(values),
+        p95=statistics.quantiles(values, n=20)[-1] if len(values) > 1 else values[0],
+        max=max(values),
+    )
+
+
+def run_hypervisor_load(orgs, hypervisors, guests, seed=0, workers=8, **kwargs):
+    """Post a hypervisors report for every organization concurrently.
+
+    The keyword arguments are passed to :func:`post_hypervisor_report`.
+
+    :return: A Box with the per organization ``reports`` and a ``summary`` of the
+        failures and of the ingest latency and visibility time statistics.
+    """
+
+    def _post(org):
+        try:
+            return post_hypervisor_report(org, hypervisors, guests, seed=seed, **kwargs)
+        except requests.RequestException as err:
+            logger.warning(f'Posting the hypervisors report of {org.label} failed: {err}')
+            return Box(org=org.label, status=None, ingest_latency=None, visible_after=None)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        reports = list(executor.map(_post, orgs))
+    succeeded = [report for report in reports if report.status and report.status < 400]
+    summary = Box(
+        reports=len(reports),
+        failed=len(reports) - len(succeeded),
+        hypervisors=hypervisors * len(succeeded),
+        guests=hypervisors * guests * len(succeeded),
+        ingest_latency=_stats([report.ingest_latency for report in succeeded]),
+        visible_after=_stats(
+            [report.visible_after for report in succeeded if report.visible_after is not None]
+        ),
+    )
+    logger.info(f'Hypervisors load results: {summary}')
+    return Box(reports=reports, summary=summary)
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""Measure publishing a content view and promoting it along a lifecycle environments chain.
+
+The content view is published and promoted one environment at a time, reading it for
+its versions as the helpers did, then with ``APIFactory.publish_promote_cv``, on the
+Satellite of the settings, in a new organization deleted afterwards.
+
+Usage: python scripts/cv_promote_benchmark.py [--lces 5] [--rounds 3]
+"""
+
+import time
+
+import click
+
+from robottelo.hosts import Satellite
+
+
+def one_at_a_time(satellite, content_view, lces):
+    """Publish and promote the content view as the helpers did"""
+    content_view.publish()
+    version = content_view.read().version[-1]
+    for lce in lces:
+        version.promote(data={'environment_ids': lce.id})
+        version = content_view.read().version[-1]
+    return version
+
+
+def pipeline(satellite, content_view, lces):
+    """Publish and promote the content view with the publish/promote pipeline"""
+    return satellite.api_factory.publish_promote_cv(content_view, lces)
+
+
+@click.command()
+@click.option('--lces', default=5, help='Number of lifecycle environments of the chain.')
+@click.option('--rounds', default=3, help='Number of publish and promote rounds measured.')
+def main(lces, rounds):
+    satellite = Satellite()
+    org = satellite.api.Organization().create()
+    try:
+        prior = satellite.api.LifecycleEnvironment(organization=org).search(
+            query={'search': 'name=Library'}
+        )[0]
+        chain = []
+        for _ in range(lces):
+            prior = satellite.api.LifecycleEnvironment(organization=org, prior=prior).create()
+            chain.append(prior)
+        for publish_promote in (one_at_a_time, pipeline):
+            durations = []
+            for _ in range(rounds):
+                content_view = satellite.api.ContentView(organization=org).create()
+                started = time.perf_counter()
+                publish_promote(satellite, content_view, chain)
+                durations.append(time.perf_counter() - started)
+            click.echo(
+                f'{publish_promote.__name__}: {sum(durations) / rounds:.1f}s per publish and '
+                f'promotion to {lces} environments, best {min(durations):.1f}s'
+            )
+    finally:
+        org.delete(synchronous=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,27 +1,208 @@
+#!/usr/bin/env python
 """Generate hammer command tree in json format by inspecting every command's
 help.
 
+The tree is walked breadth-first: the ``--help`` of all the commands of a level
+is fetched by a few remote scripts, each one batching many commands, which run
+concurrently over a bounded pool of persistent connections.
+
+The tree is cached together with the hammer and plugin versions and the hash of
+every command help. When the versions are unchanged the cached tree is reused,
+otherwise the tree is crawled again and the commands whose help changed are
+reported.
+
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+import hashlib
 import json
+from pathlib import Path
+import re
+import threading
+
+import click
 
 from robottelo import ssh
 from robottelo.cli import hammer
-from robottelo.config import settings
+from robottelo.config import robottelo_tmp_dir, settings
+from robottelo.logging import logger
+
+ARTIFACT_FORMAT_VERSION = 1
+HELP_MARKER = '### HAMMER-HELP'
+PLUGIN_VERSION_RE = re.compile(r'^\s*\*?\s*(?P<name>[\w-]+) \((?P<version>[^)]+)\)', re.M)
+DEFAULT_CACHE_FILE = robottelo_tmp_dir.joinpath('hammer_commands_cache.json')
+
+
+class HammerHelpCrawler:
+    """Breadth-first hammer help crawler over a pool of persistent connections
+
+    The pool threads and their connections are kept for the whole crawl, to be used as
+    a context manager closing them at its end.
+    """
+
+    def __init__(self, hostname, workers=4, batch_size=50):
+        self.hostname = hostname
+        self.workers = workers
+        self.batch_size = batch_size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._clients = []
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='hammer-help')
+        self.remote_calls = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
+    def close(self):
+        """Stop the pool threads and close their connections"""
+        self._executor.shutdown()
+        with self._lock:
+            clients, self._clients = self._clients, []
+        for client in clients:
+            client.close()
 
-def generate_command_tree(command):
-    """Recursively walk trhough the hammer commands and subcommands and fetch
-    their help. Return a dictionary with the contents.
+    @property
+    def client(self):
+        """One persistent connection per pool thread"""
+        if getattr(self._local, 'client', None) is None:
+            self._local.client = ssh.get_client(hostname=self.hostname)
+            with self._lock:
+                self._clients.append(self._local.client)
+        return self._local.client
+
+    def get_versions(self):
+        """Return the hammer and plugins versions reported by ``hammer --version``"""
+        output = self.client.execute('hammer --version').stdout
+        return dict(PLUGIN_VERSION_RE.findall(output))
+
+    def _fetch_batch(self, commands):
+        script = '\n'.join(
+            f"echo '{HELP_MARKER} {command}'; {command} --help" for command in commands
+        )
+        output = self.client.execute(script).stdout
+        with self._lock:
+            self.remote_calls += 1
+        helps = {}
+        command = None
+        for line in output.splitlines(keepends=True):
+            if line.startswith(HELP_MARKER):
+                command = line[len(HELP_MARKER) :].strip()
+                helps[command] = ''
+            elif command is not None:
+                helps[command] += line
+        return helps
+
+    def fetch_helps(self, commands):
+        """Return the help output of every command, indexed by command"""
+        batches = [
+            commands[i : i + self.batch_size] for i in range(0, len(commands), self.batch_size)
+        ]
+        helps = {}
+        for result in self._executor.map(self._fetch_batch, batches):
+            helps.update(result)
+        return helps
+
+
+def _help_hash(output):
+    return hashlib.sha256(output.encode()).hexdigest()
+
+
+def generate_command_tree(crawler):
+    """Walk breadth-first through the hammer commands and subcommands and fetch
+    their help. Return the tree and the help hashes indexed by command.
     """
-    output = ssh.command(f'{command} --help', hostname=settings.server.hostnames[0]).stdout
-    contents = hammer.parse_help(output)
-    if len(contents['subcommands']) > 0:
-        for subcommand in contents['subcommands']:
-            subcommand.update(generate_command_tree('{} {}'.format(command, subcommand['name'])))
-    return contents
+    hashes = {}
+    tree = {}
+    nodes = {'hammer': tree}
+    level = ['hammer']
+    while level:
+        logger.info(f'Fetching help of {len(level)} hammer commands')
+        helps = crawler.fetch_helps(level)
+        next_level = []
+        for command in level:
+            output = helps.get(command, '')
+            hashes[command] = _help_hash(output)
+            node = nodes[command]
+            node.update(hammer.parse_help(output))
+            for subcommand in node['subcommands']:
+                subcommand_name = f'{command} {subcommand["name"]}'
+                nodes[subcommand_name] = subcommand
+                next_level.append(subcommand_name)
+        level = next_level
+    return tree, hashes
+
+
+def changed_commands(old_hashes, new_hashes):
+    """Return the added, removed and changed commands between two crawls"""
+    return {
+        'added': sorted(new_hashes.keys() - old_hashes.keys()),
+        'removed': sorted(old_hashes.keys() - new_hashes.keys()),
+        'changed': sorted(
+            command
+            for command in new_hashes.keys() & old_hashes.keys()
+            if new_hashes[command] != old_hashes[command]
+        ),
+    }
+
+
+@click.command()
+@click.option('--hostname', help='Satellite to crawl, first of server.hostnames by default.')
+@click.option(
+    '--output',
+    type=click.Path(dir_okay=False, path_type=Path),
+    default='hammer_commands.json',
+    show_default=True,
+    help='Path of the generated json artifact.',
+)
+@click.option(
+    '--cache-file',
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=DEFAULT_CACHE_FILE,
+    show_default=True,
+    help='Path of the help hashes cache.',
+)
+@click.option('--workers', default=4, show_default=True, help='Number of parallel connections.')
+@click.option(
+    '--batch-size', default=50, show_default=True, help='Number of commands per remote script.'
+)
+@click.option('--refresh', is_flag=True, help='Ignore the cache and crawl the whole tree.')
+def main(hostname, output, cache_file, workers, batch_size, refresh):
+    """Generate the hammer command tree json artifact"""
+    cache = {}
+    if cache_file.exists() and not refresh:
+        cache = json.loads(cache_file.read_text())
+    with HammerHelpCrawler(
+        hostname or settings.server.hostnames[0], workers=workers, batch_size=batch_size
+    ) as crawler:
+        versions = crawler.get_versions()
+        if cache.get('versions') == versions:
+            logger.info('hammer and plugins versions are unchanged, reusing the cached tree')
+            tree, hashes = cache['tree'], cache['hashes']
+        else:
+            tree, hashes = generate_command_tree(crawler)
+            if cache:
+                for change, commands in changed_commands(cache['hashes'], hashes).items():
+                    if commands:
+                        click.echo(f'{change} commands: {", ".join(commands)}')
+    cache_file.write_text(json.dumps({'versions': versions, 'hashes': hashes, 'tree': tree}))
+    artifact = {
+        'metadata': {
+            'format_version': ARTIFACT_FORMAT_VERSION,
+            'generated': datetime.now(UTC).isoformat(),
+            'versions': versions,
+        },
+        **tree,
+    }
+    output.write_text(json.dumps(artifact, indent=2, sort_keys=True))
+    click.echo(
+        f'{len(hashes)} hammer commands written to {output} '
+        f'using {crawler.remote_calls} remote calls'
+    )
 
 
-# Generate the json file in the working directory
-with open('hammer_commands.json', 'w') as f:
-    f.write(json.dumps(generate_command_tree('hammer'), indent=2, sort_keys=True))
+if __name__ == '__main__':
+    main()
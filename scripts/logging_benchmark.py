@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""Measure the logging overhead of a hammer call with the synchronous and queued backends.
+
+A hammer call logs the command run and its output, as broker's ``Host.execute`` and
+the robottelo CLI do, to a rotating log file like robottelo's.
+
+Usage: python scripts/logging_benchmark.py [--calls 2000] [--output-size 4096]
+"""
+
+from pathlib import Path
+import tempfile
+import time
+
+import click
+import logzero
+
+from robottelo.logging import DEFAULT_DATE_FORMAT, LogQueue
+
+
+def hammer_call(log, output):
+    """Log as a hammer call does"""
+    log.debug('satellite.example.com executing command: LANG=en_US.UTF-8 hammer -v --output=json')
+    log.debug(f'satellite.example.com command result:\n{output}')
+    log.info('hammer call finished with status 0')
+
+
+def measure(log_path, calls, output, queue=None, full='block'):
+    """Return the mean seconds spent logging a hammer call, and writing the queued records"""
+    log = logzero.setup_logger(
+        name=f'logging_benchmark.{log_path.stem}',
+        logfile=str(log_path),
+        fileLoglevel=10,
+        level=40,
+        disableStderrLogger=True,
+        formatter=logzero.LogFormatter(
+            fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt=DEFAULT_DATE_FORMAT,
+        ),
+        maxBytes=1e8,
+        backupCount=3,
+    )
+    log_queue = None
+    if queue:
+        log_queue = LogQueue(size=queue, full=full)
+        log_queue.add(log)
+    started = time.perf_counter()
+    for _ in range(calls):
+        hammer_call(log, output)
+    elapsed = time.perf_counter() - started
+    started = time.perf_counter()
+    if log_queue:
+        log_queue.stop()
+    return elapsed / calls, time.perf_counter() - started
+
+
+@click.command()
+@click.option('--calls', default=2000, help='Number of hammer calls logged.')
+@click.option('--output-size', default=4096, help='Size of the hammer output logged.')
+@click.option('--queue-size', default=10000, help='Size of the log queue.')
+def main(calls, output_size, queue_size):
+    output = ('{"Id": 1, "Name": "Default Organization View"}\n' * output_size)[:output_size]
+    with tempfile.TemporaryDirectory() as log_dir:
+        backends = {
+            'synchronous': {},
+            'queue, block when full': {'queue': queue_size},
+            'queue, drop when full': {'queue': queue_size, 'full': 'drop'},
+        }
+        for number, (name, options) in enumerate(backends.items()):
+            per_call, drain = measure(Path(log_dir, f'{number}.log'), calls, output, **options)
+            click.echo(
+                f'{name:>24}: {per_call * 1e6:8.1f} us per hammer call, '
+                f'{drain * 1e3:8.1f} ms writing the queued records'
+            )
+
+
+if __name__ == '__main__':
+    main()
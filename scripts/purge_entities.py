@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+"""Purge the entities left by the sessions run with --purge-entities.
+
+Usage: python scripts/purge_entities.py [--dry-run] [--ledger PATH ...]
+"""
+
+import click
+
+from robottelo.utils.entity_ledger import LEFTOVERS, EntityLedger
+
+
+@click.command()
+@click.option('--dry-run', is_flag=True, help='Only report the entities to purge.')
+@click.option('--workers', default=8, help='Number of concurrent delete requests.')
+@click.option(
+    '--ledger',
+    'ledgers',
+    multiple=True,
+    type=click.Path(exists=True),
+    help='Ledger files to purge, the leftovers of the sessions by default.',
+)
+def main(dry_run, workers, ledgers):
+    if not ledgers and not LEFTOVERS.exists():
+        click.echo('No entities left to purge')
+        return
+    ledger = EntityLedger.load(ledgers or [LEFTOVERS])
+    ledger.purge(dry_run=dry_run, workers=workers, progress=click.echo)
+    if not ledgers and not dry_run:
+        ledger.save(LEFTOVERS)
+    if ledger.entries:
+        click.echo(f'{len(ledger.entries)} entities failed to be purged')
+
+
+if __name__ == '__main__':
+    main()
@@ -246,10 +246,6 @@ class TestProvisioningTemplate:
         self,
         module_sync_kickstart_content,
         module_target_sat,
-        module_sca_manifest_org,
-        module_location,
-        module_default_org_view,
-        module_lce_library,
         default_architecture,
         default_partitiontable,
     ):
@@ -268,8 +264,8 @@ class TestProvisioningTemplate:
         macaddress = gen_mac(multicast=False)
         capsule = module_target_sat.nailgun_smart_proxy
         host = module_target_sat.api.Host(
-            organization=module_sca_manifest_org,
-            location=module_location,
+            organization=module_sync_kickstart_content.org,
+            location=module_sync_kickstart_content.location,
             name=gen_string('alpha').lower(),
             mac=macaddress,
             operatingsystem=module_sync_kickstart_content.os,
@@ -279,8 +275,8 @@ class TestProvisioningTemplate:
             ptable=default_partitiontable,
             content_facet_attributes={
                 'content_source_id': capsule.id,
-                'content_view_id': module_default_org_view.id,
-                'lifecycle_environment_id': module_lce_library.id,
+                'content_view_id': module_sync_kickstart_content.default_org_view.id,
+                'lifecycle_environment_id': module_sync_kickstart_content.lce_library.id,
             },
         ).create()
         provision_template = host.read_template(data={'template_kind': 'provision'})['template']
@@ -292,10 +288,6 @@ class TestProvisioningTemplate:
         self,
         module_sync_kickstart_content,
         module_target_sat,
-        module_sca_manifest_org,
-        module_location,
-        module_default_org_view,
-        module_lce_library,
         default_architecture,
         default_partitiontable,
     ):
@@ -316,8 +308,8 @@ class TestProvisioningTemplate:
         macaddress = gen_mac(multicast=False)
         capsule = module_target_sat.nailgun_smart_proxy
         host = module_target_sat.api.Host(
-            organization=module_sca_manifest_org,
-            location=module_location,
+            organization=module_sync_kickstart_content.org,
+            location=module_sync_kickstart_content.location,
             name=gen_string('alpha').lower(),
             mac=macaddress,
             operatingsystem=module_sync_kickstart_content.os,
@@ -327,8 +319,8 @@ class TestProvisioningTemplate:
             ptable=default_partitiontable,
             content_facet_attributes={
                 'content_source_id': capsule.id,
-                'content_view_id': module_default_org_view.id,
-                'lifecycle_environment_id': module_lce_library.id,
+                'content_view_id': module_sync_kickstart_content.default_org_view.id,
+                'lifecycle_environment_id': module_sync_kickstart_content.lce_library.id,
             },
         ).create()
         ipxe_template = host.read_template(data={'template_kind': 'iPXE'})['template']
@@ -340,10 +332,6 @@ class TestProvisioningTemplate:
         self,
         module_sync_kickstart_content,
         module_target_sat,
-        module_sca_manifest_org,
-        module_location,
-        module_default_org_view,
-        module_lce_library,
         default_architecture,
         default_partitiontable,
     ):
@@ -367,16 +355,16 @@ class TestProvisioningTemplate:
         tag = gen_string('numeric', length=4)
         # create a host with vlan enabled interface
         host = module_target_sat.api.Host(
-            organization=module_sca_manifest_org,
-            location=module_location,
+            organization=module_sync_kickstart_content.org,
+            location=module_sync_kickstart_content.location,
             operatingsystem=module_sync_kickstart_content.os,
             architecture=default_architecture,
             root_pass=settings.provisioning.host_root_password,
             ptable=default_partitiontable,
             content_facet_attributes={
                 'content_source_id': capsule.id,
-                'content_view_id': module_default_org_view.id,
-                'lifecycle_environment_id': module_lce_library.id,
+                'content_view_id': module_sync_kickstart_content.default_org_view.id,
+                'lifecycle_environment_id': module_sync_kickstart_content.lce_library.id,
             },
             interfaces_attributes=[
                 {
@@ -409,8 +397,6 @@ class TestProvisioningTemplate:
         self,
         module_sync_kickstart_content,
         module_target_sat,
-        module_sca_manifest_org,
-        module_location,
         default_architecture,
         default_partitiontable,
         pxe_loader,
@@ -431,16 +417,16 @@ class TestProvisioningTemplate:
         """
         subnet = module_target_sat.api.Subnet(
             name=gen_string('alpha'),
-            organization=[module_sca_manifest_org],
-            location=[module_location],
+            organization=[module_sync_kickstart_content.org],
+            location=[module_sync_kickstart_content.location],
             network='192.168.0.1',
             mask='255.255.255.240',
             boot_mode=boot_mode,
         ).create()
         host = module_target_sat.api.Host(
             name=gen_string('alpha'),
-            organization=module_sca_manifest_org,
-            location=module_location,
+            organization=module_sync_kickstart_content.org,
+            location=module_sync_kickstart_content.location,
             subnet=subnet,
             pxe_loader=pxe_loader.pxe_loader,
             root_pass=settings.provisioning.host_root_password,
@@ -504,10 +490,6 @@ class TestProvisioningTemplate:
         self,
         module_sync_kickstart_content,
         module_target_sat,
-        module_sca_manifest_org,
-        module_location,
-        module_default_org_view,
-        module_lce_library,
         default_architecture,
         default_partitiontable,
     ):
@@ -535,8 +517,8 @@ class TestProvisioningTemplate:
             {'name': 'ansible_extra_vars', 'value': extra_vars_dict, 'parameter_type': 'string'},
         ]
         host = module_target_sat.api.Host(
-            organization=module_sca_manifest_org,
-            location=module_location,
+            organization=module_sync_kickstart_content.org,
+            location=module_sync_kickstart_content.location,
             name=gen_string('alpha').lower(),
             operatingsystem=module_sync_kickstart_content.os,
             architecture=default_architecture,
@@ -545,8 +527,8 @@ class TestProvisioningTemplate:
             ptable=default_partitiontable,
             content_facet_attributes={
                 'content_source_id': module_target_sat.nailgun_smart_proxy.id,
-                'content_view_id': module_default_org_view.id,
-                'lifecycle_environment_id': module_lce_library.id,
+                'content_view_id': module_sync_kickstart_content.default_org_view.id,
+                'lifecycle_environment_id': module_sync_kickstart_content.lce_library.id,
             },
             host_parameters_attributes=host_params,
         ).create()
@@ -562,10 +544,6 @@ class TestProvisioningTemplate:
         module_sync_kickstart_content,
         module_target_sat,
         module_provisioning_capsule,
-        module_sca_manifest_org,
-        module_location,
-        module_default_org_view,
-        module_lce_library,
         default_architecture,
         default_partitiontable,
     ):
@@ -589,8 +567,8 @@ class TestProvisioningTemplate:
         rex_user = gen_string('alpha')
         ssh_key = gen_string('alphanumeric')
         host = module_target_sat.api.Host(
-            organization=module_sca_manifest_org,
-            location=module_location,
+            organization=module_sync_kickstart_content.org,
+            location=module_sync_kickstart_content.location,
             name=gen_string('alpha').lower(),
             mac=macaddress,
             operatingsystem=module_sync_kickstart_content.os,
@@ -600,8 +578,8 @@ class TestProvisioningTemplate:
             ptable=default_partitiontable,
             content_facet_attributes={
                 'content_source_id': module_provisioning_capsule.id,
-                'content_view_id': module_default_org_view.id,
-                'lifecycle_environment_id': module_lce_library.id,
+                'content_view_id': module_sync_kickstart_content.default_org_view.id,
+                'lifecycle_environment_id': module_sync_kickstart_content.lce_library.id,
             },
             host_parameters_attributes=[
                 {
@@ -641,10 +619,6 @@ class TestProvisioningTemplate:
         module_sync_kickstart_content,
         module_target_sat,
         module_provisioning_capsule,
-        module_sca_manifest_org,
-        module_location,
-        module_default_org_view,
-        module_lce_library,
         default_architecture,
         default_partitiontable,
     ):
@@ -661,8 +635,8 @@ class TestProvisioningTemplate:
         :parametrized: yes
         """
         host = module_target_sat.api.Host(
-            organization=module_sca_manifest_org,
-            location=module_location,
+            organization=module_sync_kickstart_content.org,
+            location=module_sync_kickstart_content.location,
             name=gen_string('alpha').lower(),
             mac=gen_mac(multicast=False),
             operatingsystem=module_sync_kickstart_content.os,
@@ -701,10 +675,6 @@ class TestProvisioningTemplate:
         self,
         module_sync_kickstart_content,
         module_target_sat,
-        module_sca_manifest_org,
-        module_location,
-        module_default_org_view,
-        module_lce_library,
         default_architecture,
         default_partitiontable,
     ):
@@ -721,8 +691,8 @@ class TestProvisioningTemplate:
         """
         host_params = [{'name': 'fips_enabled', 'value': 'true', 'parameter_type': 'boolean'}]
         host = module_target_sat.api.Host(
-            organization=module_sca_manifest_org,
-            location=module_location,
+            organization=module_sync_kickstart_content.org,
+            location=module_sync_kickstart_content.location,
             name=gen_string('alpha').lower(),
             operatingsystem=module_sync_kickstart_content.os,
             architecture=default_architecture,
@@ -731,8 +701,8 @@ class TestProvisioningTemplate:
             ptable=default_partitiontable,
             content_facet_attributes={
                 'content_source_id': module_target_sat.nailgun_smart_proxy.id,
-                'content_view_id': module_default_org_view.id,
-                'lifecycle_environment_id': module_lce_library.id,
+                'content_view_id': module_sync_kickstart_content.default_org_view.id,
+                'lifecycle_environment_id': module_sync_kickstart_content.lce_library.id,
             },
             host_parameters_attributes=host_params,
         ).create()
@@ -39,6 +39,17 @@ def get_default_env(module_org, module_target_sat):
     )
 
 
+@pytest.fixture(scope='module')
+def module_custom_repo_setup(module_org, module_target_sat):
+    """Custom repository synced in the module organization, the first steps of
+    ``setup_org_for_a_custom_repo`` shared by the tests setting up their own content view
+    and activation key upon it
+    """
+    return module_target_sat.cli_factory.custom_repo_setup_plan(
+        {'url': settings.repos.yum_0.url, 'organization-id': module_org.id}
+    ).run(until=['sync'])
+
+
 @pytest.mark.tier1
 @pytest.mark.parametrize('name', **parametrized(valid_data_list()))
 def test_positive_create_with_name(module_target_sat, module_entitlement_manifest_org, name):
@@ -190,7 +201,9 @@ def test_positive_create_with_usage_limit_finite(module_org, module_target_sat):
 
 @pytest.mark.tier2
 @pytest.mark.skipif((not settings.robottelo.REPOS_HOSTING_URL), reason='Missing repos_hosting_url')
-def test_positive_create_content_and_check_enabled(module_org, module_target_sat):
+def test_positive_create_content_and_check_enabled(
+    module_org, module_target_sat, module_custom_repo_setup
+):
     """Create activation key and add content to it. Check enabled state.
 
     :id: abfc6c6e-acd1-4761-b309-7e68e1d17172
@@ -201,7 +214,8 @@ def test_positive_create_content_and_check_enabled(module_org, module_target_sat
     :BZ: 1361993
     """
     result = module_target_sat.cli_factory.setup_org_for_a_custom_repo(
-        {'url': settings.repos.yum_0.url, 'organization-id': module_org.id}
+        {'url': settings.repos.yum_0.url, 'organization-id': module_org.id},
+        done=module_custom_repo_setup,
     )
     content = module_target_sat.cli.ActivationKey.product_content(
         {'id': result['activationkey-id'], 'organization-id': module_org.id}
@@ -728,7 +742,7 @@ def test_positive_add_redhat_product(function_entitlement_manifest_org, target_s
 
 @pytest.mark.tier3
 @pytest.mark.skipif((not settings.robottelo.REPOS_HOSTING_URL), reason='Missing repos_hosting_url')
-def test_positive_add_custom_product(module_org, module_target_sat):
+def test_positive_add_custom_product(module_org, module_target_sat, module_custom_repo_setup):
     """Test that custom product can be associated to Activation Keys
 
     :id: 96ace967-e165-4069-8ff7-f54c4c822de0
@@ -739,7 +753,8 @@ def test_positive_add_custom_product(module_org, module_target_sat):
     :BZ: 1426386
     """
     result = module_target_sat.cli_factory.setup_org_for_a_custom_repo(
-        {'url': settings.repos.yum_0.url, 'organization-id': module_org.id}
+        {'url': settings.repos.yum_0.url, 'organization-id': module_org.id},
+        done=module_custom_repo_setup,
     )
     repo = module_target_sat.cli.Repository.info({'id': result['repository-id']})
     content = module_target_sat.cli.ActivationKey.product_content(
@@ -1434,7 +1449,7 @@ def test_negative_update_autoattach(module_org, module_target_sat):
 
 @pytest.mark.tier3
 @pytest.mark.skipif((not settings.robottelo.REPOS_HOSTING_URL), reason='Missing repos_hosting_url')
-def test_positive_content_override(module_org, module_target_sat):
+def test_positive_content_override(module_org, module_target_sat, module_custom_repo_setup):
     """Positive content override
 
     :id: a4912cc0-3bf7-4e90-bb51-ec88b2fad227
@@ -1449,7 +1464,8 @@ def test_positive_content_override(module_org, module_target_sat):
     :expectedresults: Activation key content override was successful
     """
     result = module_target_sat.cli_factory.setup_org_for_a_custom_repo(
-        {'url': settings.repos.yum_0.url, 'organization-id': module_org.id}
+        {'url': settings.repos.yum_0.url, 'organization-id': module_org.id},
+        done=module_custom_repo_setup,
     )
     content = module_target_sat.cli.ActivationKey.product_content(
         {'id': result['activationkey-id'], 'organization-id': module_org.id}
@@ -22,13 +22,9 @@ from robottelo.constants import HTTPS_MEDIUM_URL
 @pytest.mark.rhel_ver_match('[^6]')
 def test_positive_bootdisk_download_https(
     request,
-    module_location,
     module_sync_kickstart_content,
     module_provisioning_capsule,
     module_target_sat,
-    module_sca_manifest_org,
-    module_default_org_view,
-    module_lce_library,
     default_architecture,
     default_partitiontable,
 ):
@@ -58,15 +54,15 @@ def test_positive_bootdisk_download_https(
             'name': gen_string('alpha'),
             'operatingsystem-ids': module_sync_kickstart_content.os.id,
             'location-ids': module_provisioning_capsule.id,
-            'organization-ids': module_sca_manifest_org.id,
+            'organization-ids': module_sync_kickstart_content.org.id,
             'path': HTTPS_MEDIUM_URL,
             'os-family': 'Redhat',
         }
     )
     host = module_target_sat.cli_factory.make_host(
         {
-            'organization-id': module_sca_manifest_org.id,
-            'location-id': module_location.id,
+            'organization-id': module_sync_kickstart_content.org.id,
+            'location-id': module_sync_kickstart_content.location.id,
             'name': gen_string('alpha').lower(),
             'mac': macaddress,
             'operatingsystem-id': module_sync_kickstart_content.os.id,
@@ -77,8 +73,8 @@ def test_positive_bootdisk_download_https(
             'root-password': settings.provisioning.host_root_password,
             'partition-table-id': default_partitiontable.id,
             'content-source-id': capsule.id,
-            'content-view-id': module_default_org_view.id,
-            'lifecycle-environment-id': module_lce_library.id,
+            'content-view-id': module_sync_kickstart_content.default_org_view.id,
+            'lifecycle-environment-id': module_sync_kickstart_content.lce_library.id,
         }
     )
 
@@ -18,6 +18,7 @@ from wrapanapi import VmState
 from robottelo import constants
 from robottelo.config import settings
 from robottelo.constants import CLIENT_PORT, DataFile
+from robottelo.host_helpers.capsule_mixins import CapsuleFleet
 from robottelo.utils.installer import InstallerCommand
 
 pytestmark = [pytest.mark.no_containers, pytest.mark.destructive]
@@ -97,9 +98,7 @@ def setup_capsules(
                 'lifecycle-environment': content_for_client['client_lce'].name,
             }
         )
-        module_target_sat.cli.Capsule.content_synchronize(
-            {'id': capsule_id, 'organization-id': module_org.id}
-        )
+    CapsuleFleet(module_lb_capsule, satellite=module_target_sat).sync(timeout=3600)
 
     return {
         'capsule_1': module_lb_capsule[0],
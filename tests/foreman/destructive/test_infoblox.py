@@ -119,10 +119,6 @@ def test_infoblox_end_to_end(
     module_sync_kickstart_content,
     module_provisioning_capsule,
     module_target_sat,
-    module_sca_manifest_org,
-    module_location,
-    module_default_org_view,
-    module_lce_library,
     default_architecture,
     default_partitiontable,
 ):
@@ -185,13 +181,13 @@ def test_infoblox_end_to_end(
     # using the domain name as defined in Infoblox DNS
     domain = module_target_sat.api.Domain(
         name=settings.infoblox.domain,
-        location=[module_location],
+        location=[module_sync_kickstart_content.location],
         dns=module_provisioning_capsule.id,
-        organization=[module_sca_manifest_org],
+        organization=[module_sync_kickstart_content.org],
     ).create()
     subnet = module_target_sat.api.Subnet(
-        location=[module_location],
-        organization=[module_sca_manifest_org],
+        location=[module_sync_kickstart_content.location],
+        organization=[module_sync_kickstart_content.org],
         network=settings.infoblox.network,
         cidr=settings.infoblox.network_prefix,
         mask=settings.infoblox.netmask,
@@ -207,8 +203,8 @@ def test_infoblox_end_to_end(
         domain=[domain.id],
     ).create()
     host = module_target_sat.api.Host(
-        organization=module_sca_manifest_org,
-        location=module_location,
+        organization=module_sync_kickstart_content.org,
+        location=module_sync_kickstart_content.location,
         name=gen_string('alpha').lower(),
         mac=macaddress,
         operatingsystem=module_sync_kickstart_content.os,
@@ -219,8 +215,8 @@ def test_infoblox_end_to_end(
         ptable=default_partitiontable,
         content_facet_attributes={
             'content_source_id': module_provisioning_capsule.id,
-            'content_view_id': module_default_org_view.id,
-            'lifecycle_environment_id': module_lce_library.id,
+            'content_view_id': module_sync_kickstart_content.default_org_view.id,
+            'lifecycle_environment_id': module_sync_kickstart_content.lce_library.id,
         },
     ).create()
     # check if A Record is created for the host IP on Infoblox
@@ -0,0 +1,144 @@
+"""Benchmarks of the CLI layer, from the hammer command construction to the parsed
+output, run over the in-process ``robottelo.utils.fake_ssh.FakeSSH`` transport.
+
+Usage: make test-robottelo-benchmark, or pytest tests/robottelo/benchmarks with
+pytest-benchmark options, e.g. --benchmark-compare to compare with a saved run.
+"""
+
+import json
+from unittest import mock
+
+import pytest
+
+from robottelo.cli import hammer
+from robottelo.cli.org import Org
+from robottelo.exceptions import CLIReturnCodeError
+from robottelo.utils.fake_ssh import FakeSSH
+
+pytest.importorskip('pytest_benchmark')
+
+# the number of rows of the list outputs
+ROWS = 2000
+# the number of commands run by the scale benchmarks
+COMMANDS = 200
+
+
+def csv_output(rows=ROWS):
+    lines = ['Id,Title,Name,Description,Label']
+    lines.extend(f'{i},org {i},org {i},"an, organization",org_{i}' for i in range(rows))
+    return '\n'.join(lines) + '\n'
+
+
+def json_output(rows=ROWS):
+    return json.dumps(
+        [
+            {'Id': i, 'Title': f'org {i}', 'Name': f'org {i}', 'Label': f'org_{i}'}
+            for i in range(rows)
+        ]
+    )
+
+
+def info_output(items=50):
+    lines = ['Id:          1', 'Title:       org 1', 'Name:        org 1', 'Subnets:']
+    lines.extend(f'    {i}) subnet {i}' for i in range(1, items))
+    lines.append('Domains:')
+    lines.extend(f'    {i}) Name: domain{i}.example.com\n       Id: {i}' for i in range(1, items))
+    return '\n'.join(lines) + '\n'
+
+
+@pytest.fixture
+def settings():
+    with (
+        mock.patch('robottelo.cli.base.settings') as settings,
+        mock.patch('robottelo.config.settings', settings),
+    ):
+        settings.robottelo.locale = 'en_US.UTF-8'
+        settings.performance.time_hammer = False
+        settings.server.hostname = 'satellite.example.com'
+        settings.server.admin_username = 'admin'
+        settings.server.admin_password = 'changeme'
+        yield settings
+
+
+@pytest.fixture
+def fake(settings):
+    """A fake transport of the organization hammer commands"""
+    fake = FakeSSH()
+    fake.add(r'--output=json organization list', stdout=json_output())
+    fake.add(r'organization list', stdout=csv_output())
+    fake.add(r'organization info', stdout=info_output())
+    fake.add(r'organization delete', stderr='Error: organization not found', status=65)
+    with fake:
+        yield fake
+
+
+def test_construct_command(benchmark):
+    """Build a hammer command with many options"""
+    options = {f'option-{i}': f'value {i}' for i in range(20)}
+    options.update({'flag': True, 'unset': None, 'ids': list(range(50))})
+    command = benchmark(Org._construct_command, options)
+    assert '--ids="0,1,2' in command
+
+
+@pytest.mark.parametrize(
+    ('parser', 'output'),
+    [
+        (hammer.parse_csv, csv_output()),
+        (hammer.parse_json, json_output()),
+        (hammer.parse_info, info_output()),
+    ],
+    ids=['csv', 'json', 'info'],
+)
+def test_parse(benchmark, parser, output):
+    """Parse a large hammer output"""
+    assert benchmark(parser, output)
+
+
+def test_execute_list(benchmark, fake):
+    """List the organizations, the csv output parsed"""
+    orgs = benchmark(Org.list)
+    assert len(orgs) == ROWS
+
+
+def test_execute_list_json(benchmark, fake):
+    """List the organizations, the json output parsed"""
+    orgs = benchmark(Org.list, output_format='json')
+    assert len(orgs) == ROWS
+
+
+def test_execute_info(benchmark, fake):
+    """Read an organization, the info output parsed"""
+    org = benchmark(Org.info, {'id': 1})
+    assert len(org['domains']) == 49
+
+
+def test_execute_error(benchmark, fake):
+    """Run a failing command, the error raised"""
+
+    def delete():
+        with pytest.raises(CLIReturnCodeError):
+            Org.delete({'id': 1})
+
+    benchmark(delete)
+
+
+@pytest.mark.parametrize('latency', [0, 0.001], ids=['no-latency', '1ms-latency'])
+def test_execute_at_scale(benchmark, fake, latency):
+    """Run many commands, some failing, the clients made per command counted"""
+    fake.latency = latency
+    fake.failure_rate = 0.05
+    fake.outputs.insert(0, fake.outputs.pop(2))
+
+    def run():
+        failed = 0
+        for i in range(COMMANDS):
+            try:
+                Org.info({'id': i})
+            except CLIReturnCodeError:
+                failed += 1
+        return failed
+
+    fake.clients = 0
+    failed = benchmark.pedantic(run, rounds=3)
+    benchmark.extra_info['clients_per_command'] = fake.clients / (3 * COMMANDS)
+    assert 0 < failed < COMMANDS
@@ -0,0 +1,125 @@
+from unittest import mock
+
+from box import Box
+import pytest
+from requests import HTTPError
+
+from robottelo.host_helpers.api_factory import APIFactory
+
+
+@pytest.fixture
+def api_factory():
+    """An APIFactory of a Satellite with a mocked API, its tasks finished at once"""
+    with mock.patch('robottelo.host_helpers.api_factory.initiate_repo_helpers', return_value={}):
+        factory = APIFactory(mock.MagicMock())
+    api = factory._satellite.api
+    api.ContentView.return_value.publish.return_value = {'id': 'publish'}
+    api.ForemanTask.side_effect = lambda id: mock.Mock(
+        poll=mock.Mock(return_value={'id': id, 'input': {'content_view_version_id': 7}})
+    )
+    api.ContentViewVersion.side_effect = lambda id=None: Box(id=id, promote=api.promote)
+    return factory
+
+
+def test_publish_promote_cv(api_factory):
+    """The version published is promoted to all the environments in a single request"""
+    api = api_factory._satellite.api
+    version = api_factory.publish_promote_cv(Box(id=3), [Box(id=11), 12, 13])
+    assert version.id == 7
+    api.ContentView.return_value.publish.assert_called_once_with(synchronous=False)
+    api.promote.assert_called_once_with(synchronous=False, data={'environment_ids': [11, 12, 13]})
+    assert api.ForemanTask.call_count == 2
+
+
+def test_publish_promote_cv_latest_version(api_factory):
+    """Without the version in the publish task, the latest version is searched alone"""
+    api = api_factory._satellite.api
+    api.ForemanTask.side_effect = None
+    api.ForemanTask.return_value.poll.return_value = {'id': 'publish', 'input': {}}
+    api.ContentViewVersion.side_effect = None
+    api.ContentViewVersion.return_value.search_json.return_value = {'results': [{'id': 8}]}
+    api_factory.publish_promote_cv(3)
+    assert api.ContentViewVersion.return_value.search_json.call_args.kwargs == {
+        'query': {'content_view_id': 3, 'order': 'id DESC', 'per_page': 1}
+    }
+    assert api.ContentViewVersion.call_args.kwargs == {'id': 8}
+    api.ContentViewVersion.return_value.promote.assert_not_called()
+
+
+REPOS = [
+    {'product': 'RHEL', 'reposet': 'BaseOS', 'name': 'BaseOS 9', 'releasever': '9'},
+    {'product': 'RHEL', 'reposet': 'AppStream', 'name': 'AppStream 9', 'basearch': 'aarch64'},
+    {'product': 'Satellite', 'reposet': 'Client', 'name': 'Client 9'},
+]
+
+
+@pytest.fixture
+def rh_api(api_factory):
+    """The API of the Red Hat products, their repository sets and repositories"""
+    api = api_factory._satellite.api
+    api.Product.side_effect = lambda name, organization: mock.Mock(
+        search=mock.Mock(return_value=[Box(id=f'{name} id')])
+    )
+    api.reposets = {}
+    api.RepositorySet.side_effect = lambda name, product: mock.Mock(
+        search=mock.Mock(return_value=[api.reposets.setdefault(name, mock.Mock())])
+    )
+    api.Repository.side_effect = lambda name=None, id=None: mock.Mock(
+        search=mock.Mock(return_value=[Box(id=f'{name} id')]),
+        sync=mock.Mock(return_value={'id': f'{id} sync'}),
+        read=mock.Mock(return_value=Box(id=id)),
+    )
+    return api
+
+
+def already_enabled(status_code=409, message='Error: repository is already enabled'):
+    return HTTPError(
+        response=mock.Mock(status_code=status_code, json=lambda: {'displayMessage': message})
+    )
+
+
+def test_enable_rhrepos(api_factory, rh_api):
+    """The products and repository sets are searched once, the repositories enabled and
+    synced, the syncs waited for"""
+    handle = api_factory.enable_rhrepos(1, REPOS)
+    assert rh_api.Product.call_count == 2
+    assert rh_api.RepositorySet.call_count == 3
+    rh_api.reposets['BaseOS'].enable.assert_called_once_with(
+        data={'basearch': 'x86_64', 'product_id': 'RHEL id', 'releasever': '9'}
+    )
+    rh_api.reposets['AppStream'].enable.assert_called_once_with(
+        data={'basearch': 'aarch64', 'product_id': 'RHEL id'}
+    )
+    assert handle.repo_ids == ['BaseOS 9 id', 'AppStream 9 id', 'Client 9 id']
+    assert handle.tasks == [{'id': f'{repo_id} sync'} for repo_id in handle.repo_ids]
+    repos = handle.wait(timeout=10)
+    assert [repo.id for repo in repos] == handle.repo_ids
+    api_factory._satellite.api_factory.poll_tasks.assert_called_once_with(handle.tasks, timeout=10)
+
+
+def test_enable_rhrepos_no_sync(api_factory, rh_api):
+    """Without sync, the repositories are enabled only"""
+    handle = api_factory.enable_rhrepos(1, REPOS, sync=False)
+    assert handle.tasks == []
+    assert len(handle.repo_ids) == 3
+
+
+def test_enable_rhrepos_already_enabled(api_factory, rh_api):
+    """An already enabled repository is an error only in strict mode"""
+    rh_api.reposets['BaseOS'] = mock.Mock(**{'enable.side_effect': already_enabled()})
+    handle = api_factory.enable_rhrepos(1, REPOS[:1], sync=False)
+    assert handle.repo_ids == ['BaseOS 9 id']
+    with pytest.raises(HTTPError):
+        api_factory.enable_rhrepos(1, REPOS[:1], strict=True)
+
+
+@pytest.mark.parametrize(
+    'error',
+    [already_enabled(500), already_enabled(message='Error: invalid release version')],
+    ids=['server-error', 'other-conflict'],
+)
+def test_enable_rhrepos_error(api_factory, rh_api, error):
+    """The other errors of enabling a repository are raised"""
+    rh_api.reposets['BaseOS'] = mock.Mock(**{'enable.side_effect': error})
+    with pytest.raises(HTTPError):
+        api_factory.enable_rhrepos(1, REPOS)
@@ -0,0 +1,212 @@
+from collections import Counter
+import functools
+import gzip
+import hashlib
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import subprocess
+import threading
+from unittest import mock
+
+from box import Box
+import pytest
+
+from robottelo.host_helpers import capsule_mixins
+from robottelo.host_helpers.capsule_mixins import CapsuleFleet, CapsuleInfo
+
+
+class LocalCapsule(CapsuleInfo):
+    """Capsule running its commands on the local host"""
+
+    hostname = 'localhost'
+
+    def __init__(self, url=None):
+        self.url = url
+        self.commands = []
+
+    def execute(self, cmd):
+        self.commands.append(cmd)
+        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        return Box(status=result.returncode, stdout=result.stdout, stderr=result.stderr)
+
+
+@pytest.fixture
+def artifacts(mocker, tmp_path):
+    """Artifacts dir with two valid artifacts and a corrupted one"""
+    artifact_dir = f'{tmp_path}/artifact/'
+    mocker.patch.object(capsule_mixins, 'PULP_ARTIFACT_DIR', artifact_dir)
+    checksums = []
+    for content in (b'first', b'second', b'third'):
+        checksum = hashlib.sha256(content).hexdigest()
+        path = tmp_path.joinpath('artifact', checksum[:2], checksum[2:])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        checksums.append(checksum)
+    tmp_path.joinpath('artifact', checksums[2][:2], checksums[2][2:]).write_bytes(b'corrupted')
+    return checksums
+
+
+def test_verify_artifacts_single_pass(artifacts):
+    """All the artifacts are hashed by one remote command"""
+    capsule = LocalCapsule()
+    missing = 'ff' * 32
+    report = capsule.verify_artifacts(checksums=[*artifacts, missing])
+    assert len(capsule.commands) == 1
+    assert sorted(artifact.sum for artifact in report.ok) == sorted(artifacts[:2])
+    assert [artifact.expected for artifact in report.mismatch] == [artifacts[2]]
+    assert [artifact.expected for artifact in report.missing] == [missing]
+    assert len(capsule.verify_artifacts().ok) == 2
+
+
+def test_get_artifact_info(artifacts):
+    """A single artifact is described by path, size, sum and info"""
+    capsule = LocalCapsule()
+    info = capsule.get_artifact_info(checksum=artifacts[0])
+    assert info.keys() == {'path', 'size', 'sum', 'info'}
+    assert (info.size, info.sum) == (5, artifacts[0])
+    assert capsule.get_artifact_info(path=info.path) == info
+    with pytest.raises(FileNotFoundError):
+        capsule.get_artifact_info(checksum='ff' * 32)
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def _publish(root, packages, manifest=None):
+    """Serve a yum repository with the packages, or a file repository with the manifest,
+    under root at the path of a Library custom repo"""
+    repo_dir = root.joinpath('pulp', 'content', 'org', 'Library', 'custom', 'prod', 'repo')
+    repo_dir.joinpath('repodata').mkdir(parents=True)
+    if manifest is not None:
+        repo_dir.joinpath('PULP_MANIFEST').write_text(manifest)
+        repo_dir.joinpath('repodata').rmdir()
+        return
+    primary = ''.join(
+        f'<package type="rpm"><name>{name}</name>'
+        f'<checksum type="sha256">{checksum}</checksum></package>'
+        for name, checksum in packages.items()
+    )
+    repo_dir.joinpath('repodata', 'primary.xml.gz').write_bytes(
+        gzip.compress(
+            f'<metadata xmlns="http://linux.duke.edu/metadata/common">{primary}</metadata>'.encode()
+        )
+    )
+    repo_dir.joinpath('repodata', 'repomd.xml').write_text(
+        '<repomd xmlns="http://linux.duke.edu/metadata/repo"><data type="primary">'
+        '<location href="repodata/primary.xml.gz"/></data></repomd>'
+    )
+
+
+@pytest.fixture
+def http_root(tmp_path):
+    """Serve two document roots, one per host"""
+    servers = []
+    for name in ('satellite', 'capsule'):
+        tmp_path.joinpath(name).mkdir()
+        server = ThreadingHTTPServer(
+            ('127.0.0.1', 0),
+            functools.partial(QuietHandler, directory=str(tmp_path / name)),
+        )
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+    yield tmp_path, [f'http://127.0.0.1:{server.server_port}' for server in servers]
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_check_content_parity(http_root):
+    """Missing and extra checksums are found by listing only the differing buckets"""
+    root, (sat_url, caps_url) = http_root
+    checksums = {f'pkg{i}': hashlib.sha256(str(i).encode()).hexdigest() for i in range(50)}
+    _publish(root / 'satellite', checksums)
+    _publish(root / 'capsule', {**dict(list(checksums.items())[:49]), 'extra': 'ff' * 32})
+    satellite, capsule = LocalCapsule(sat_url), LocalCapsule(caps_url)
+    repo = {'org': 'org', 'prod': 'prod', 'repo': 'repo'}
+    [result] = capsule.check_content_parity(satellite, [repo])
+    assert not result.in_sync
+    assert result.count == 50
+    assert result.missing == [checksums['pkg49']]
+    assert result.extra == ['ff' * 32]
+    listed = capsule.get_repo_index(capsule.get_published_repo_url(**repo), ['ff']).checksums
+    assert listed == {'ff': ['ff' * 32]}
+
+
+def test_check_content_parity_in_sync(http_root):
+    """Identical file repositories only compare their root hashes"""
+    root, (sat_url, caps_url) = http_root
+    for host in ('satellite', 'capsule'):
+        _publish(root / host, {}, manifest='a.iso,aaaa,1\nb.iso,bbbb,1\n')
+    satellite, capsule = LocalCapsule(sat_url), LocalCapsule(caps_url)
+    [result] = capsule.check_content_parity(
+        satellite, [{'org': 'org', 'prod': 'prod', 'repo': 'repo'}]
+    )
+    assert result.in_sync
+    assert (result.count, result.missing, result.extra) == (2, [], [])
+    assert len(capsule.commands) == 1
+
+
+def fake_capsule(hostname, sizes, task_id, last_sync_time='2999-01-01 00:00:00 UTC'):
+    """A Capsule starting a sync task, its artifacts storage of the given sizes"""
+    capsule = mock.Mock(hostname=hostname)
+    capsule.execute.side_effect = [Box(stdout=f'{size}\n') for size in sizes]
+    capsule.nailgun_capsule.content_sync.return_value = {'id': task_id}
+    capsule.nailgun_capsule.content_get_sync.side_effect = [
+        {'active_sync_tasks': [{'id': task_id}], 'last_failed_sync_tasks': []},
+        {
+            'active_sync_tasks': [],
+            'last_failed_sync_tasks': [],
+            'last_sync_time': last_sync_time,
+        },
+    ]
+    return capsule
+
+
+@pytest.fixture
+def satellite():
+    """A Satellite whose sync tasks are read running once, then finished in 10s, the
+    one of cap2 failed
+    """
+    reads = Counter()
+
+    def read_task(task_id):
+        reads[task_id] += 1
+        if reads[task_id] == 1:
+            return {'id': task_id, 'state': 'running', 'result': 'pending'}
+        return {
+            'id': task_id,
+            'state': 'stopped',
+            'result': 'error' if task_id == 'task2' else 'success',
+            'started_at': '2024-01-01 10:00:00 UTC',
+            'ended_at': '2024-01-01 10:00:10 UTC',
+            'output': {
+                'pulp_tasks': [
+                    {'progress_reports': [{'code': 'sync.downloading.artifacts', 'done': 50}]}
+                ]
+            },
+        }
+
+    satellite = mock.Mock()
+    satellite.api.ForemanTask.side_effect = lambda id: mock.Mock(
+        read_json=functools.partial(read_task, id)
+    )
+    return satellite
+
+
+def test_capsule_fleet_sync(satellite):
+    """The capsules sync tasks are polled together, each capsule verified and reported"""
+    capsules = [
+        fake_capsule('cap1.example.com', [100, 2100], 'task1'),
+        fake_capsule('cap2.example.com', [0, 0], 'task2', '2000-01-01 00:00:00 UTC'),
+    ]
+    with pytest.raises(AssertionError) as error:
+        CapsuleFleet(capsules, satellite=satellite).sync(poll_rate=0)
+    assert 'cap1.example.com' not in str(error.value)
+    assert 'cap2.example.com: task task2 ended in stopped with result error' in str(error.value)
+    assert 'cap2.example.com: last sync time' in str(error.value)
+    capsules = [fake_capsule('cap1.example.com', [100, 2100], 'task3')]
+    report = CapsuleFleet(capsules, satellite=satellite).sync(poll_rate=0)['cap1.example.com']
+    assert report.results == ['success']
+    assert (report.duration, report.artifacts, report.bytes) == (10, 50, 2000)
+    assert (report.artifacts_per_sec, report.bytes_per_sec) == (5, 200)
@@ -0,0 +1,208 @@
+import time
+from unittest import mock
+
+import pytest
+
+from robottelo.exceptions import CLIFactoryError, CLIReturnCodeError
+from robottelo.host_helpers.cli_factory import CLIFactory
+
+MAKES = {
+    'make_org': {'id': 1},
+    'make_lifecycle_environment': {'id': 2},
+    'make_content_view': {'id': 3},
+    'make_product': {'id': 4, 'name': 'product'},
+    'make_product_wait': {'id': 4, 'name': 'product'},
+    'make_repository': {'id': 6},
+    'make_activation_key': {'id': 7},
+}
+
+
+def slow(done):
+    """Return a side effect taking some time, then calling done"""
+
+    def side_effect(*args, **kwargs):
+        time.sleep(0.2)
+        done()
+
+    return side_effect
+
+
+@pytest.fixture
+def cli_factory():
+    """A CLIFactory of a Satellite with a mocked CLI in SCA mode, its calls recorded in
+    the order made, the syncs and promotes slow and recorded as ``synced`` and
+    ``promoted`` once done, for the steps not waiting for them to overtake them
+    """
+    with mock.patch('robottelo.host_helpers.cli_factory.initiate_repo_helpers', return_value={}):
+        factory = CLIFactory(mock.MagicMock())
+    satellite = factory._satellite
+    for name, entity in MAKES.items():
+        make = mock.Mock(return_value=entity)
+        satellite.attach_mock(make, name)
+        setattr(factory, name, make)
+    satellite.is_sca_mode_enabled.return_value = True
+    for command, done in (
+        (satellite.cli.Repository.synchronize, satellite.synced),
+        (satellite.cli.ContentView.version_promote, satellite.promoted),
+    ):
+        command.side_effect = slow(done)
+    satellite.cli.ContentView.info.return_value = {
+        'id': 3,
+        'versions': [{'id': 5}],
+        'lifecycle-environments': [],
+    }
+    satellite.cli.Repository.info.return_value = {'id': 8, 'content-label': 'label'}
+    satellite.cli.Subscription.exists.return_value = [{'id': 9}]
+    satellite.cli.Subscription.list.return_value = [{'id': 9, 'name': 'product'}]
+    return factory
+
+
+def calls(factory):
+    """Return the names of the calls made by the factory, in order"""
+    return [name for name, _, _ in factory._satellite.mock_calls]
+
+
+def assert_ordered(names, *steps):
+    """Assert the steps were all called, each after the previous ones"""
+    indexes = [names.index(step) for step in steps]
+    assert indexes == sorted(indexes), names
+
+
+def test_setup_org_for_a_custom_repo(cli_factory):
+    """The content view is published once synced, the activation key made once promoted"""
+    assert cli_factory.setup_org_for_a_custom_repo({'url': 'http://repo.example.com'}) == {
+        'activationkey-id': 7,
+        'content-view-id': 3,
+        'lifecycle-environment-id': 2,
+        'organization-id': 1,
+        'product-id': 4,
+        'repository-id': 8,
+    }
+    names = calls(cli_factory)
+    assert_ordered(names, 'make_repository', 'synced', 'cli.ContentView.publish')
+    assert_ordered(names, 'cli.ContentView.add_repository', 'cli.ContentView.publish')
+    assert_ordered(names, 'cli.ContentView.publish', 'promoted', 'make_activation_key')
+    assert_ordered(names, 'make_activation_key', 'cli.ActivationKey.content_override')
+    cli_factory.make_repository.assert_called_once_with(
+        {'content-type': 'yum', 'product-id': 4, 'url': 'http://repo.example.com'}
+    )
+    cli_factory._satellite.cli.ContentView.version_promote.assert_called_once_with(
+        {'id': 5, 'organization-id': 1, 'to-lifecycle-environment-id': 2}
+    )
+
+
+def test_setup_org_for_a_custom_repo_failure(cli_factory):
+    """A failing step stops the setup, its CLIFactoryError raised"""
+    cli = cli_factory._satellite.cli
+    cli.Repository.synchronize.side_effect = CLIReturnCodeError(1, 'error', 'sync failed')
+    with pytest.raises(CLIFactoryError, match='Failed to synchronize repository\nsync failed'):
+        cli_factory.setup_org_for_a_custom_repo({'url': 'http://repo.example.com'})
+    cli.ContentView.publish.assert_not_called()
+    cli_factory.make_activation_key.assert_not_called()
+
+
+def test_setup_org_for_a_custom_repo_shared(cli_factory):
+    """The synced repository of a shared setup is reused, the content view and
+    activation key made for each setup
+    """
+    options = {'url': 'http://repo.example.com', 'organization-id': 1}
+    shared = cli_factory.custom_repo_setup_plan(options).run(until=['sync'])
+    assert set(shared) == {'org_id', 'product', 'repo', 'sync'}
+    cli_factory._satellite.reset_mock()
+    for _ in range(2):
+        assert cli_factory.setup_org_for_a_custom_repo(options, done=shared)['product-id'] == 4
+    names = calls(cli_factory)
+    assert 'make_repository' not in names
+    assert 'cli.Repository.synchronize' not in names
+    assert names.count('make_content_view') == names.count('make_activation_key') == 2
+
+
+def test_setup_org_for_a_rh_repo(cli_factory):
+    """The repository is enabled in the given org, synced before the publish"""
+    options = {
+        'organization-id': 10,
+        'product': 'RHEL',
+        'repository-set': 'BaseOS',
+        'repository': 'BaseOS 9',
+        'releasever': '9',
+    }
+    assert cli_factory._setup_org_for_a_rh_repo(options, force=True) == {
+        'activationkey-id': 7,
+        'content-view-id': 3,
+        'lifecycle-environment-id': 2,
+        'organization-id': 10,
+        'repository-id': 8,
+    }
+    names = calls(cli_factory)
+    assert 'make_org' not in names
+    assert 'upload_manifest' not in names
+    assert_ordered(names, 'cli.RepositorySet.enable', 'cli.Repository.synchronize')
+    assert_ordered(names, 'synced', 'cli.ContentView.publish')
+    assert_ordered(names, 'cli.ContentView.add_repository', 'cli.ContentView.publish')
+    assert_ordered(names, 'cli.ContentView.publish', 'promoted', 'make_activation_key')
+    cli = cli_factory._satellite.cli
+    cli.Repository.synchronize.assert_called_once_with(
+        {'name': 'BaseOS 9', 'product': 'RHEL', 'organization-id': 10}
+    )
+    cli.ContentView.version_promote.assert_called_once_with(
+        {'id': 5, 'organization-id': 10, 'to-lifecycle-environment-id': 2, 'force': True}
+    )
+
+
+def test_setup_org_for_a_rh_repo_failure(cli_factory):
+    """A repository set failing to be enabled stops the setup, its CLIFactoryError raised"""
+    cli = cli_factory._satellite.cli
+    cli.RepositorySet.enable.side_effect = CLIReturnCodeError(1, 'error', 'not found')
+    options = {'product': 'RHEL', 'repository-set': 'BaseOS', 'repository': 'BaseOS 9'}
+    with pytest.raises(CLIFactoryError, match='Failed to enable repository set\nnot found'):
+        cli_factory._setup_org_for_a_rh_repo(options)
+    cli.Repository.synchronize.assert_not_called()
+    cli.ContentView.publish.assert_not_called()
+
+
+def test_setup_cdn_and_custom_repos_content(cli_factory):
+    """The content view is published once the repositories are synced, the activation
+    key made once promoted and given the subscriptions
+    """
+    data = cli_factory.setup_cdn_and_custom_repos_content(
+        1, lce_id=2, repos=[{'url': 'http://repo.example.com'}]
+    )
+    cli = cli_factory._satellite.cli
+    assert data == {
+        'activation_key': {'id': 7},
+        'content_view': cli.ContentView.info.return_value,
+        'product': MAKES['make_product_wait'],
+        'repos': [{'id': 6}],
+        'lce': cli.LifecycleEnvironment.info.return_value,
+    }
+    names = calls(cli_factory)
+    assert_ordered(names, 'upload_manifest', 'make_product_wait', 'cli.Repository.synchronize')
+    assert_ordered(
+        names,
+        'synced',
+        'cli.ContentView.add_repository',
+        'cli.ContentView.publish',
+        'promoted',
+        'make_activation_key',
+        'cli.ActivationKey.add_subscription',
+    )
+    cli.ActivationKey.add_subscription.assert_called_once_with(
+        {'id': 7, 'subscription-id': 9, 'quantity': 1}
+    )
+
+
+def test_setup_cdn_and_custom_repos_content_failure(cli_factory):
+    """A missing subscription fails the setup, as a manifest failing to be uploaded"""
+    cli = cli_factory._satellite.cli
+    cli.Subscription.list.return_value = []
+    with pytest.raises(CLIFactoryError, match='Missing subscriptions'):
+        cli_factory.setup_cdn_and_custom_repos_content(
+            1, lce_id=2, repos=[{'url': 'http://repo.example.com'}]
+        )
+    cli_factory._satellite.upload_manifest.side_effect = CLIReturnCodeError(1, 'error', 'denied')
+    cli_factory.make_product_wait.reset_mock()
+    with pytest.raises(CLIFactoryError, match='Failed to upload manifest\ndenied'):
+        cli_factory.setup_cdn_and_custom_repos_content(
+            1, lce_id=2, repos=[{'url': 'http://repo.example.com'}]
+        )
+    cli_factory.make_product_wait.assert_not_called()
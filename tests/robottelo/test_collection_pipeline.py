@@ -0,0 +1,66 @@
+from unittest import mock
+
+import pytest
+
+from pytest_plugins import sanity_plugin
+from robottelo.utils import collection_pipeline
+from robottelo.utils.collection_pipeline import CollectionPipeline, ItemIndex
+
+pytestmark = [pytest.mark.filterwarnings('ignore::DeprecationWarning')]
+
+
+@pytest.mark.usefixtures('request')
+@pytest.mark.filterwarnings('ignore::UserWarning')
+def test_item_index(request):
+    """The index lists the markers as the item does, including the ones added through it"""
+    item = request.node
+    index = ItemIndex(item)
+    assert list(index.iter_markers()) == list(item.iter_markers())
+    assert index.closest('filterwarnings') is item.get_closest_marker('filterwarnings')
+    index.add_marker(pytest.mark.filterwarnings('ignore::ResourceWarning'))
+    assert not index.stale
+    assert list(index.iter_markers()) == list(item.iter_markers())
+    assert list(index.iter_markers('filterwarnings')) == list(item.iter_markers('filterwarnings'))
+    item.add_marker('usefixtures')
+    assert index.stale
+
+
+def test_pipeline_single_pass(mocker):
+    """Stages run in order, deselection skips the next stages, finish reorders"""
+    mocker.patch.object(collection_pipeline, 'item_index')
+    seen = []
+    pipeline = CollectionPipeline()
+    pipeline.add('odd', lambda item, index: seen.append(item) or item % 2 == 1)
+    pipeline.add('small', lambda item, index: item < 7)
+    pipeline.add('none', lambda item, index: item > 100, keep_all_if_none_selected=True)
+    pipeline.add('last', lambda item, index: item != 5, finish=lambda selected: selected.reverse())
+    selected, deselected = pipeline.run(list(range(10)))
+    assert seen == list(range(10))
+    assert selected == [3, 1]
+    assert deselected == [0, 2, 4, 5, 6, 7, 8, 9]
+    assert [stage.stats['deselected'] for stage in pipeline.stages] == [5, 2, 3, 1]
+
+
+def test_sanity_stage():
+    """The installer test runs first and is reported deselected, as it always was"""
+    config = mock.Mock()
+    config.option.markexpr = 'build_sanity'
+    pipeline = CollectionPipeline()
+    sanity_plugin.pytest_collection_stages(pipeline, config)
+    items = [mock.Mock() for _ in range(3)]
+    for item, name in zip(items, ('test_a', 'test_installer', 'test_puppet'), strict=True):
+        item.name = name
+    markers = {'test_a': {'build_sanity'}, 'test_installer': {'build_sanity', 'first_sanity'}}
+    fixtures = {'test_puppet': {'session_puppet_enabled_sat'}}
+
+    def index(item):
+        return mock.Mock(
+            fixtures=fixtures.get(item.name, set()),
+            closest=lambda name: name in markers.get(item.name, {'build_sanity'}) or None,
+        )
+
+    with mock.patch.object(collection_pipeline, 'item_index', index):
+        selected, deselected = pipeline.run(items)
+    assert [item.name for item in selected] == ['test_installer', 'test_a']
+    assert [item.name for item in deselected] == ['test_puppet']
+    config.hook.pytest_deselected.assert_called_once_with(items=[items[1]])
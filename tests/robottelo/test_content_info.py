@@ -0,0 +1,94 @@
+import functools
+import gzip
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+import pytest
+
+from robottelo.content_info import RepoInspector
+
+PRIMARY = """<?xml version="1.0" encoding="UTF-8"?>
+<metadata xmlns="http://linux.duke.edu/metadata/common"
+    xmlns:rpm="http://linux.duke.edu/metadata/rpm" packages="2">
+<package type="rpm">
+  <name>bear</name><arch>noarch</arch>
+  <version epoch="0" ver="4.1" rel="1"/>
+  <checksum type="sha256" pkgid="YES">aaa</checksum>
+  <location href="Packages/b/bear-4.1-1.noarch.rpm"/>
+</package>
+<package type="rpm">
+  <name>cat</name><arch>x86_64</arch>
+  <version epoch="2" ver="1.0" rel="3"/>
+  <checksum type="sha256" pkgid="YES">bbb</checksum>
+  <location href="Packages/c/cat-1.0-3.x86_64.rpm"/>
+</package>
+</metadata>
+"""
+REPOMD = """<?xml version="1.0" encoding="UTF-8"?>
+<repomd xmlns="http://linux.duke.edu/metadata/repo">
+  <revision>1700000000</revision>
+  <data type="primary">
+    <checksum type="sha256">{checksum}</checksum>
+    <location href="repodata/{checksum}-primary.xml.gz"/>
+  </data>
+</repomd>
+"""
+
+
+class RecordingHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def send_response(self, code, message=None):
+        self.server.requests.append((self.path, code))
+        super().send_response(code, message)
+
+
+@pytest.fixture
+def repo_server(tmp_path):
+    repodata = tmp_path.joinpath('yum', 'repodata')
+    repodata.mkdir(parents=True)
+    repodata.joinpath('123-primary.xml.gz').write_bytes(gzip.compress(PRIMARY.encode()))
+    repodata.joinpath('repomd.xml').write_text(REPOMD.format(checksum=123))
+    for path in ('Packages/a/ant.rpm', 'Packages/b/bee.rpm', 'Packages/b/bee.txt'):
+        tmp_path.joinpath('html', path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.joinpath('html', path).touch()
+    server = ThreadingHTTPServer(
+        ('127.0.0.1', 0), functools.partial(RecordingHandler, directory=str(tmp_path))
+    )
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f'http://127.0.0.1:{server.server_port}'
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_packages_from_repodata(repo_server):
+    """Packages are parsed from the primary metadata, which is fetched only once"""
+    inspector = RepoInspector()
+    packages = inspector.packages(f'{repo_server.url}/yum/')
+    assert [package.nevra for package in packages] == [
+        'bear-4.1-1.noarch',
+        'cat-2:1.0-3.x86_64',
+    ]
+    assert packages[1].checksum == 'bbb'
+    assert inspector.files_urls(f'{repo_server.url}/yum') == [
+        f'{repo_server.url}/yum/Packages/b/bear-4.1-1.noarch.rpm',
+        f'{repo_server.url}/yum/Packages/c/cat-1.0-3.x86_64.rpm',
+    ]
+    assert repo_server.requests == [
+        ('/yum/repodata/repomd.xml', 200),
+        ('/yum/repodata/123-primary.xml.gz', 200),
+        ('/yum/repodata/repomd.xml', 304),
+    ]
+
+
+def test_files_urls_crawls_html_without_repodata(repo_server):
+    """Repositories without metadata are crawled through their index pages"""
+    inspector = RepoInspector()
+    assert inspector.files_urls(f'{repo_server.url}/html') == [
+        f'{repo_server.url}/html/Packages/a/ant.rpm',
+        f'{repo_server.url}/html/Packages/b/bee.rpm',
+    ]
@@ -0,0 +1,103 @@
+from contextlib import closing
+import sqlite3
+from types import SimpleNamespace
+from unittest import mock
+
+from box import Box
+import pytest
+
+from pytest_plugins import duration_db
+from robottelo.utils.duration_db import DurationDB, makespan, schedule
+
+
+def test_duration_db_costs(tmp_path):
+    """Predictions average the latest runs of the Satellite version, or of any version"""
+    db = DurationDB(tmp_path / 'durations.sqlite', history=2)
+    for call in (100, 10, 20):
+        db.record(
+            tests=[
+                ('test_a', '6.16', 'setup', 1.0, 'passed'),
+                ('test_a', '6.16', 'call', call, 'passed'),
+                ('test_b', '6.15', 'call', 7.0, 'passed'),
+            ],
+            fixtures=[('module_org', 'module', '6.16', 2.0)],
+        )
+    assert db.test_costs('6.16') == {'test_a': 16.0, 'test_b': 7.0}
+    assert db.fixture_costs('6.16') == {'module_org': 2.0}
+    db.record_prediction(started=1000, workers=2, predicted_makespan=30)
+    assert db.prediction(since=900) == 30
+    assert db.prediction(since=1100) is None
+
+
+def test_schedule_longest_first():
+    """Jobs without history get the median cost, the order minimizes the makespan"""
+    order, costs = schedule(['a', 'b', 'c', 'd'], {'a': 1, 'b': 5, 'c': 3})
+    assert order == ['b', 'c', 'd', 'a']
+    assert costs['d'] == 3
+    assert makespan([costs[job] for job in order], workers=2) == 6
+    assert makespan([costs[job] for job in reversed(order)], workers=2) == 8
+
+
+def make_item(module, name):
+    item = mock.Mock(nodeid=f'{module}.py::{name}', module=SimpleNamespace(__name__=module))
+    item.cls = None
+    item.get_closest_marker.return_value = None
+    item._fixtureinfo.name2fixturedefs = {}
+    return item
+
+
+def test_schedule_modules(tmp_path):
+    """The modules are ordered longest first, their tests kept together in order"""
+    db = DurationDB(tmp_path / 'durations.sqlite')
+    db.record(
+        tests=[
+            ('short.py::test_1', '6.16', 'call', 1.0, 'passed'),
+            ('short.py::test_2', '6.16', 'call', 30.0, 'passed'),
+            ('long.py::test_1', '6.16', 'call', 20.0, 'passed'),
+            ('long.py::test_2', '6.16', 'call', 20.0, 'passed'),
+        ],
+        fixtures=[],
+    )
+    items = [
+        make_item(module, name) for module in ('short', 'long') for name in ('test_1', 'test_2')
+    ]
+    config = Box(getoption={'duration_schedule': True, 'duration_group_threshold': 60}.get)
+    with mock.patch.dict(duration_db._recorder, db=db, sat_version='6.16'):
+        duration_db.pytest_collection_modifyitems(None, items, config)
+    assert [item.nodeid for item in items] == [
+        'long.py::test_1',
+        'long.py::test_2',
+        'short.py::test_1',
+        'short.py::test_2',
+    ]
+
+
+def test_record_grouped_test(tmp_path, monkeypatch):
+    """The grouped tests are recorded without the xdist group suffix of the workers, the
+    predicted makespan recorded once"""
+    db = DurationDB(tmp_path / 'durations.sqlite')
+    item = make_item('long', 'test_1')
+    item.nodeid = 'long.py::test_1@long::module_sat'
+    item.get_closest_marker.return_value = pytest.mark.xdist_group('long::module_sat').mark
+    report = SimpleNamespace(when='call', duration=20.0, outcome='passed')
+    session = SimpleNamespace(items=[item], config=Box(getoption={'duration_schedule': True}.get))
+    monkeypatch.setenv('PYTEST_XDIST_WORKER_COUNT', '2')
+    with mock.patch.dict(
+        duration_db._recorder, db=db, sat_version='6.16', started=0, tests=[], fixtures=[]
+    ):
+        hook = duration_db.pytest_runtest_makereport(item, None)
+        next(hook)
+        with pytest.raises(StopIteration):
+            hook.send(mock.Mock(get_result=lambda: report))
+        duration_db.pytest_sessionfinish(session)
+        assert db.test_costs('6.16') == {'long.py::test_1': 20.0}
+        assert duration_db._jobs([item], db.test_costs('6.16')) == {
+            'long::module_sat': ([item], 20.0)
+        }
+        for worker in ('gw0', 'gw1'):
+            monkeypatch.setenv('PYTEST_XDIST_WORKER', worker)
+            duration_db.pytest_collection_finish(session)
+    with closing(sqlite3.connect(db.path)) as connection:
+        assert connection.execute('SELECT workers, predicted_makespan FROM runs').fetchall() == [
+            (2, 20.0)
+        ]
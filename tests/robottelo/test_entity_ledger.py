@@ -0,0 +1,78 @@
+from unittest import mock
+
+import pytest
+
+from robottelo.utils import entity_ledger
+from robottelo.utils.entity_ledger import EntityLedger, LedgerEntry, _Purger
+
+SAT = 'sat.example.com'
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    """A ledger of entities of a session, a purged org and the content of another one"""
+    ledger = entity_ledger.start_ledger(tmp_path / 'gw0.jsonl')
+    for kind, entity_json in (
+        ('Org', {'id': 1}),
+        ('Organization', {'id': 2}),
+        ('Product', {'id': 10, 'organization': {'id': 1}}),
+        ('ContentView', {'id': 20, 'organization_id': 2}),
+        ('ContentView', {'id': 21, 'organization_id': 3}),
+        ('Host', {'id': 30, 'organization_id': 1}),
+        ('Host', {'id': 31, 'organization_id': 1}),
+        ('User', {'id': 40}),
+        ('ForemanTask', {'id': 'not purged'}),
+    ):
+        entity_ledger.record_entity(SAT, kind, entity_json)
+    yield ledger
+    entity_ledger.stop_ledger()
+
+
+def test_ledger_plan(ledger, tmp_path):
+    """Entities are purged in dependency order, the content of the purged orgs with them"""
+    assert EntityLedger.load([tmp_path / 'gw0.jsonl']).entries == ledger.entries
+    assert [(kind, [e.id for e in entries]) for kind, entries in ledger.plan()] == [
+        ('Host', [30, 31]),
+        ('ContentView', [21]),
+        ('User', [40]),
+        ('Organization', [1, 2]),
+    ]
+
+
+def test_ledger_purge(ledger, mocker):
+    """Hosts are destroyed in bulk, the others concurrently, the failures retried once"""
+    mocker.patch.object(_Purger, 'satellite')
+    bulk = mocker.patch.object(_Purger, '_bulk_delete', return_value=[{'id': 'task'}])
+    wait = mocker.patch.object(_Purger, '_wait')
+    deleted = []
+
+    def delete(self, entries):
+        deleted.append(entries[0].id)
+        if entries[0].id == 40 and deleted.count(40) == 1:
+            raise RuntimeError('the user owns something')
+        return []
+
+    mocker.patch.object(_Purger, '_delete', delete)
+    progress = mock.Mock()
+    assert not ledger.purge(dry_run=True, progress=progress)
+    assert progress.call_args.args == (
+        'Would purge 6 entities, the others with their organization',
+    )
+    stats = ledger.purge(progress=progress)
+    assert bulk.call_args.args == (
+        [LedgerEntry(SAT, 'Host', 30, 1), LedgerEntry(SAT, 'Host', 31, 1)],
+    )
+    assert wait.call_args.args == (SAT, {'id': 'task'})
+    assert sorted(deleted) == [1, 2, 21, 40, 40]
+    assert stats['User', 'purged'] == 1
+    assert not stats['User', 'failed']
+    assert not ledger.entries
+
+
+def test_ledger_drop_hosts(ledger):
+    """The entities of the Satellites checked in are dropped, not purged"""
+    entity_ledger.record_entity('gone.example.com', 'User', {'id': 41})
+    entity_ledger.record_entity('gone.example.com', 'Organization', {'id': 4})
+    assert ledger.drop_hosts([SAT]) == {'gone.example.com': 2}
+    assert {e.hostname for e in ledger.entries} == {SAT}
+    assert not ledger.drop_hosts([SAT])
@@ -0,0 +1,87 @@
+from unittest import mock
+
+from box import Box
+
+from pytest_plugins.factory_collection import factory_demand
+from robottelo.utils.host_prefetch import calls_factory
+
+
+def _destructive(node):
+    return node.get_closest_marker('destructive') is not None
+
+
+def _not_sanity(node):
+    return 'sanity' not in node.config.option.markexpr
+
+
+def _not_sanity_n_minus(node):
+    return _not_sanity(node) and not node.config.option.n_minus
+
+
+@calls_factory('satellite_factory', when=_destructive)
+def module_target_sat(request, satellite_factory):
+    pass
+
+
+@calls_factory('satellite_factory', when=_not_sanity)
+def satellite_host(request, satellite_factory):
+    pass
+
+
+@calls_factory('capsule_factory', when=_not_sanity_n_minus)
+def module_capsule_host(request, capsule_factory):
+    pass
+
+
+@calls_factory('satellite_factory')
+@calls_factory('capsule_factory', when=_not_sanity_n_minus)
+def sat_and_capsule(satellite_factory, capsule_factory):
+    pass
+
+
+def large_capsule_host(capsule_factory):
+    """Calls the factory with its own arguments, not served by the prefetched hosts"""
+
+
+FIXTURES = {
+    'module_target_sat': ('module', module_target_sat),
+    'satellite_host': ('function', satellite_host),
+    'module_capsule_host': ('module', module_capsule_host),
+    'sat_and_capsule': ('session', sat_and_capsule),
+    'large_capsule_host': ('function', large_capsule_host),
+}
+
+
+def make_item(module, name, fixtures, markexpr='', n_minus=False, destructive=False):
+    """An item of a module using the fixtures"""
+    item = mock.Mock(path=module, cls=None, nodeid=f'{module}::{name}')
+    item.config.option = Box(markexpr=markexpr, n_minus=n_minus)
+    item.get_closest_marker.side_effect = lambda marker: (
+        marker if destructive and marker == 'destructive' else None
+    )
+    item._fixtureinfo.name2fixturedefs = {
+        fixture: [Box(scope=FIXTURES[fixture][0], func=FIXTURES[fixture][1])]
+        for fixture in fixtures
+    }
+    return item
+
+
+def test_factory_demand():
+    """One instance per fixture calling the factory, per node of its scope"""
+    items = [
+        make_item('test_a.py', 'test_1', ['sat_and_capsule', 'satellite_host']),
+        make_item('test_a.py', 'test_2', ['satellite_host', 'module_capsule_host']),
+        make_item('test_b.py', 'test_3', ['module_capsule_host', 'large_capsule_host']),
+        make_item('test_b.py', 'test_4', ['module_target_sat'], destructive=True),
+        make_item('test_c.py', 'test_5', ['module_target_sat', 'sat_and_capsule']),
+    ]
+    assert factory_demand(items) == {'satellite_factory': 4, 'capsule_factory': 3}
+
+
+def test_factory_demand_declared_conditions():
+    """The fixtures are counted only for the items they declare calling the factory for"""
+    fixtures = ['satellite_host', 'module_capsule_host', 'sat_and_capsule']
+    items = [make_item('test_a.py', 'test_1', fixtures, markexpr='sanity')]
+    assert factory_demand(items) == {'satellite_factory': 1, 'capsule_factory': 0}
+    items = [make_item('test_a.py', 'test_1', fixtures, n_minus=True)]
+    assert factory_demand(items) == {'satellite_factory': 2, 'capsule_factory': 0}
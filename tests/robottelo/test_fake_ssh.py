@@ -0,0 +1,62 @@
+import json
+from unittest import mock
+
+import pytest
+
+from robottelo import ssh
+from robottelo.cli.base import Base
+from robottelo.exceptions import CLIReturnCodeError
+from robottelo.utils.fake_ssh import MISSING_STATUS, FakeSSH
+
+
+@pytest.fixture
+def settings():
+    with (
+        mock.patch('robottelo.cli.base.settings') as settings,
+        mock.patch('robottelo.config.settings', settings),
+    ):
+        settings.robottelo.locale = 'en_US'
+        settings.performance.time_hammer = False
+        settings.server.hostname = 'satellite.example.com'
+        settings.server.admin_username = 'admin'
+        settings.server.admin_password = 'changeme'
+        yield settings
+
+
+def test_fake_ssh_replay(settings, tmp_path):
+    """The first recorded output matching the command is replayed to the CLI"""
+    path = tmp_path / 'outputs.jsonl'
+    path.write_text(
+        json.dumps({'command': 'architecture list', 'stdout': 'Id,Name\n1,x86_64\n'}) + '\n'
+    )
+    fake = FakeSSH.from_file(path)
+    fake.add('architecture delete', stderr='Error: not found', status=65)
+    fake.add('architecture', stdout='not replayed')
+
+    class Architecture(Base):
+        command_base = 'architecture'
+
+    with fake:
+        assert Architecture.list() == [{'id': '1', 'name': 'x86_64'}]
+        with pytest.raises(CLIReturnCodeError):
+            Architecture.delete({'id': 1})
+        assert ssh.command('ls', hostname='capsule.example.com').status == MISSING_STATUS
+    assert 'factory' not in ssh._client_factory
+    assert fake.clients == 3
+    assert fake.commands[0] == (
+        'satellite.example.com',
+        'LANG=en_US  hammer -v -u admin -p changeme --output=csv '
+        'architecture list --per-page="10000" ',
+    )
+    assert fake.commands[2] == ('capsule.example.com', 'ls')
+
+
+def test_fake_ssh_failures():
+    """The commands fail at the given rate, the same ones with the same seed"""
+    results = []
+    for _ in range(2):
+        fake = FakeSSH([{'command': '.*', 'stdout': 'ok'}], failure_rate=0.5, seed=1)
+        results.append([fake('sat').execute('true').status for _ in range(100)])
+    assert results[0] == results[1]
+    assert 30 < results[0].count(70) < 70
+    assert set(results[0]) == {0, 70}
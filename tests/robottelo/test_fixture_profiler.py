@@ -0,0 +1,70 @@
+from broker.hosts import Host
+import requests
+
+from robottelo.utils.fixture_profiler import (
+    FixtureProfiler,
+    folded_lines,
+    merge_profiles,
+    report_lines,
+)
+
+
+def test_fixture_profiler_attribution(mocker):
+    """Nested fixtures get their own time and calls, the outer fixture the rest"""
+    mocker.patch.object(Host, 'execute')
+    mocker.patch.object(requests.Session, 'request')
+    monotonic = mocker.patch('robottelo.utils.fixture_profiler.time.monotonic')
+    profiler = FixtureProfiler()
+    profiler.instrument()
+    monotonic.return_value = 0
+    profiler.start('module_sat', 'module', 'setup')
+    Host.execute(None, 'LANG=en_US.UTF-8 hammer -v --output=json host list')
+    monotonic.return_value = 1
+    profiler.start('module_org', 'module', 'setup')
+    requests.Session.request(None, 'POST', 'https://sat.example.com/api/v2/organizations')
+    requests.Session.request(None, 'GET', 'https://sat.example.com/pub/katello-ca.rpm')
+    monotonic.return_value = 4
+    profiler.stop('module_org')
+    Host.execute(None, 'systemctl restart foreman')
+    monotonic.return_value = 10
+    profiler.stop('module_sat')
+    profiler.uninstrument()
+    Host.execute(None, 'hammer ping')
+    profile = profiler.profile()
+    assert profile['fixtures']['module_sat'] == {
+        'scope': 'module',
+        'setup': {'calls': 1, 'total': 10, 'self': 7, 'ssh': 2, 'hammer': 1, 'api': 0},
+    }
+    assert profile['fixtures']['module_org']['setup'] == {
+        'calls': 1,
+        'total': 3,
+        'self': 3,
+        'ssh': 0,
+        'hammer': 0,
+        'api': 1,
+    }
+    assert folded_lines(profile) == ['setup;module_sat 7000', 'setup;module_sat;module_org 3000']
+
+
+def test_merge_profiles():
+    """Workers profiles add up, the costliest fixtures are reported first"""
+    worker = {
+        'fixtures': {
+            'module_org': {
+                'scope': 'module',
+                'setup': {'calls': 1, 'total': 2, 'self': 2, 'ssh': 0, 'hammer': 0, 'api': 1},
+            },
+            'module_sat': {
+                'scope': 'module',
+                'teardown': {'calls': 1, 'total': 9, 'self': 9, 'ssh': 3, 'hammer': 0, 'api': 0},
+            },
+        },
+        'folded': {'setup;module_org': 2, 'teardown;module_sat': 9},
+    }
+    profile = merge_profiles([worker, worker])
+    assert profile['fixtures']['module_org']['setup']['api'] == 2
+    assert profile['fixtures']['module_sat']['teardown']['total'] == 18
+    assert profile['folded'] == {'setup;module_org': 4, 'teardown;module_sat': 18}
+    report = report_lines(profile)
+    assert report[1].startswith('module_sat')
+    assert report[2].startswith('module_org')
@@ -0,0 +1,90 @@
+from broker.helpers import Result
+import pytest
+
+from robottelo import ssh
+from scripts.hammer_command_tree import (
+    HELP_MARKER,
+    HammerHelpCrawler,
+    changed_commands,
+    generate_command_tree,
+)
+
+HELPS = {
+    'hammer': """Usage:
+    hammer [OPTIONS] SUBCOMMAND [ARG] ...
+
+Subcommands:
+ host                          Manipulate hosts
+ organization                  Manipulate organizations
+
+Options:
+ --version                     Show version
+""",
+    'hammer host': """Subcommands:
+ info                          Show a host
+""",
+    'hammer organization': """Subcommands:
+ info                          Show an organization
+ list                          List all organizations
+""",
+    'hammer host info': """Options:
+ --id VALUE                    Host numeric identifier
+""",
+    'hammer organization info': """Options:
+ --id VALUE                    Organization numeric identifier
+""",
+    'hammer organization list': """Options:
+ --search VALUE                Filter results
+""",
+}
+
+
+class FakeHammerHost:
+    """A Satellite host running the hammer help scripts of the crawler"""
+
+    def __init__(self, hosts, hostname=None, **kwargs):
+        self.hostname = hostname
+        self.closed = False
+        hosts.append(self)
+
+    def execute(self, script):
+        output = ''
+        for line in script.splitlines():
+            command = line.split("'")[1][len(HELP_MARKER) + 1 :]
+            output += f'{HELP_MARKER} {command}\n{HELPS[command]}'
+        return Result(status=0, stdout=output, stderr='')
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def hosts():
+    hosts = []
+    with ssh.client_factory(lambda **kwargs: FakeHammerHost(hosts, **kwargs)):
+        yield hosts
+
+
+def test_generate_command_tree(hosts):
+    """The tree is crawled level by level over the same connections, closed at the end"""
+    with HammerHelpCrawler('sat.example.com', workers=2, batch_size=1) as crawler:
+        tree, hashes = generate_command_tree(crawler)
+    assert [command['name'] for command in tree['subcommands']] == ['host', 'organization']
+    organization = tree['subcommands'][1]
+    assert [command['name'] for command in organization['subcommands']] == ['info', 'list']
+    assert organization['subcommands'][1]['options'][0]['name'] == 'search'
+    assert sorted(hashes) == sorted(HELPS)
+    assert crawler.remote_calls == len(HELPS)
+    assert 0 < len(hosts) <= 2
+    assert all(host.closed for host in hosts)
+
+
+def test_changed_commands():
+    """The commands added, removed and whose help changed are reported"""
+    old = {'hammer': 'a', 'hammer host': 'b', 'hammer user': 'c'}
+    new = {'hammer': 'a', 'hammer host': 'x', 'hammer organization': 'd'}
+    assert changed_commands(old, new) == {
+        'added': ['hammer organization'],
+        'removed': ['hammer user'],
+        'changed': ['hammer host'],
+    }
@@ -0,0 +1,82 @@
+from unittest import mock
+
+from box import Box
+import pytest
+
+from robottelo.utils import host_pool
+from robottelo.utils.host_pool import ContentHostPool
+
+
+class FakeHost:
+    """Content host whose reset checks report the configured failures"""
+
+    instances = 0
+
+    def __init__(self):
+        FakeHost.instances += 1
+        self.hostname = f'host{FakeHost.instances}.example.com'
+        self.failures = []
+        self.teardowns = 0
+
+    def setup(self):
+        pass
+
+    def teardown(self):
+        self.teardowns += 1
+
+    def remove_katello_ca(self):
+        pass
+
+    def clean_cached_properties(self):
+        pass
+
+    def execute(self, cmd):
+        stdout = '\n'.join(self.failures) if 'subscription-manager identity' in cmd else ''
+        return Box(status=0, stdout=stdout, stderr='')
+
+
+@pytest.fixture
+def broker(mocker):
+    broker = mocker.patch.object(host_pool, 'Broker')
+    broker.return_value.checkout.side_effect = FakeHost
+    return broker
+
+
+def test_pool_reuses_reset_hosts(broker):
+    """Hosts are leased again per deployment arguments after being reset"""
+    pool = ContentHostPool()
+    rhel8, rhel9 = {'deploy_rhel_version': '8'}, {'deploy_rhel_version': '9'}
+    with pool.lease(rhel8, FakeHost) as first:
+        pass
+    with pool.lease(rhel8, FakeHost) as second:
+        assert second is first
+    with pool.lease(rhel9, FakeHost) as other:
+        assert other is not first
+    assert first.teardowns == 2
+    assert pool.stats == {'checked_out': 2, 'reused': 1}
+    pool.close()
+    assert broker.call_args.kwargs['hosts'] == [first, other]
+
+
+def test_pool_quarantines_hosts_failing_reset(broker):
+    """A host still registered after the reset is checked in and not leased again"""
+    pool = ContentHostPool()
+    with pool.lease({}, FakeHost) as host:
+        host.failures = ['registered']
+    with pool.lease({}, FakeHost) as new_host:
+        assert new_host is not host
+    assert pool.quarantined == [host.hostname]
+    assert mock.call(hosts=[host]) in broker.call_args_list
+
+
+def test_pool_drops_kept_hosts(broker):
+    """A host kept by its test is neither reset nor checked in, nor leased again"""
+    pool = ContentHostPool()
+    with pool.lease({}, FakeHost) as host:
+        host._skip_context_checkin = True
+    with pool.lease({}, FakeHost) as new_host:
+        assert new_host is not host
+    pool.close()
+    assert host.teardowns == 0
+    assert pool.stats['kept'] == 1
+    assert all(host not in call.kwargs.get('hosts', []) for call in broker.call_args_list)
@@ -0,0 +1,51 @@
+import itertools
+import threading
+
+import pytest
+
+from robottelo.utils import host_prefetch
+from robottelo.utils.host_prefetch import HostPrefetcher
+
+
+@pytest.fixture
+def broker(mocker):
+    return mocker.patch.object(host_prefetch, 'Broker')
+
+
+def test_prefetcher_bounded_by_quota(broker):
+    """No more hosts than the quota are held, nor than the expected demand"""
+    release = threading.Event()
+    counter = itertools.count()
+    checked_out = []
+
+    def checkout():
+        release.wait()
+        host = f'host{next(counter)}'
+        checked_out.append(host)
+        return host
+
+    prefetcher = HostPrefetcher('satellite_factory', checkout, demand=3, quota=2)
+    assert prefetcher._outstanding == 2
+    release.set()
+    hosts = [prefetcher.get() for _ in range(4)]
+    assert sorted(hosts[:3]) == ['host0', 'host1', 'host2']
+    assert hosts[3] is None
+    prefetcher.close()
+    assert len(checked_out) == 3
+    broker.assert_not_called()
+    assert prefetcher.stats == {'hits': 3, 'missed': 1}
+
+
+def test_prefetcher_checks_in_unused_hosts(broker):
+    """Hosts left unused at the end are checked in, failed checkouts are skipped"""
+    results = iter(['host0', RuntimeError('no capacity'), 'host2'])
+
+    def checkout():
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    prefetcher = HostPrefetcher('capsule_factory', checkout, demand=3, quota=3)
+    prefetcher.close()
+    assert sorted(broker.call_args.kwargs['hosts']) == ['host0', 'host2']
@@ -0,0 +1,145 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+from urllib.parse import parse_qs, urlparse
+
+from box import Box
+import pytest
+
+from robottelo.utils.issue_handlers import jira
+
+
+class FakeJiraHandler(BaseHTTPRequestHandler):
+    """Minimal Jira REST API serving the search and comment endpoints"""
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, code, body):
+        payload = json.dumps(body).encode()
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        self.server.searches.append(self.path)
+        jql = parse_qs(urlparse(self.path).query)['jql'][0]
+        keys = {term.split(' = ')[1] for term in jql.split(' OR ')}
+        issues = [
+            {
+                'key': key,
+                'fields': {
+                    'summary': key,
+                    'status': {'name': status},
+                    'resolution': None,
+                    'fixVersions': [],
+                },
+            }
+            for key, status in self.server.issues.items()
+            if key in keys
+        ]
+        # as Jira, only the first page of the search results is returned
+        self._reply(200, {'issues': issues[: jira.JIRA_SEARCH_MAX_RESULTS], 'total': len(issues)})
+
+    def do_POST(self):
+        issue_id = self.path.split('/')[-2]
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        with self.server.lock:
+            self.server.attempts[issue_id] = self.server.attempts.get(issue_id, 0) + 1
+            attempt = self.server.attempts[issue_id]
+        if attempt <= self.server.failures.get(issue_id, 0):
+            self._reply(503, {})
+            return
+        self.server.comments[issue_id] = body['body']
+        self._reply(201, {'id': attempt})
+
+
+@pytest.fixture
+def fake_jira(mocker):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeJiraHandler)
+    server.issues = {'SAT-1': 'Review', 'SAT-2': 'Release Pending', 'SAT-3': 'New'}
+    server.failures = {}
+    server.attempts = {}
+    server.comments = {}
+    server.searches = []
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    mocker.patch.object(
+        jira,
+        'settings',
+        Box(
+            jira={
+                'url': f'http://127.0.0.1:{server.server_port}',
+                'api_key': 'fake-key',
+                'comment_type': 'group',
+                'comment_visibility': 'Red Hat Employee',
+                'enable_comment': True,
+                'issue_status': ['Review', 'Release Pending'],
+                'comment_workers': 4,
+                'comment_rate_limit': 0,
+                'comment_retries': 3,
+            }
+        ),
+    )
+    mocker.patch.object(jira, 'wait_exponential', return_value=jira.wait_fixed(0))
+    mocker.patch.object(pytest, 'jira_comments', True, create=True)
+    mocker.patch.object(pytest, 'issue_data', {}, create=True)
+    jira.CACHED_RESPONSES.clear()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_add_comments_on_jira(fake_jira):
+    """Comments are posted only on issues in the configured states, resolving
+    all the issues with a single search"""
+    comments = {issue: f'result for {issue}' for issue in fake_jira.issues}
+    results = jira.add_comments_on_jira(comments)
+    assert results == {'SAT-1': 'posted', 'SAT-2': 'posted', 'SAT-3': 'skipped'}
+    assert fake_jira.comments == {'SAT-1': 'result for SAT-1', 'SAT-2': 'result for SAT-2'}
+    assert len(fake_jira.searches) == 1
+
+
+def test_add_comments_on_jira_many_issues(fake_jira):
+    """The issues are searched by pages, none skipped past the first page"""
+    fake_jira.issues = {f'SAT-{number}': 'Review' for number in range(120)}
+    results = jira.add_comments_on_jira({issue: 'result' for issue in fake_jira.issues})
+    assert set(results.values()) == {'posted'}
+    assert len(fake_jira.comments) == 120
+    assert len(fake_jira.searches) == 3
+
+
+def test_add_comments_on_jira_dry_run(fake_jira):
+    """No comment is posted in dry run mode"""
+    results = jira.add_comments_on_jira({'SAT-1': 'result'}, dry_run=True)
+    assert results == {'SAT-1': 'dry-run'}
+    assert not fake_jira.comments
+
+
+def test_add_comments_on_jira_retries(fake_jira):
+    """Server errors are retried until the retries are exhausted"""
+    fake_jira.failures = {'SAT-1': 2, 'SAT-2': 10}
+    results = jira.add_comments_on_jira({'SAT-1': 'result', 'SAT-2': 'result'})
+    assert results == {'SAT-1': 'posted', 'SAT-2': 'failed'}
+    assert fake_jira.attempts == {'SAT-1': 3, 'SAT-2': 4}
+
+
+def test_add_comment_on_jira(fake_jira):
+    """A single comment is posted as the many ones, retried on server errors"""
+    fake_jira.failures = {'SAT-1': 1}
+    assert jira.add_comment_on_jira('SAT-1', 'result') == {'id': 2}
+    assert jira.add_comment_on_jira('SAT-3', 'result') is None
+    assert fake_jira.comments == {'SAT-1': 'result'}
+
+
+def test_rate_limiter(mocker):
+    """Calls are spaced out by the limiter interval"""
+    sleep = mocker.patch.object(jira.time, 'sleep')
+    limiter = jira.RateLimiter(2)
+    for _ in range(3):
+        limiter.wait()
+    assert sleep.call_count == 2
+    assert all(0 < call.args[0] <= 1 for call in sleep.call_args_list)
@@ -0,0 +1,90 @@
+import json
+import logging
+import threading
+
+import pytest
+
+from robottelo.logging import JsonLinesFormatter, LogQueue
+
+
+@pytest.fixture
+def file_logger(tmp_path):
+    """A logger writing to a log file and a JSON lines file in tmp_path"""
+    test_logger = logging.getLogger(f'robottelo.test.{tmp_path.name}')
+    test_logger.setLevel(logging.DEBUG)
+    test_logger.propagate = False
+    handler = logging.FileHandler(tmp_path / 'test.log')
+    handler.setLevel(logging.INFO)
+    json_handler = logging.FileHandler(tmp_path / 'test.jsonl')
+    json_handler.setFormatter(JsonLinesFormatter('gw0'))
+    test_logger.addHandler(handler)
+    test_logger.addHandler(json_handler)
+    yield test_logger
+    for handler in test_logger.handlers[:]:
+        test_logger.removeHandler(handler)
+        handler.close()
+
+
+def test_log_queue_writes_in_order(file_logger, tmp_path):
+    """The queued records are written in order, at the file handlers levels, once stopped"""
+    log_queue = LogQueue(size=10)
+    log_queue.add(file_logger)
+    assert not any(isinstance(h, logging.FileHandler) for h in file_logger.handlers)
+    for i in range(100):
+        file_logger.info('record %s', i)
+    file_logger.debug('not in the log file')
+    with log_queue.unqueued():
+        assert len(file_logger.handlers) == 2
+    file_logger.info('record 100')
+    log_queue.stop()
+    assert tmp_path.joinpath('test.log').read_text().splitlines() == [
+        f'record {i}' for i in range(101)
+    ]
+    lines = [json.loads(line) for line in tmp_path.joinpath('test.jsonl').read_text().splitlines()]
+    assert len(lines) == 102
+    assert lines[0]['message'] == 'record 0'
+    assert lines[0]['level'] == 'INFO'
+    assert lines[0]['worker'] == 'gw0'
+
+
+def test_log_queue_exceptions(file_logger, tmp_path):
+    """The exceptions of the queued records are formatted by the target handlers"""
+    log_queue = LogQueue(size=10)
+    log_queue.add(file_logger)
+    try:
+        raise ValueError('queued error')
+    except ValueError:
+        file_logger.exception('failed %s', 'step')
+    log_queue.stop()
+    [line] = tmp_path.joinpath('test.jsonl').read_text().splitlines()
+    entry = json.loads(line)
+    assert entry['message'] == 'failed step'
+    assert entry['exception'].endswith('ValueError: queued error')
+    assert 'ValueError: queued error' in tmp_path.joinpath('test.log').read_text()
+
+
+def test_log_queue_drops_when_full(file_logger, tmp_path, mocker):
+    """The records are dropped when the queue is full, and the number dropped logged"""
+    handling, released = threading.Event(), threading.Event()
+    log_queue = LogQueue(size=2, full='drop')
+    handle = log_queue.writer.handle
+
+    def blocked_handle(item):
+        handling.set()
+        released.wait()
+        handle(item)
+
+    mocker.patch.object(log_queue.writer, 'handle', blocked_handle)
+    log_queue.add(file_logger)
+    file_logger.info('record 0')
+    handling.wait()
+    for i in range(1, 10):
+        file_logger.info('record %s', i)
+    released.set()
+    log_queue.stop()
+    log_queue.add(file_logger)
+    file_logger.info('record 10')
+    log_queue.stop()
+    lines = tmp_path.joinpath('test.log').read_text().splitlines()
+    assert lines[-2:] == ['7 log records dropped, the log queue was full', 'record 10']
+    assert len(lines) == 5
@@ -0,0 +1,72 @@
+import json
+import subprocess
+
+from box import Box
+import pytest
+
+from robottelo.utils import remote_log
+from robottelo.utils.remote_log import RemoteLogCursor
+from robottelo.utils.virtwho import MappingSectionParser
+
+
+@pytest.fixture
+def local_ssh(mocker):
+    """Run the remote commands on the local host, recording them"""
+    commands = []
+
+    def command(cmd, **kwargs):
+        commands.append(cmd)
+        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        return Box(status=result.returncode, stdout=result.stdout)
+
+    mocker.patch.object(remote_log.ssh, 'command', side_effect=command)
+    return commands
+
+
+def test_cursor_reads_increments(local_ssh, tmp_path):
+    """Only the content appended since the previous read is returned"""
+    log = tmp_path.joinpath('rhsm.log')
+    cursor = RemoteLogCursor(str(log), hostname='localhost')
+    assert cursor.read() == ''
+    log.write_text('first\n')
+    assert cursor.read() == 'first\n'
+    assert cursor.read() == ''
+    with log.open('a') as log_file:
+        log_file.write('second\nthi')
+    assert cursor.read() == 'second\nthi'
+    assert cursor.offset == log.stat().st_size
+    assert len(local_ssh) == 4
+
+
+def test_cursor_handles_rotation(local_ssh, tmp_path):
+    """A removed, rotated or truncated file is read again from the beginning"""
+    log = tmp_path.joinpath('rhsm.log')
+    cursor = RemoteLogCursor(str(log), hostname='localhost')
+    log.write_text('old content\n')
+    assert cursor.read() == 'old content\n'
+    log.rename(tmp_path.joinpath('rhsm.log.1'))
+    log.write_text('new content, longer than the old one\n')
+    assert cursor.read() == 'new content, longer than the old one\n'
+    log.write_text('short\n')
+    assert cursor.read() == 'short\n'
+    log.unlink()
+    assert cursor.read() == ''
+    assert cursor.rotations == 3
+
+
+def test_mapping_section_parser_increments():
+    """Sections split across increments, even in the middle of a line, are parsed"""
+    first = {'hypervisors': [{'hypervisorId': {'hypervisorId': 'host-1'}}]}
+    second = {'hypervisors': [{'hypervisorId': {'hypervisorId': 'host-2'}}]}
+    log = (
+        '2024-01-01 10:00:00,000 [INFO] Host-to-guest mapping being sent to \'org\': {\n'
+        f'{json.dumps(first, indent=4)[1:]}\n'
+        '2024-01-01 10:01:00,000 [INFO] not a mapping\n'
+        '2024-01-01 10:02:00,000 [INFO] Host-to-guest mapping being sent to \'org\': {\n'
+        f'{json.dumps(second, indent=4)[1:]}'
+    )
+    parser = MappingSectionParser()
+    for start in range(0, len(log), 7):
+        parser.feed(log[start : start + 7])
+    assert parser.sections == [first]
+    assert parser.mapping == [first, second]
@@ -0,0 +1,62 @@
+from box import Box
+import pytest
+
+from robottelo.utils import satellite_load
+from robottelo.utils.satellite_load import (
+    assign_workers,
+    capacity_score,
+    load_aware_assignment,
+)
+
+IDLE = Box(cpus=8, load_average=0.0, running_tasks=0, dynflow_queue=0)
+BUSY = Box(cpus=8, load_average=16.0, running_tasks=20, dynflow_queue=40)
+
+
+def test_capacity_score():
+    """An idle Satellite has full capacity, a loaded or unreachable one less"""
+    assert capacity_score(IDLE) == 1
+    assert 0 < capacity_score(BUSY) < capacity_score(IDLE)
+    assert capacity_score(None) == 0
+    assert capacity_score(BUSY, {'RUNNING_TASKS': 0, 'DYNFLOW_QUEUE': 0}) == pytest.approx(1 / 3)
+
+
+def test_assign_workers_proportionally():
+    """Workers are distributed proportionally to the scores, best Satellites first"""
+    assignment = assign_workers({'sat1': 0.25, 'sat2': 0.75}, 4)
+    assert assignment == ['sat2', 'sat1', 'sat2', 'sat2']
+
+
+def test_assign_workers_skips_unreachable():
+    assignment = assign_workers({'sat1': 0.0, 'sat2': 0.5, 'sat3': 0.5}, 3)
+    assert 'sat1' not in assignment
+    assert len(assignment) == 3
+
+
+def test_assign_workers_even_fallback():
+    """All Satellites are used evenly when no load could be sampled"""
+    assert sorted(assign_workers({'sat1': 0.0, 'sat2': 0.0}, 4)) == ['sat1'] * 2 + ['sat2'] * 2
+
+
+def test_load_aware_assignment_is_shared(mocker, tmp_path):
+    """The load is sampled once per run and the decision is reused by every worker"""
+    mocker.patch.object(satellite_load, 'robottelo_tmp_dir', tmp_path)
+    sampler = mocker.Mock(side_effect=lambda hostname: IDLE if hostname == 'sat1' else BUSY)
+    first = load_aware_assignment('run', ['sat1', 'sat2'], 2, sampler=sampler)
+    second = load_aware_assignment('run', ['sat1', 'sat2'], 2, sampler=sampler)
+    assert sampler.call_count == 2
+    assert first.assignment == second.assignment
+    assert first.assignment[0] == 'sat1'
+    assert tmp_path.joinpath('xdist_load_aware_run.json').exists()
+
+
+def test_load_aware_assignment_unreachable(mocker, tmp_path):
+    mocker.patch.object(satellite_load, 'robottelo_tmp_dir', tmp_path)
+
+    def sampler(hostname):
+        if hostname == 'sat2':
+            raise ConnectionError
+        return BUSY
+
+    decision = load_aware_assignment('run', ['sat1', 'sat2'], 3, sampler=sampler)
+    assert decision.assignment == ['sat1'] * 3
+    assert decision.loads.sat2 is None
@@ -0,0 +1,86 @@
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import subprocess
+import threading
+
+from box import Box
+import pytest
+
+from robottelo.host_helpers.satellite_mixins import ContentInfo
+
+
+class LocalSatellite(ContentInfo):
+    """Satellite running its commands on the local host"""
+
+    hostname = 'localhost'
+
+    def __init__(self):
+        self.commands = []
+
+    def execute(self, cmd):
+        self.commands.append(cmd)
+        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        return Box(status=result.returncode, stdout=result.stdout, stderr=result.stderr)
+
+
+class FilesHandler(BaseHTTPRequestHandler):
+    """Serves the files of the server with ETags, recording the full downloads"""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        content = self.server.files.get(self.path)
+        if content is None:
+            self.send_error(404)
+            return
+        etag = f'"{hashlib.sha1(content).hexdigest()}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.server.downloads.append(self.path)
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+@pytest.fixture
+def files_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FilesHandler)
+    server.files = {f'/file{i}': f'content {i}'.encode() * 1000 for i in range(5)}
+    server.downloads = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server.url = f'http://127.0.0.1:{server.server_port}'
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_checksums_by_urls(files_server, tmp_path):
+    """All the digests of all the files are computed by one remote command, unchanged
+    files are not downloaded again"""
+    satellite = LocalSatellite()
+    urls = [f'{files_server.url}{path}' for path in files_server.files]
+    checksums = satellite.checksums_by_urls(urls)
+    assert len(satellite.commands) == 1
+    content = files_server.files['/file0']
+    assert checksums[urls[0]] == {
+        'md5sum': hashlib.md5(content).hexdigest(),
+        'sha256sum': hashlib.sha256(content).hexdigest(),
+        'sha512sum': hashlib.sha512(content).hexdigest(),
+    }
+    files_server.files['/file1'] = b'changed'
+    assert satellite.checksum_by_url(urls[1], 'sha256sum') == hashlib.sha256(b'changed').hexdigest()
+    assert satellite.checksum_by_url(urls[0]) == hashlib.md5(content).hexdigest()
+    assert sorted(files_server.downloads) == sorted([*files_server.files, '/file1'])
+    assert not list(tmp_path.iterdir())
+    satellite.checksums_by_urls(urls[:1], download_dir=str(tmp_path))
+    assert tmp_path.joinpath('file0').read_bytes() == content
+
+
+def test_checksum_by_url_unreachable(files_server):
+    with pytest.raises(AssertionError, match='missing'):
+        LocalSatellite().checksum_by_url(f'{files_server.url}/missing')
@@ -0,0 +1,78 @@
+import threading
+import time
+
+import pytest
+
+from robottelo.host_helpers.setup_planner import SetupPlan
+
+
+@pytest.fixture
+def plan():
+    """A plan of an org with a synced repo and a content view, the calls recorded"""
+    plan = SetupPlan('test')
+    plan.calls = []
+    plan.both_started = None
+
+    def step(name, result, concurrent=False):
+        def func(**kwargs):
+            plan.calls.append((name, kwargs))
+            if concurrent and plan.both_started:
+                plan.both_started.wait()
+            return result
+
+        return func
+
+    plan.add('org', step('org', 1))
+    plan.add('repo', step('repo', 2, concurrent=True), ['org'])
+    plan.add('cv', step('cv', 3, concurrent=True), ['org'])
+    plan.add('sync', step('sync', None), after=['repo'])
+    plan.add('publish', step('publish', 4), ['cv', 'repo'], after=['sync'])
+    return plan
+
+
+def test_setup_plan_run(plan):
+    """The independent steps run concurrently, given the results they require"""
+    plan.both_started = threading.Barrier(2, timeout=5)
+    setup = plan.run()
+    assert setup == {'org': 1, 'repo': 2, 'cv': 3, 'sync': None, 'publish': 4}
+    assert set(setup.timings) == set(setup)
+    assert plan.calls[0] == ('org', {})
+    assert {name for name, _ in plan.calls[1:3]} == {'repo', 'cv'}
+    assert plan.calls[3:] == [('sync', {}), ('publish', {'cv': 3, 'repo': 2})]
+
+
+def test_setup_plan_run_as_soon_as_done():
+    """A step runs once its requirements are done, the slow steps of other branches running"""
+    plan = SetupPlan('test')
+    synced = threading.Event()
+    plan.add('sync', lambda: synced.wait(timeout=5))
+    plan.add('cv', lambda: 3)
+    plan.add('cv_repo', lambda cv: synced.set(), ['cv'])
+    setup = plan.run()
+    assert setup['sync'] is True
+
+
+def test_setup_plan_share(plan):
+    """A run until some steps is shared by the runs of the steps left"""
+    prefix = plan.run(until=['sync'])
+    assert prefix == {'org': 1, 'repo': 2, 'sync': None}
+    plan.calls.clear()
+    plan.add('again', lambda: plan.calls.append(('again', {})))
+    setup = plan.run(done=prefix)
+    assert sorted(name for name, _ in plan.calls) == ['again', 'cv', 'publish']
+    assert setup['publish'] == 4
+    assert set(setup.timings) == {'cv', 'publish', 'again'}
+
+
+def test_setup_plan_failure():
+    """A failing step stops the run, its exception raised"""
+    plan = SetupPlan('test')
+    ran = []
+    plan.add('org', lambda: time.sleep(0.1))
+    plan.add('repo', lambda: 1 / 0)
+    plan.add('cv', lambda: ran.append('cv'), after=['org', 'repo'])
+    with pytest.raises(ZeroDivisionError):
+        plan.run()
+    assert not ran
+    with pytest.raises(ValueError, match='unknown steps'):
+        plan.add('publish', lambda cv: cv, ['content view'])
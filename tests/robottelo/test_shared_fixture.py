@@ -0,0 +1,116 @@
+from unittest import mock
+
+from box import Box
+from nailgun.entities import Entity
+import pytest
+
+from robottelo.hosts import Satellite
+from robottelo.utils.decorators.func_shared import shared_fixture
+from robottelo.utils.decorators.func_shared.file_storage import FileStorageHandler
+from robottelo.utils.decorators.func_shared.shared import (
+    _set_configured,
+    enable_shared_function,
+)
+from robottelo.utils.decorators.func_shared.shared_fixture import shared
+
+
+class Product(Entity):
+    def __init__(self, id=None):
+        self.id = id
+
+
+@pytest.fixture
+def sharing(tmp_path):
+    """Shared functions enabled, stored in a temporary directory"""
+    _set_configured(True)
+    enabled = shared.ENABLED
+    enable_shared_function(True)
+    with mock.patch(
+        'robottelo.utils.decorators.func_shared.shared_fixture._get_default_storage_handler',
+        return_value=FileStorageHandler(root_dir=str(tmp_path)),
+    ):
+        yield
+    enable_shared_function(enabled)
+
+
+@pytest.fixture
+def satellite():
+    satellite = mock.Mock(spec=Satellite)
+    satellite.hostname = 'sat.example.com'
+    satellite.api = mock.Mock()
+    satellite.api.Product.side_effect = lambda id: mock.Mock(read=lambda: Product(id))
+    return satellite
+
+
+def test_shared_fixture(sharing, satellite):
+    """The value is built once per parameter, the entities read again by the other
+    consumers, the teardown called by the last one
+    """
+    builds, teardowns = [], []
+
+    @shared_fixture(teardown=teardowns.append)
+    def content(request, module_target_sat):
+        builds.append(request.param)
+        return Box(product=Product(request.param), repos=[Product(2)], rhel_ver=8)
+
+    first = content(Box(param=1), satellite)
+    second = content(Box(param=1), satellite)
+    other = content(Box(param=3), satellite)
+    values = [next(first), next(second), next(other)]
+    assert builds == [1, 3]
+    assert values[1].product.id == 1
+    assert values[1].repos[0].id == 2
+    assert values[1].rhel_ver == 8
+    assert values[0].product is not values[1].product
+    first.close()
+    assert not teardowns
+    second.close()
+    assert teardowns == [values[1]]
+    other.close()
+    assert len(teardowns) == 2
+    # a consumer after the teardown builds the value again
+    again = content(Box(param=1), satellite)
+    next(again)
+    assert builds == [1, 3, 1]
+
+
+def test_shared_fixture_disabled(satellite):
+    """Without the shared functions enabled, the fixture is built by each consumer"""
+    builds = []
+
+    @shared_fixture
+    def content(module_target_sat):
+        builds.append(module_target_sat)
+        return 'content'
+
+    _set_configured(True)
+    with mock.patch.object(shared, 'ENABLED', False):
+        first, second = content(satellite), content(satellite)
+        assert (next(first), next(second)) == ('content', 'content')
+    assert len(builds) == 2
+
+
+def test_shared_fixture_key(sharing, satellite):
+    """The value is built once per Satellite, the values and keys not shareable refused"""
+    builds = []
+
+    @shared_fixture
+    def content(request, module_target_sat):
+        builds.append(module_target_sat.hostname)
+        return request.param
+
+    other = mock.Mock(spec=Satellite, hostname='other.example.com')
+    values = [next(content(Box(param=1), sat)) for sat in (satellite, satellite, other)]
+    assert values == [1, 1, 1]
+    assert builds == ['sat.example.com', 'other.example.com']
+    with pytest.raises(TypeError, match='Product entity of a worker'):
+        next(content(Box(param=Product(1)), satellite))
+    with pytest.raises(TypeError, match='A Mock cannot be shared'):
+        next(content(Box(param=mock.Mock()), satellite))
+
+    @shared_fixture
+    def host(module_target_sat):
+        return Box(host=mock.Mock(hostname='host.example.com'))
+
+    with pytest.raises(TypeError, match='A Mock cannot be shared'):
+        next(host(satellite))
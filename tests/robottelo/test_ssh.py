@@ -92,7 +92,6 @@ class TestSSH:
 
     @mock.patch('robottelo.config.settings')
     def test_command(self, settings):
-        ssh.get_client = MockSSHClient
         settings.server.hostname = 'example.com'
         settings.server.ssh_username = 'nobody'
         settings.server.ssh_key = None
@@ -100,5 +99,6 @@ class TestSSH:
         settings.server.ssh_client.command_timeout = 300000
         settings.server.ssh_client.connection_timeout = 10000
 
-        ret = ssh.command('ls -la')
+        with ssh.client_factory(MockSSHClient):
+            ret = ssh.command('ls -la')
         assert ret[1].cmd == 'ls -la'
@@ -0,0 +1,145 @@
+import json
+import subprocess
+
+from dynaconf import LazySettings, Validator
+from dynaconf.validator import ValidationError
+import pytest
+
+from robottelo.utils import vault
+from robottelo.utils.vault import Vault, VaultSettings, validate_settings
+
+ENV = {
+    'VAULT_ENABLED_FOR_DYNACONF': 'true',
+    'VAULT_URL_FOR_DYNACONF': 'https://vault.example.com',
+    'VAULT_KV_VERSION_FOR_DYNACONF': '2',
+    'VAULT_MOUNT_POINT_FOR_DYNACONF': 'mount',
+    'VAULT_PATH_FOR_DYNACONF': 'path',
+}
+
+
+@pytest.fixture
+def vault_env(mocker, monkeypatch, tmp_path):
+    """A vault enabled .env in tmp_path and the vault CLI commands run recorded"""
+    env = ''.join(f'{name}={value}\n' for name, value in ENV.items())
+    tmp_path.joinpath('.env').write_text(f'{env}# VAULT_TOKEN_FOR_DYNACONF=myroot\n')
+    mocker.patch.object(vault, 'robottelo_root_dir', tmp_path)
+    monkeypatch.chdir(tmp_path)
+    # set as loaded from the .env, restored after the test
+    for name, value in {**ENV, 'VAULT_TOKEN_FOR_DYNACONF': 'expired'}.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.delenv('VAULT_SECRET_ID_FOR_DYNACONF', raising=False)
+    commands = []
+
+    def run(command, **kwargs):
+        commands.append(command)
+        stdout = b''
+        if command.endswith('--format json'):
+            stdout = json.dumps({'data': {'id': 'token', 'ttl': 3600}}).encode()
+        return subprocess.CompletedProcess(command, 0, stdout, b'')
+
+    mocker.patch('subprocess.run', run)
+    return commands
+
+
+def test_vault_token_cached(vault_env):
+    """The vault is logged in once per token lifetime, the token cached for the others"""
+    with Vault() as vclient:
+        assert vclient.login() == 'token'
+        assert vclient.token_cache_path.stat().st_mode & 0o077 == 0
+    assert len(vault_env) == 2
+    with Vault() as vclient:
+        assert vclient.login() == 'token'
+    assert len(vault_env) == 2
+    with Vault() as vclient:
+        cached = json.loads(vclient.token_cache_path.read_text())
+        cached['expires'] -= 3600
+        vclient.token_cache_path.write_text(json.dumps(cached))
+        assert vclient.login() == 'token'
+    assert len(vault_env) == 4
+
+
+def test_vault_settings_lazy(vault_env, mocker, tmp_path):
+    """The vault secrets are loaded on the first access of a missing key only"""
+    tmp_path.joinpath('settings.yaml').write_text(
+        "server:\n  hostname: sat.example.com\n  password: '@format {this.vault_password}'\n"
+    )
+    client = mocker.patch('dynaconf.loaders.vault_loader.Client')
+    client.return_value.secrets.kv.v2.read_secret_version.return_value = {
+        'data': {'data': {'vault_password': 'secret'}}
+    }
+    settings = LazySettings(
+        settings_file='settings.yaml',
+        core_loaders=['YAML'],
+        envless_mode=True,
+        lowercase_read=True,
+        load_dotenv=True,
+        _wrapper_class=VaultSettings,
+    )
+    assert settings.server.hostname == 'sat.example.com'
+    assert not client.called
+    assert not vault_env
+    assert settings.server.password == 'secret'
+    assert settings.server.password == 'secret'
+    assert client.call_count == 1
+    assert client.call_args.kwargs['token'] == 'token'
+    assert settings.get('missing') is None
+    assert client.call_count == 1
+
+
+def test_vault_settings_validation_deferred(vault_env, mocker, tmp_path):
+    """The settings referring to vault secrets are validated once the secrets are loaded,
+    the others at once"""
+    tmp_path.joinpath('settings.yaml').write_text(
+        "server:\n  hostname: sat.example.com\n"
+        "  port: '@format {this.server.hostname}'\n"
+        "jira:\n  api_key: '@format {this.vault_jira_key}'\n"
+    )
+    client = mocker.patch('dynaconf.loaders.vault_loader.Client')
+    client.return_value.secrets.kv.v2.read_secret_version.return_value = {
+        'data': {'data': {'vault_jira_key': ''}}
+    }
+    settings = LazySettings(
+        settings_file='settings.yaml',
+        core_loaders=['YAML'],
+        envless_mode=True,
+        lowercase_read=True,
+        load_dotenv=True,
+        _wrapper_class=VaultSettings,
+    )
+    settings.validators.register(
+        Validator('server.hostname', 'server.port', must_exist=True),
+        Validator('jira.api_key', must_exist=True, len_min=1),
+    )
+    validate_settings(settings)
+    assert not client.called
+    assert not vault_env
+    with pytest.raises(ValidationError, match='jira.api_key'):
+        settings.jira.api_key  # noqa: B018
+    assert client.call_count == 1
+
+
+def test_vault_settings_validation_deferred_validators(vault_env, mocker, tmp_path):
+    """The settings of the robottelo validators referring to vault secrets are deferred,
+    the ones of the combined validators included"""
+    from robottelo.config.validators import VALIDATORS
+
+    tmp_path.joinpath('settings.yaml').write_text(
+        "server:\n  hostname: sat.example.com\n"
+        "  ssh_password: '@format {this.vault_ssh_password}'\n"
+        "jira:\n  api_key: '@format {this.vault_jira_key}'\n"
+    )
+    settings = LazySettings(
+        settings_file='settings.yaml',
+        core_loaders=['YAML'],
+        envless_mode=True,
+        lowercase_read=True,
+        load_dotenv=True,
+        _wrapper_class=VaultSettings,
+    )
+    settings.validators.register(**VALIDATORS)
+    validate = mocker.patch.object(type(settings.validators), 'validate')
+    validate_settings(settings)
+    deferred = vars(settings._wrapped)['_vault_validations']
+    assert deferred == ['jira.api_key', 'server.ssh_password']
+    validate.assert_called_once_with(exclude=deferred)
+    assert not vault_env
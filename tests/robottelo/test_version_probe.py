@@ -0,0 +1,76 @@
+import threading
+import time
+
+import pytest
+
+from robottelo.utils.version_probe import VersionProbe
+
+VERSIONS = {'sat_version': '6.17.0', 'rhel_version': '9.5'}
+
+
+@pytest.fixture
+def probes(mocker, tmp_path):
+    """Version probes caching in tmp_path, probing the versions when released"""
+    released = threading.Event()
+    probed = []
+
+    def probe(self, name):
+        released.wait()
+        probed.append(name)
+        return VERSIONS[name]
+
+    mocker.patch.object(VersionProbe, '_probe', probe)
+
+    def make(offline=False, configured='6.17.0-1.0'):
+        version_probe = VersionProbe(
+            'sat.example.com', ttl=60, offline=offline, configured=configured
+        )
+        version_probe.cache_file = tmp_path / 'version_probe.json'
+        return version_probe
+
+    make.released = released
+    make.probed = probed
+    return make
+
+
+def test_version_probe_cached(probes):
+    """Probed versions are cached for the other probes of the host"""
+    probes.released.set()
+    assert probes().versions(timeout=5) == VERSIONS
+    assert sorted(probes.probed) == ['rhel_version', 'sat_version']
+    assert probes().versions(timeout=0) == VERSIONS
+    assert len(probes.probed) == 2
+
+
+def test_version_probe_upgraded(probes):
+    """The cached versions are probed again once the configured version changes"""
+    probes.released.set()
+    assert probes().versions(timeout=5) == VERSIONS
+    assert probes(configured='6.18.0-1.0').versions(timeout=5) == VERSIONS
+    assert len(probes.probed) == 4
+
+
+def test_version_probe_never_blocks_twice(probes):
+    """Probes are waited for once, at most the timeout, never when offline"""
+    assert probes(offline=True).versions() == {}
+    version_probe = probes()
+    version_probe.start()
+    assert version_probe.versions(timeout=0.1) == {}
+    start = time.monotonic()
+    assert version_probe.versions(timeout=5) == {}
+    assert time.monotonic() - start < 1
+    probes.released.set()
+    version_probe._futures['sat_version'].result()
+    version_probe._futures['rhel_version'].result()
+    assert version_probe.versions() == VERSIONS
+    assert probes().versions(timeout=0) == VERSIONS
+
+
+def test_version_probe_daemon_threads(probes):
+    """The probes run in daemon threads, an unreachable Satellite never delays the exit"""
+    running = set(threading.enumerate())
+    probes().start()
+    threads = [thread for thread in threading.enumerate() if thread not in running]
+    assert len(threads) == 2
+    assert all(thread.daemon for thread in threads)
+    probes.released.set()
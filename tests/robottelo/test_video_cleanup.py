@@ -0,0 +1,76 @@
+import threading
+from unittest import mock
+
+from broker.helpers import Result
+import pytest
+
+from pytest_plugins import video_cleanup
+from pytest_plugins.video_cleanup import VIDEOS_DIR, VideoCleanupWorker
+
+
+@pytest.fixture
+def grid_host():
+    """The grid host of the workers, its commands recorded"""
+    with mock.patch.object(video_cleanup, 'Host') as host_class:
+        host = host_class.return_value
+        host.commands = []
+        host.execute.side_effect = lambda command: (
+            host.commands.append(command) or Result(status=0, stdout='', stderr='')
+        )
+        yield host
+
+
+def test_video_cleanup_batches(grid_host):
+    """The queued sessions are deleted in batches, flushed on stop"""
+    worker = VideoCleanupWorker('grid.example.com', batch_size=2, interval=60)
+    for session_id in range(5):
+        worker.put(f'session{session_id}')
+    worker.stop(timeout=10)
+    assert grid_host.commands == [
+        f'rm -rf {VIDEOS_DIR}/session0 {VIDEOS_DIR}/session1',
+        f'rm -rf {VIDEOS_DIR}/session2 {VIDEOS_DIR}/session3',
+        f'rm -rf {VIDEOS_DIR}/session4',
+    ]
+    metrics = worker.metrics
+    assert (metrics.queued, metrics.cleaned, metrics.failed, metrics.batches) == (5, 5, 0, 3)
+    assert metrics.queue_depth == 0
+    grid_host.close.assert_called_once()
+
+
+def test_video_cleanup_interval(grid_host):
+    """A batch not full is deleted once the interval elapsed"""
+    cleaned = threading.Event()
+    grid_host.execute.side_effect = lambda command: (
+        cleaned.set() or Result(status=0, stdout='', stderr='')
+    )
+    worker = VideoCleanupWorker('grid.example.com', batch_size=20, interval=0.01)
+    worker.put('session0')
+    assert cleaned.wait(timeout=10)
+    worker.stop(timeout=10)
+    assert worker.metrics.batches == 1
+
+
+def test_video_cleanup_failure(grid_host):
+    """A failing batch is counted and the connection made again for the next one"""
+    grid_host.execute.side_effect = [
+        ConnectionError('connection lost'),
+        Result(status=0, stdout='', stderr=''),
+    ]
+    worker = VideoCleanupWorker('grid.example.com', batch_size=1, interval=60)
+    worker.put('session0')
+    worker.put('session1')
+    worker.stop(timeout=10)
+    assert (worker.metrics.cleaned, worker.metrics.failed) == (1, 1)
+    assert video_cleanup.Host.call_count == 2
+
+
+def test_video_cleanup_stop_timeout(grid_host):
+    """Stopping a stuck worker returns after the timeout, the connection left open"""
+    stuck = threading.Event()
+    grid_host.execute.side_effect = lambda command: stuck.wait(timeout=10)
+    worker = VideoCleanupWorker('grid.example.com', batch_size=1, interval=60)
+    worker.put('session0')
+    worker.stop(timeout=0.1)
+    assert worker._thread.is_alive()
+    grid_host.close.assert_not_called()
+    stuck.set()
@@ -0,0 +1,94 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+from urllib.parse import parse_qs, urlparse
+
+from box import Box
+import pytest
+
+from robottelo.utils.virtwho import hypervisor_json_create, iter_hypervisor_json
+from robottelo.utils.virtwho_load import run_hypervisor_load
+
+
+class FakeIngestHandler(BaseHTTPRequestHandler):
+    """Minimal hypervisors ingest endpoint and hosts API"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, code, body):
+        payload = json.dumps(body).encode()
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_chunked(self):
+        body = b''
+        while size := int(self.rfile.readline().strip(), 16):
+            body += self.rfile.read(size)
+            self.rfile.readline()
+        self.rfile.readline()
+        return body
+
+    def do_POST(self):
+        self.server.chunked.append(self.headers.get('Transfer-Encoding') == 'chunked')
+        report = json.loads(self._read_chunked())
+        org_label = self.path.split('/')[-1]
+        with self.server.lock:
+            self.server.reports[org_label] = report
+            self.server.hosts[org_label] = len(report['hypervisors'])
+        self._reply(200, {'created': len(report['hypervisors'])})
+
+    def do_GET(self):
+        search = parse_qs(urlparse(self.path).query)['search'][0]
+        org_id = search.split()[2]
+        self._reply(200, {'subtotal': self.server.hosts.get(f'org-{org_id}', 0)})
+
+
+@pytest.fixture
+def fake_ingest():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeIngestHandler)
+    server.reports = {}
+    server.hosts = {}
+    server.chunked = []
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_hypervisor_report_is_deterministic():
+    """The same seed generates the same report, streamed or not"""
+    report = hypervisor_json_create(hypervisors=5, guests=3, seed=7)
+    assert report == hypervisor_json_create(hypervisors=5, guests=3, seed=7)
+    assert report != hypervisor_json_create(hypervisors=5, guests=3, seed=8)
+    chunks = list(iter_hypervisor_json(hypervisors=5, guests=3, seed=7, batch=2))
+    assert len(chunks) == 4
+    assert json.loads(b''.join(chunks)) == report
+
+
+def test_run_hypervisor_load(fake_ingest):
+    """Reports are streamed for every organization and their hypervisors waited for"""
+    orgs = [Box(id=i, label=f'org-{i}') for i in range(4)]
+    results = run_hypervisor_load(
+        orgs,
+        hypervisors=20,
+        guests=5,
+        seed=1,
+        workers=2,
+        url=f'http://127.0.0.1:{fake_ingest.server_port}',
+        auth=('admin', 'changeme'),
+        poll_interval=0.1,
+    )
+    assert all(fake_ingest.chunked)
+    assert sorted(fake_ingest.reports) == [org.label for org in orgs]
+    assert fake_ingest.reports['org-0'] == hypervisor_json_create(20, 5, seed='1-org-0')
+    assert results.summary.failed == 0
+    assert results.summary.guests == 400
+    assert all(report.visible_after >= report.ingest_latency for report in results.reports)